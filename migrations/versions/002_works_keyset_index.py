@@ -0,0 +1,24 @@
+"""Index works for keyset pagination by type.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_works_type_created", "works", ["work_type", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_works_type_created", table_name="works")
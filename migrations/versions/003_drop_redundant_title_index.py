@@ -0,0 +1,26 @@
+"""Drop the single-column title_normalized index.
+
+ix_works_title_year leads with title_normalized and serves the same lookups.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_works_title_normalized", table_name="works")
+
+
+def downgrade() -> None:
+    op.create_index("ix_works_title_normalized", "works", ["title_normalized"])
@@ -0,0 +1,50 @@
+"""Create the partial identifier indexes on works.
+
+WorkModel declares one partial expression index per identifier, but 001 never
+created them, so databases built from migrations scanned works for every
+identifier lookup. The predicates match the repository's _has_identifier
+filter, which Postgres needs in order to pick a partial index. They are built
+from the same SQLAlchemy JSONB expression so the dialect renders them the way
+it renders the repository queries (subscript syntax on PostgreSQL 14+).
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IDENTIFIER_TYPES = (
+    "doi",
+    "isbn_13",
+    "isbn_10",
+    "arxiv_id",
+    "semantic_scholar_id",
+    "openlibrary_id",
+)
+
+
+def upgrade() -> None:
+    identifiers = sa.column("identifiers", postgresql.JSONB)
+    for identifier_type in IDENTIFIER_TYPES:
+        op.create_index(
+            f"ix_works_{identifier_type}",
+            "works",
+            [identifiers[identifier_type].astext],
+            postgresql_where=identifiers[identifier_type].isnot(None),
+        )
+
+
+def downgrade() -> None:
+    for identifier_type in reversed(IDENTIFIER_TYPES):
+        op.drop_index(f"ix_works_{identifier_type}", table_name="works")
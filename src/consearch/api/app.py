@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from consearch.api.routes import health_router, resolve_router, search_router
 from consearch.config import ConsearchSettings
@@ -26,10 +27,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Initialize database
     from consearch.db.base import create_engine, create_session_factory
+    from consearch.db.loaders import WorkLookupBatcher
 
     logger.info("Initializing database connection...")
     app.state.db_engine = create_engine(str(settings.database_url))
     app.state.db_session_factory = create_session_factory(app.state.db_engine)
+    app.state.work_lookup = WorkLookupBatcher(app.state.db_session_factory)
 
     # Initialize Redis cache (optional)
     if settings.redis_url:
@@ -51,6 +54,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         try:
             from consearch.search.client import AsyncMeilisearchClient
             from consearch.search.indexer import SearchIndexer
+            from consearch.search.searcher import Searcher
 
             logger.info("Initializing Meilisearch...")
             app.state.search_client = AsyncMeilisearchClient(
@@ -60,15 +64,21 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             # Setup indexes
             await app.state.search_client.setup_indexes()
             # Create indexer
-            app.state.search_indexer = SearchIndexer(app.state.search_client)
+            app.state.search_indexer = SearchIndexer(
+                app.state.search_client,
+                cache=app.state.cache_client,
+            )
+            app.state.searcher = Searcher(app.state.search_client)
             logger.info("Meilisearch initialized")
         except Exception as e:
             logger.warning(f"Failed to initialize Meilisearch: {e}")
             app.state.search_client = None
             app.state.search_indexer = None
+            app.state.searcher = None
     else:
         app.state.search_client = None
         app.state.search_indexer = None
+        app.state.searcher = None
 
     # Initialize resolver registry
     from consearch.resolution.registry import ResolverRegistry
@@ -143,6 +153,10 @@ def create_app(
         allow_headers=["*"],
     )
 
+    # Compress larger JSON bodies (resolve record lists); level 5 keeps most
+    # of the size reduction at a fraction of level 9's CPU cost
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Register routes
     app.include_router(health_router, prefix="/api/v1")
     app.include_router(resolve_router, prefix="/api/v1")
@@ -13,9 +13,11 @@ if TYPE_CHECKING:
 
     from consearch.cache.client import AsyncRedisClient
     from consearch.config import ConsearchSettings
+    from consearch.db.loaders import WorkLookupBatcher
     from consearch.resolution.registry import ResolverRegistry
     from consearch.search.client import AsyncMeilisearchClient
     from consearch.search.indexer import SearchIndexer
+    from consearch.search.searcher import Searcher
     from consearch.services.resolution import ResolutionService
     from consearch.services.search import SearchService
 
@@ -64,11 +66,17 @@ async def get_search_indexer(request: Request) -> SearchIndexer | None:
     return getattr(request.app.state, "search_indexer", None)
 
 
+async def get_work_lookup(request: Request) -> WorkLookupBatcher | None:
+    """Get the shared batched work lookup from app state."""
+    return getattr(request.app.state, "work_lookup", None)
+
+
 async def get_resolution_service(
     session: AsyncSession = Depends(get_db_session),
     registry: ResolverRegistry = Depends(get_resolver_registry),
     cache: AsyncRedisClient | None = Depends(get_cache_client),
     indexer: SearchIndexer | None = Depends(get_search_indexer),
+    work_lookup: WorkLookupBatcher | None = Depends(get_work_lookup),
 ) -> ResolutionService:
     """Get resolution service with all dependencies."""
     from consearch.services.resolution import ResolutionService
@@ -78,20 +86,27 @@ async def get_resolution_service(
         resolver_registry=registry,
         cache=cache,
         indexer=indexer,
+        work_lookup=work_lookup,
     )
 
 
+async def get_searcher(request: Request) -> Searcher | None:
+    """Get the shared searcher from app state."""
+    return getattr(request.app.state, "searcher", None)
+
+
 async def get_search_service(
     session: AsyncSession = Depends(get_db_session),
-    search_client: AsyncMeilisearchClient | None = Depends(get_search_client),
+    searcher: Searcher | None = Depends(get_searcher),
+    cache: AsyncRedisClient | None = Depends(get_cache_client),
 ) -> SearchService | None:
     """Get search service if Meilisearch is available."""
-    if search_client is None:
+    if searcher is None:
         return None
 
     from consearch.services.search import SearchService
 
-    return SearchService(session=session, search_client=search_client)
+    return SearchService(session=session, searcher=searcher, cache=cache)
 
 
 # Type aliases for cleaner dependency injection
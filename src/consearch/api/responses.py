@@ -0,0 +1,22 @@
+"""Response classes for API routes."""
+
+from __future__ import annotations
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class SchemaResponse(Response):
+    """
+    JSON response rendered directly from an API schema.
+
+    Returning a ``Response`` skips FastAPI's response-model round trip (dump to
+    dict, re-validate, encode); pydantic's compiled serializer writes the
+    camelCase JSON bytes in one pass. Routes keep ``response_model`` so the
+    OpenAPI schema is unchanged.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content, by_alias=True)
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from typing import Literal
 
 from fastapi import APIRouter, Request
+from fastapi.datastructures import State
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from consearch.api.schemas import HealthResponse
 
 router = APIRouter(tags=["health"])
 
+# How long a health result is reused; orchestrator probes every ~10s still
+# see fresh data, while bursts of probes cost one round of checks
+HEALTH_CACHE_TTL = 5.0
+
+ServiceStatus = Literal["up", "down", "unknown"]
+
 
 @router.get(
     "/health",
@@ -20,56 +31,84 @@ router = APIRouter(tags=["health"])
     description="Check the health status of the API and its dependencies.",
 )
 async def health_check(request: Request) -> HealthResponse:
-    """Check API health status."""
-    services: dict[str, Literal["up", "down", "unknown"]] = {}
-    overall_status: Literal["healthy", "degraded", "unhealthy"] = "healthy"
+    """
+    Check API health status.
 
-    # Check database
-    try:
-        db_factory = getattr(request.app.state, "db_session_factory", None)
-        if db_factory:
+    The result is reused for ``HEALTH_CACHE_TTL`` seconds, and concurrent
+    probes share a single round of checks.
+    """
+    state = request.app.state
+    cached = _cached_health(state)
+    if cached is not None:
+        return cached
+
+    lock = getattr(state, "health_lock", None)
+    if lock is None:
+        lock = state.health_lock = asyncio.Lock()
+
+    async with lock:
+        # Another probe may have refreshed the result while we waited
+        cached = _cached_health(state)
+        if cached is not None:
+            return cached
+
+        response = await _check_services(request)
+        state.health_cache = (time.monotonic() + HEALTH_CACHE_TTL, response)
+        return response
+
+
+def _cached_health(state: State) -> HealthResponse | None:
+    """Return the cached health result while it is still fresh."""
+    cached: tuple[float, HealthResponse] | None = getattr(state, "health_cache", None)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+async def _check_services(request: Request) -> HealthResponse:
+    """Check every backing service concurrently."""
+    state = request.app.state
+    db_factory: async_sessionmaker[AsyncSession] | None = getattr(state, "db_session_factory", None)
+    cache_client = getattr(state, "cache_client", None)
+    search_client = getattr(state, "search_client", None)
+
+    ping_database: Callable[[], Awaitable[None]] | None = None
+    if db_factory is not None:
+
+        async def ping_database() -> None:
             async with db_factory() as session:
                 await session.execute(text("SELECT 1"))
-            services["database"] = "up"
-        else:
-            services["database"] = "unknown"
-    except Exception:
-        services["database"] = "down"
-        overall_status = "unhealthy"
 
-    # Check Redis
-    try:
-        cache_client = getattr(request.app.state, "cache_client", None)
-        if cache_client:
-            await cache_client.ping()
-            services["redis"] = "up"
-        else:
-            services["redis"] = "unknown"
-    except Exception:
-        services["redis"] = "down"
-        if overall_status == "healthy":
-            overall_status = "degraded"
+    database, redis, meilisearch = await asyncio.gather(
+        _probe(ping_database),
+        _probe(cache_client.ping if cache_client else None),
+        _probe(search_client.health if search_client else None),
+    )
 
-    # Check Meilisearch
-    try:
-        search_client = getattr(request.app.state, "search_client", None)
-        if search_client:
-            await search_client.health()
-            services["meilisearch"] = "up"
-        else:
-            services["meilisearch"] = "unknown"
-    except Exception:
-        services["meilisearch"] = "down"
-        if overall_status == "healthy":
-            overall_status = "degraded"
+    overall_status: Literal["healthy", "degraded", "unhealthy"] = "healthy"
+    if database == "down":
+        overall_status = "unhealthy"
+    elif "down" in (redis, meilisearch):
+        overall_status = "degraded"
 
     return HealthResponse(
         status=overall_status,
         version="0.1.0",
-        services=services,
+        services={"database": database, "redis": redis, "meilisearch": meilisearch},
     )
 
 
+async def _probe(check: Callable[[], Awaitable[object]] | None) -> ServiceStatus:
+    """Run one service check; services that are not configured are "unknown"."""
+    if check is None:
+        return "unknown"
+    try:
+        await check()
+    except Exception:
+        return "down"
+    return "up"
+
+
 @router.get(
     "/ready",
     operation_id="getReady",
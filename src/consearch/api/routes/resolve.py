@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, HTTPException
 
 from consearch.api.dependencies import ResolveService, Settings
+from consearch.api.responses import SchemaResponse
 from consearch.api.schemas import (
     AuthorResponse,
     BookResponse,
@@ -29,12 +31,19 @@ if TYPE_CHECKING:
 
 router = APIRouter(prefix="/resolve", tags=["resolve"])
 
+# Responses below are built with ``model_construct``: records were validated
+# when the resolvers produced them, so validating them again in the
+# constructors would repeat that work. Handlers return ``SchemaResponse`` so
+# the constructed model is serialized straight to JSON bytes. Since nothing
+# coerces the values, every field must already have its declared type: lists
+# for sequence fields, and str for URL fields (the records hold HttpUrl).
+
 
 def _convert_book_to_response(record: BookRecord, include_raw: bool = False) -> BookResponse:
     """Convert domain BookRecord to API response."""
     source_meta = None
     if record.source_metadata:
-        source_meta = SourceMetadataResponse(
+        source_meta = SourceMetadataResponse.model_construct(
             source=record.source_metadata.source,
             source_id=record.source_metadata.source_id,
             retrieved_at=record.source_metadata.retrieved_at,
@@ -42,10 +51,10 @@ def _convert_book_to_response(record: BookRecord, include_raw: bool = False) ->
             raw_data=record.source_metadata.raw_data if include_raw else None,
         )
 
-    return BookResponse(
+    return BookResponse.model_construct(
         title=record.title,
         authors=[
-            AuthorResponse(
+            AuthorResponse.model_construct(
                 name=a.name,
                 given_name=a.given_name,
                 family_name=a.family_name,
@@ -55,7 +64,7 @@ def _convert_book_to_response(record: BookRecord, include_raw: bool = False) ->
             for a in record.authors
         ],
         year=record.year,
-        identifiers=IdentifiersResponse(
+        identifiers=IdentifiersResponse.model_construct(
             isbn_10=record.identifiers.isbn_10,
             isbn_13=record.identifiers.isbn_13,
             doi=record.identifiers.doi,
@@ -65,11 +74,11 @@ def _convert_book_to_response(record: BookRecord, include_raw: bool = False) ->
         publisher=record.publisher,
         pages=record.pages,
         subjects=record.subjects,
-        cover_image_url=record.cover_image_url,
+        cover_image_url=str(record.cover_image_url) if record.cover_image_url else None,
         abstract=record.abstract,
         edition=record.edition,
         language=record.language,
-        url=record.url,
+        url=str(record.url) if record.url else None,
         source_metadata=source_meta,
     )
 
@@ -78,7 +87,7 @@ def _convert_paper_to_response(record: PaperRecord, include_raw: bool = False) -
     """Convert domain PaperRecord to API response."""
     source_meta = None
     if record.source_metadata:
-        source_meta = SourceMetadataResponse(
+        source_meta = SourceMetadataResponse.model_construct(
             source=record.source_metadata.source,
             source_id=record.source_metadata.source_id,
             retrieved_at=record.source_metadata.retrieved_at,
@@ -86,10 +95,10 @@ def _convert_paper_to_response(record: PaperRecord, include_raw: bool = False) -
             raw_data=record.source_metadata.raw_data if include_raw else None,
         )
 
-    return PaperResponse(
+    return PaperResponse.model_construct(
         title=record.title,
         authors=[
-            AuthorResponse(
+            AuthorResponse.model_construct(
                 name=a.name,
                 given_name=a.given_name,
                 family_name=a.family_name,
@@ -100,7 +109,7 @@ def _convert_paper_to_response(record: PaperRecord, include_raw: bool = False) -
         ],
         year=record.year,
         publication_date=record.publication_date,
-        identifiers=IdentifiersResponse(
+        identifiers=IdentifiersResponse.model_construct(
             doi=record.identifiers.doi,
             arxiv_id=record.identifiers.arxiv_id,
             pmid=record.identifiers.pmid,
@@ -114,8 +123,8 @@ def _convert_paper_to_response(record: PaperRecord, include_raw: bool = False) -
         pages_range=record.pages_range,
         citation_count=record.citation_count,
         reference_count=record.reference_count,
-        url=record.url,
-        pdf_url=record.pdf_url,
+        url=str(record.url) if record.url else None,
+        pdf_url=str(record.pdf_url) if record.pdf_url else None,
         source_metadata=source_meta,
     )
 
@@ -131,7 +140,7 @@ async def resolve_book(
     request: ResolveBookRequest,
     resolution_service: ResolveService,
     _settings: Settings,
-) -> ResolveBookResponse:
+) -> SchemaResponse:
     """Resolve book metadata from external sources with caching and persistence."""
     start_time = time.monotonic()
 
@@ -156,14 +165,14 @@ async def resolve_book(
     total_duration = (time.monotonic() - start_time) * 1000
 
     # Build response
-    return ResolveBookResponse(
+    response = ResolveBookResponse.model_construct(
         detected_input_type=input_type,
         status=ResolutionStatus.SUCCESS if result.success else ResolutionStatus.NOT_FOUND,
         records=[
             _convert_book_to_response(r, request.include_raw_data) for r in result.all_records
         ],
         sources_tried=[
-            ResolutionSourceResult(
+            ResolutionSourceResult.model_construct(
                 source=res.source,
                 status=res.status,
                 duration_ms=res.duration_ms,
@@ -174,6 +183,7 @@ async def resolve_book(
         ],
         total_duration_ms=total_duration,
     )
+    return SchemaResponse(response)
 
 
 @router.post(
@@ -187,7 +197,7 @@ async def resolve_paper(
     request: ResolvePaperRequest,
     resolution_service: ResolveService,
     _settings: Settings,
-) -> ResolvePaperResponse:
+) -> SchemaResponse:
     """Resolve paper metadata from external sources with caching and persistence."""
     start_time = time.monotonic()
 
@@ -212,14 +222,14 @@ async def resolve_paper(
     total_duration = (time.monotonic() - start_time) * 1000
 
     # Build response
-    return ResolvePaperResponse(
+    response = ResolvePaperResponse.model_construct(
         detected_input_type=input_type,
         status=ResolutionStatus.SUCCESS if result.success else ResolutionStatus.NOT_FOUND,
         records=[
             _convert_paper_to_response(r, request.include_raw_data) for r in result.all_records
         ],
         sources_tried=[
-            ResolutionSourceResult(
+            ResolutionSourceResult.model_construct(
                 source=res.source,
                 status=res.status,
                 duration_ms=res.duration_ms,
@@ -230,6 +240,7 @@ async def resolve_paper(
         ],
         total_duration_ms=total_duration,
     )
+    return SchemaResponse(response)
 
 
 @router.post(
@@ -239,10 +250,15 @@ async def resolve_paper(
     summary="Detect input type",
     description="Detect the type of a query string (ISBN, DOI, title, etc.).",
 )
-async def detect_input_type(query: str) -> dict:
+async def detect_input_type(query: str) -> dict[str, Any]:
     """Detect the input type of a query string."""
-    detector = IdentifierDetector()
-    result = detector.detect(query)
+    return dict(_detect(query))
+
+
+@lru_cache(maxsize=4096)
+def _detect(query: str) -> dict[str, Any]:
+    """Detection is a pure function of the query, so memoize the payload."""
+    result = IdentifierDetector().detect(query)
 
     return {
         "detectedType": result.input_type.value,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from fastapi import APIRouter, HTTPException, Query
 
 from consearch.api.dependencies import SearchSvc
+from consearch.api.responses import SchemaResponse
 from consearch.api.schemas import (
     SearchBooksResponse,
     SearchPapersResponse,
@@ -29,7 +30,7 @@ async def search_books(
     year_max: int | None = Query(None, ge=1000, le=2100, alias="yearMax"),
     author: str | None = Query(None, max_length=200),
     language: str | None = Query(None, max_length=10),
-) -> SearchBooksResponse:
+) -> SchemaResponse:
     """Search for books using full-text search."""
     if search_service is None:
         raise HTTPException(
@@ -37,7 +38,7 @@ async def search_books(
             detail="Search service not available. Meilisearch may not be configured.",
         )
 
-    return await search_service.search_books(
+    results = await search_service.search_books(
         query,
         year_min=year_min,
         year_max=year_max,
@@ -46,6 +47,7 @@ async def search_books(
         page=page,
         page_size=page_size,
     )
+    return SchemaResponse(results)
 
 
 @router.get(
@@ -64,7 +66,7 @@ async def search_papers(
     year_max: int | None = Query(None, ge=1000, le=2100, alias="yearMax"),
     author: str | None = Query(None, max_length=200),
     journal: str | None = Query(None, max_length=300),
-) -> SearchPapersResponse:
+) -> SchemaResponse:
     """Search for papers using full-text search."""
     if search_service is None:
         raise HTTPException(
@@ -72,7 +74,7 @@ async def search_papers(
             detail="Search service not available. Meilisearch may not be configured.",
         )
 
-    return await search_service.search_papers(
+    results = await search_service.search_papers(
         query,
         year_min=year_min,
         year_max=year_max,
@@ -81,3 +83,4 @@ async def search_papers(
         page=page,
         page_size=page_size,
     )
+    return SchemaResponse(results)
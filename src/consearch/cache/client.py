@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import orjson
 import redis.asyncio as aioredis
 
+# Non-string dict keys are stringified, as the stdlib encoder did
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache value; unknown types fall back to ``str``."""
+    return orjson.dumps(value, default=str, option=_DUMPS_OPTIONS)
+
 
 class AsyncRedisClient:
     """Async Redis client wrapper with JSON serialization."""
@@ -48,8 +56,8 @@ class AsyncRedisClient:
         if value is None:
             return None
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
             return value
 
     async def set(
@@ -61,8 +69,7 @@ class AsyncRedisClient:
         """Set a value in cache with TTL."""
         if not self._redis:
             return
-        serialized = json.dumps(value, default=str)
-        await self._redis.set(key, serialized, ex=ttl)
+        await self._redis.set(key, _dumps(value), ex=ttl)
 
     async def delete(self, key: str) -> bool:
         """Delete a key from cache."""
@@ -71,6 +78,26 @@ class AsyncRedisClient:
         result = await self._redis.delete(key)
         return result > 0
 
+    async def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete every key starting with a prefix.
+
+        Uses SCAN rather than KEYS so Redis is never blocked, and UNLINK so
+        memory is reclaimed in the background.
+        """
+        if not self._redis:
+            return 0
+        deleted = 0
+        batch: list[str] = []
+        async for key in self._redis.scan_iter(match=f"{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                deleted += await self._redis.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted += await self._redis.unlink(*batch)
+        return deleted
+
     async def exists(self, key: str) -> bool:
         """Check if a key exists."""
         if not self._redis:
@@ -87,8 +114,7 @@ class AsyncRedisClient:
             return
         pipe = self._redis.pipeline()
         for key, value in mapping.items():
-            serialized = json.dumps(value, default=str)
-            pipe.set(key, serialized, ex=ttl)
+            pipe.set(key, _dumps(value), ex=ttl)
         await pipe.execute()
 
     async def get_many(self, keys: list[str]) -> dict[str, Any]:
@@ -100,8 +126,8 @@ class AsyncRedisClient:
         for key, value in zip(keys, values):
             if value is not None:
                 try:
-                    result[key] = json.loads(value)
-                except json.JSONDecodeError:
+                    result[key] = orjson.loads(value)
+                except orjson.JSONDecodeError:
                     result[key] = value
         return result
 
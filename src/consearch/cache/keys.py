@@ -18,7 +18,22 @@ class CacheKeys:
         identifier: str,
     ) -> str:
         """Key for resolved consumable by identifier."""
-        return f"{cls.PREFIX}:resolve:{consumable_type}:{identifier}"
+        prefix = _RESOLVE_PREFIXES.get(consumable_type) or (
+            f"{cls.PREFIX}:resolve:{consumable_type}:"
+        )
+        return prefix + identifier
+
+    @classmethod
+    def resolution_stale(
+        cls,
+        consumable_type: ConsumableType | str,
+        identifier: str,
+    ) -> str:
+        """Key for the long-lived copy of a resolution, served when sources fail."""
+        prefix = _STALE_PREFIXES.get(consumable_type) or (
+            f"{cls.PREFIX}:resolve-stale:{consumable_type}:"
+        )
+        return prefix + identifier
 
     @classmethod
     def search(
@@ -28,11 +43,18 @@ class CacheKeys:
         filters: dict[str, Any] | None = None,
     ) -> str:
         """Key for search results."""
-        # Hash the query and filters for consistent key length
+        # Hash the query and filters for consistent key length; a 6-byte
+        # BLAKE2b digest gives the 12 hex characters directly, without
+        # computing and truncating a longer digest
         filters_str = str(sorted(filters.items())) if filters else ""
         hash_input = f"{query}:{filters_str}"
-        hash_value = hashlib.md5(hash_input.encode()).hexdigest()[:12]
-        return f"{cls.PREFIX}:search:{consumable_type}:{hash_value}"
+        hash_value = hashlib.blake2b(hash_input.encode(), digest_size=6).hexdigest()
+        return f"{cls.search_prefix(consumable_type)}{hash_value}"
+
+    @classmethod
+    def search_prefix(cls, consumable_type: ConsumableType | str) -> str:
+        """Prefix shared by all search result keys of one type."""
+        return _SEARCH_PREFIXES.get(consumable_type) or f"{cls.PREFIX}:search:{consumable_type}:"
 
     @classmethod
     def source_record(
@@ -41,7 +63,8 @@ class CacheKeys:
         source_id: str,
     ) -> str:
         """Key for source record by source-specific ID."""
-        return f"{cls.PREFIX}:source:{source}:{source_id}"
+        prefix = _SOURCE_PREFIXES.get(source) or f"{cls.PREFIX}:source:{source}:"
+        return prefix + source_id
 
     @classmethod
     def work(cls, work_id: str) -> str:
@@ -52,3 +75,14 @@ class CacheKeys:
     def author(cls, author_id: str) -> str:
         """Key for author by internal ID."""
         return f"{cls.PREFIX}:author:{author_id}"
+
+
+# Key builders sit in front of every cache read and write, so the prefixes
+# for known types are formatted once. StrEnum members hash and compare like
+# their values, so both ``ConsumableType.BOOK`` and ``"book"`` hit the table.
+_RESOLVE_PREFIXES: dict[str, str] = {t: f"{CacheKeys.PREFIX}:resolve:{t}:" for t in ConsumableType}
+_STALE_PREFIXES: dict[str, str] = {
+    t: f"{CacheKeys.PREFIX}:resolve-stale:{t}:" for t in ConsumableType
+}
+_SEARCH_PREFIXES: dict[str, str] = {t: f"{CacheKeys.PREFIX}:search:{t}:" for t in ConsumableType}
+_SOURCE_PREFIXES: dict[str, str] = {s: f"{CacheKeys.PREFIX}:source:{s}:" for s in SourceName}
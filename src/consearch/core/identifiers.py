@@ -5,24 +5,29 @@ from __future__ import annotations
 import re
 from typing import ClassVar, Literal, Self
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from .normalization import _isbn10_weighted_sum, _isbn13_weighted_sum
 
 
 class ISBN(BaseModel):
     """Normalized ISBN representation supporting both ISBN-10 and ISBN-13."""
 
+    model_config = ConfigDict(frozen=True)
+
     value: str = Field(..., description="Normalized ISBN value (digits only, with X for ISBN-10)")
     format: Literal["isbn10", "isbn13"]
 
     # Regex patterns for validation
     ISBN10_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^[0-9]{9}[0-9X]$")
     ISBN13_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^(978|979)[0-9]{10}$")
+    SEPARATOR_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"[-\s]")
 
     @field_validator("value", mode="before")
     @classmethod
     def normalize_isbn(cls, v: str) -> str:
         """Remove hyphens and spaces, uppercase X."""
-        return re.sub(r"[-\s]", "", str(v)).upper()
+        return cls.SEPARATOR_PATTERN.sub("", str(v)).upper()
 
     @model_validator(mode="after")
     def validate_isbn_format(self) -> Self:
@@ -41,22 +46,19 @@ class ISBN(BaseModel):
 
     def _validate_isbn10_checksum(self) -> bool:
         """Validate ISBN-10 checksum using modulo 11."""
-        total = sum((10 if c == "X" else int(c)) * (10 - i) for i, c in enumerate(self.value))
-        return total % 11 == 0
+        check = 10 if self.value[-1] == "X" else int(self.value[-1])
+        return (_isbn10_weighted_sum(self.value[:-1]) + check) % 11 == 0
 
     def _validate_isbn13_checksum(self) -> bool:
         """Validate ISBN-13 checksum using alternating 1/3 weights."""
-        total = sum(int(c) * (1 if i % 2 == 0 else 3) for i, c in enumerate(self.value))
-        return total % 10 == 0
+        return _isbn13_weighted_sum(self.value) % 10 == 0
 
     def to_isbn13(self) -> ISBN:
         """Convert to ISBN-13 format."""
         if self.format == "isbn13":
             return self
         # Convert ISBN-10 to ISBN-13
-        base = "978" + self.value[:-1]
-        checksum = self._calculate_isbn13_checksum(base)
-        return ISBN(value=base + str(checksum), format="isbn13")
+        return ISBN(value=self._isbn13_value(), format="isbn13")
 
     def to_isbn10(self) -> ISBN | None:
         """Convert to ISBN-10 if possible (only 978 prefix)."""
@@ -68,21 +70,26 @@ class ISBN(BaseModel):
         checksum = self._calculate_isbn10_checksum(base)
         return ISBN(value=base + checksum, format="isbn10")
 
+    def _isbn13_value(self) -> str:
+        """Return the ISBN-13 digits without building another model."""
+        if self.format == "isbn13":
+            return self.value
+        base = "978" + self.value[:-1]
+        return base + str(self._calculate_isbn13_checksum(base))
+
     @staticmethod
     def _calculate_isbn13_checksum(base: str) -> int:
-        total = sum(int(c) * (1 if i % 2 == 0 else 3) for i, c in enumerate(base))
-        return (10 - (total % 10)) % 10
+        return (10 - (_isbn13_weighted_sum(base) % 10)) % 10
 
     @staticmethod
     def _calculate_isbn10_checksum(base: str) -> str:
-        total = sum(int(c) * (10 - i) for i, c in enumerate(base))
-        checksum = (11 - (total % 11)) % 11
+        checksum = (11 - (_isbn10_weighted_sum(base) % 11)) % 11
         return "X" if checksum == 10 else str(checksum)
 
     @classmethod
     def parse(cls, value: str) -> ISBN:
         """Parse an ISBN string, auto-detecting format."""
-        normalized = re.sub(r"[-\s]", "", value).upper()
+        normalized = cls.SEPARATOR_PATTERN.sub("", value).upper()
         if len(normalized) == 10:
             return cls(value=normalized, format="isbn10")
         elif len(normalized) == 13:
@@ -94,13 +101,14 @@ class ISBN(BaseModel):
 
     def __hash__(self) -> int:
         # Normalize to ISBN-13 for consistent hashing
-        isbn13 = self.to_isbn13()
-        return hash(isbn13.value)
+        return hash(self._isbn13_value())
 
 
 class DOI(BaseModel):
     """Digital Object Identifier value object."""
 
+    model_config = ConfigDict(frozen=True)
+
     value: str = Field(..., description="DOI value (e.g., 10.1000/xyz123)")
 
     DOI_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^10\.\d{4,}(?:\.\d+)*/[^\s]+$")
@@ -141,6 +149,8 @@ class DOI(BaseModel):
 class ArXivID(BaseModel):
     """arXiv identifier supporting old and new formats."""
 
+    model_config = ConfigDict(frozen=True)
+
     value: str = Field(..., description="Normalized arXiv ID")
     format: Literal["old", "new"]
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from typing import Any, Literal
 from uuid import UUID
 
@@ -31,7 +31,7 @@ class SourceMetadata(BaseModel):
     source: SourceName = Field(..., description="Data source name")
     source_id: str = Field(..., description="ID within the source system")
     retrieved_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When data was fetched"
+        default_factory=lambda: datetime.now(UTC), description="When data was fetched"
     )
     reliability_score: float = Field(
         default=1.0, ge=0.0, le=1.0, description="Source reliability (0-1)"
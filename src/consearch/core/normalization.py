@@ -2,6 +2,30 @@
 
 import re
 import unicodedata
+from itertools import accumulate
+
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+# The ASCII characters _NON_WORD_PATTERN removes (string.punctuation minus "_",
+# plus control characters), as a deletion table for already-ASCII text
+_ASCII_NON_WORD_DELETE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if _NON_WORD_PATTERN.match(c))
+)
+# normalize_text collapses whitespace, so each article is followed by one space
+_LEADING_ARTICLES = ("the ", "a ", "an ")
+_ISBN_SEPARATOR_PATTERN = re.compile(r"[-\s]")
+
+
+def _strip_accents(text: str) -> str:
+    """Decompose unicode characters and remove combining marks."""
+    nfkd = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in nfkd if not unicodedata.combining(c))
+
+
+# Latin-1 Supplement through Latin Extended-B covers the accented names and
+# titles we see in practice. Each entry is that character's own NFKD fold, so
+# translating first and running the NFKD pass only on whatever is still
+# non-ASCII gives the same result as the NFKD pass alone.
+_ACCENT_FOLD = str.maketrans({chr(cp): _strip_accents(chr(cp)) for cp in range(0x80, 0x250)})
 
 
 def normalize_text(
@@ -30,20 +54,25 @@ def normalize_text(
 
     result = text
 
-    if remove_accents:
-        # Decompose unicode characters and remove combining marks
-        nfkd = unicodedata.normalize("NFKD", result)
-        result = "".join(c for c in nfkd if not unicodedata.combining(c))
+    # ASCII has nothing to decompose, so skip the per-character pass
+    if remove_accents and not result.isascii():
+        result = result.translate(_ACCENT_FOLD)
+        if not result.isascii():
+            result = _strip_accents(result)
 
     if lowercase:
         result = result.lower()
 
     if remove_punctuation:
         # Keep alphanumeric and whitespace
-        result = re.sub(r"[^\w\s]", "", result)
+        if result.isascii():
+            result = result.translate(_ASCII_NON_WORD_DELETE)
+        else:
+            result = _NON_WORD_PATTERN.sub("", result)
 
     if collapse_whitespace:
-        result = re.sub(r"\s+", " ", result).strip()
+        # str.split() and the old r"\s+" pattern agree on what is whitespace
+        result = " ".join(result.split())
 
     return result
 
@@ -56,7 +85,8 @@ def normalize_title(title: str) -> str:
     """
     normalized = normalize_text(title)
     # Remove common leading articles
-    normalized = re.sub(r"^(the|a|an)\s+", "", normalized)
+    if normalized.startswith(_LEADING_ARTICLES):
+        normalized = normalized.split(" ", 1)[1]
     return normalized
 
 
@@ -79,20 +109,41 @@ def normalize_author_name(name: str) -> str:
     return normalize_text(name)
 
 
+# The weighted sums work on the ASCII codes so the per-digit work stays in C
+# builtins instead of one int() call per digit; the "0" offset (48) each
+# code carries is subtracted once at the end.
+def _isbn13_weighted_sum(digits: str) -> int:
+    """Sum ISBN-13 digits with alternating 1/3 weights, starting at 1."""
+    codes = digits.encode("ascii")
+    n_odd = len(codes) // 2
+    offset = 48 * (len(codes) - n_odd + 3 * n_odd)
+    return sum(codes[0::2]) + 3 * sum(codes[1::2]) - offset
+
+
+def _isbn10_weighted_sum(digits: str) -> int:
+    """Sum ISBN-10 digits (without check digit) weighted 10, 9, ... 2 from the left."""
+    codes = digits.encode("ascii")
+    n = len(codes)
+    # Summing the running totals weights digit i by n - i; adding the plain
+    # sum makes that n + 1 - i, i.e. 10 down to 2 for the nine base digits
+    return sum(accumulate(codes)) + sum(codes) - 48 * (n * (n + 1) // 2 + n)
+
+
 def isbn_10_to_13(isbn10: str) -> str:
     """Convert ISBN-10 to ISBN-13."""
     # Remove any hyphens/spaces
-    isbn10 = re.sub(r"[-\s]", "", isbn10).upper()
+    isbn10 = _ISBN_SEPARATOR_PATTERN.sub("", isbn10).upper()
 
     if len(isbn10) != 10:
         raise ValueError(f"Invalid ISBN-10 length: {isbn10}")
 
     # Remove check digit, add 978 prefix
     base = "978" + isbn10[:-1]
+    if not (base.isascii() and base.isdigit()):
+        raise ValueError(f"Invalid ISBN-10 digits: {isbn10}")
 
     # Calculate new check digit
-    total = sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(base))
-    check = (10 - (total % 10)) % 10
+    check = (10 - (_isbn13_weighted_sum(base) % 10)) % 10
 
     return base + str(check)
 
@@ -100,16 +151,17 @@ def isbn_10_to_13(isbn10: str) -> str:
 def isbn_13_to_10(isbn13: str) -> str | None:
     """Convert ISBN-13 to ISBN-10 (only works for 978 prefix)."""
     # Remove any hyphens/spaces
-    isbn13 = re.sub(r"[-\s]", "", isbn13)
+    isbn13 = _ISBN_SEPARATOR_PATTERN.sub("", isbn13)
 
     if len(isbn13) != 13 or not isbn13.startswith("978"):
         return None
 
     base = isbn13[3:-1]  # Remove 978 prefix and check digit
+    if not (base.isascii() and base.isdigit()):
+        raise ValueError(f"Invalid ISBN-13 digits: {isbn13}")
 
     # Calculate ISBN-10 check digit
-    total = sum(int(d) * (10 - i) for i, d in enumerate(base))
-    check = (11 - (total % 11)) % 11
+    check = (11 - (_isbn10_weighted_sum(base) % 11)) % 11
     check_char = "X" if check == 10 else str(check)
 
     return base + check_char
@@ -1,6 +1,14 @@
 """Database layer."""
 
-from .base import Base, TimestampMixin, UUIDPrimaryKeyMixin, create_engine, create_session_factory
+from .base import (
+    Base,
+    EntityMixin,
+    TimestampMixin,
+    UUIDPrimaryKeyMixin,
+    create_engine,
+    create_session_factory,
+)
+from .loaders import WorkLookupBatcher
 from .models import AuthorModel, SourceRecordModel, WorkModel
 from .repositories import AuthorRepository, BaseRepository, WorkRepository
 from .session import DatabaseManager
@@ -8,10 +16,13 @@ from .session import DatabaseManager
 __all__ = [
     # Base
     "Base",
+    "EntityMixin",
     "TimestampMixin",
     "UUIDPrimaryKeyMixin",
     "create_engine",
     "create_session_factory",
+    # Loaders
+    "WorkLookupBatcher",
     # Models
     "AuthorModel",
     "SourceRecordModel",
@@ -1,8 +1,10 @@
 """SQLAlchemy base configuration and mixins."""
 
+import os
+import time
 from datetime import datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import MetaData, func, text
 from sqlalchemy.dialects.postgresql import JSONB
@@ -36,13 +38,29 @@ class Base(AsyncAttrs, DeclarativeBase):
     }
 
 
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys land
+    at the right edge of the primary key B-tree instead of on random pages.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    rand_a = (rand >> 62) & 0xFFF
+    rand_b = rand & ((1 << 62) - 1)
+    return UUID(
+        int=(unix_ts_ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    )
+
+
 class UUIDPrimaryKeyMixin:
     """Mixin providing UUID primary key."""
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
 
@@ -63,6 +81,15 @@ class TimestampMixin:
     )
 
 
+class EntityMixin(UUIDPrimaryKeyMixin, TimestampMixin):
+    """
+    Mixin providing the UUID primary key and timestamp columns.
+
+    BaseRepository binds its model type to this mixin, so its keyset
+    pagination can rely on ``id`` and ``created_at``.
+    """
+
+
 def create_engine(database_url: str, echo: bool = False) -> AsyncEngine:
     """Create an async SQLAlchemy engine."""
     return create_async_engine(
@@ -71,6 +98,9 @@ def create_engine(database_url: str, echo: bool = False) -> AsyncEngine:
         pool_size=10,
         max_overflow=20,
         pool_pre_ping=True,
+        # Keep every repository statement prepared on each pooled connection
+        # (asyncpg defaults to 100, shared with ad-hoc queries)
+        connect_args={"prepared_statement_cache_size": 500},
     )
 
 
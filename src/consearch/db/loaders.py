@@ -0,0 +1,107 @@
+"""Batched identifier lookups shared across concurrent requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from consearch.db.repositories.work import WorkRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from consearch.db.models.work import WorkModel
+
+logger = logging.getLogger(__name__)
+
+
+class WorkLookupBatcher:
+    """
+    Coalesces concurrent work lookups by identifier into batched queries.
+
+    Lookups arriving within ``delay`` seconds of each other are collected and
+    answered with one ``WorkRepository.get_many_by_identifier`` query per
+    identifier type, on a dedicated session. Method names mirror the
+    identifier lookups of WorkRepository so either can serve a read-only
+    existence check.
+
+    Returned works are detached from any request session; only eagerly
+    loaded attributes should be relied upon.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        delay: float = 0.001,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            session_factory: Factory for the sessions batched queries run on
+            delay: How long to collect lookups before querying (seconds)
+        """
+        self._session_factory = session_factory
+        self._delay = delay
+        self._pending: dict[str, dict[str, list[asyncio.Future[WorkModel | None]]]] = {}
+        self._flush_scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def get_by_isbn(self, isbn: str) -> WorkModel | None:
+        """Find a work by ISBN (checks both ISBN-10 and ISBN-13)."""
+        identifier_type, value = WorkRepository.isbn_lookup_key(isbn)
+        return await self._load(identifier_type, value)
+
+    async def get_by_doi(self, doi: str) -> WorkModel | None:
+        """Find a work by DOI."""
+        return await self._load("doi", doi.lower())
+
+    async def get_by_arxiv_id(self, arxiv_id: str) -> WorkModel | None:
+        """Find a work by arXiv ID."""
+        return await self._load("arxiv_id", arxiv_id)
+
+    async def _load(self, identifier_type: str, value: str) -> WorkModel | None:
+        """Queue a lookup and wait for its batch to complete."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[WorkModel | None] = loop.create_future()
+        self._pending.setdefault(identifier_type, {}).setdefault(value, []).append(future)
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_later(self._delay, self._start_flush)
+
+        return await future
+
+    def _start_flush(self) -> None:
+        """Hand the collected lookups to a background flush task."""
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+
+        task = asyncio.create_task(self._flush(pending))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(
+        self,
+        pending: dict[str, dict[str, list[asyncio.Future[WorkModel | None]]]],
+    ) -> None:
+        """Run one query per identifier type and resolve the waiting lookups."""
+        try:
+            async with self._session_factory() as session:
+                repo = WorkRepository(session)
+                for identifier_type, waiters in pending.items():
+                    found = await repo.get_many_by_identifier(identifier_type, list(waiters))
+                    for value, futures in waiters.items():
+                        for future in futures:
+                            if not future.done():
+                                future.set_result(found.get(value))
+        except Exception as e:
+            logger.warning(f"Batched work lookup failed: {e}")
+            for waiters in pending.values():
+                for futures in waiters.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
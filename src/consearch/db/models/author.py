@@ -8,14 +8,14 @@ from sqlalchemy import Index, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from consearch.db.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
+from consearch.db.base import Base, EntityMixin
 from consearch.db.models.associations import work_author_association
 
 if TYPE_CHECKING:
     from consearch.db.models.work import WorkModel
 
 
-class AuthorModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
+class AuthorModel(Base, EntityMixin):
     """
     Deduplicated author entity.
 
@@ -24,6 +24,9 @@ class AuthorModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """
 
     __tablename__ = "authors"
+    # Fetch server-generated timestamps with INSERT ... RETURNING so a new
+    # author is usable right after flush without a refresh round trip
+    __mapper_args__ = {"eager_defaults": True}
 
     # Core fields
     name: Mapped[str] = mapped_column(String(500), nullable=False)
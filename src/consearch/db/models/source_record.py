@@ -21,13 +21,13 @@ from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from consearch.core.types import SourceName
-from consearch.db.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
+from consearch.db.base import Base, EntityMixin
 
 if TYPE_CHECKING:
     from consearch.db.models.work import WorkModel
 
 
-class SourceRecordModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
+class SourceRecordModel(Base, EntityMixin):
     """
     Raw data record from an external source.
 
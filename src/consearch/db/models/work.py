@@ -9,7 +9,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from consearch.core.types import ConsumableType
-from consearch.db.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
+from consearch.db.base import Base, EntityMixin
 from consearch.db.models.associations import work_author_association, work_relations
 
 if TYPE_CHECKING:
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from consearch.db.models.source_record import SourceRecordModel
 
 
-class WorkModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
+class WorkModel(Base, EntityMixin):
     """
     Canonical representation of a consumable work.
 
@@ -41,10 +41,10 @@ class WorkModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         index=True,
     )
     title: Mapped[str] = mapped_column(String(2000), nullable=False)
+    # Indexed through ix_works_title_year, whose leading column it is
     title_normalized: Mapped[str] = mapped_column(
         String(2000),
         nullable=False,
-        index=True,
         comment="Lowercased, punctuation-removed title for matching",
     )
     subtitle: Mapped[str | None] = mapped_column(String(1000), nullable=True)
@@ -139,6 +139,8 @@ class WorkModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
             identifiers["openlibrary_id"].astext,
             postgresql_where=identifiers["openlibrary_id"].isnot(None),
         ),
+        # Keyset pagination for listings by type
+        Index("ix_works_type_created", "work_type", "created_at", "id"),
         # Composite index for title + year searches
         Index("ix_works_title_year", "title_normalized", "year"),
         # Full-text search index (PostgreSQL specific) - requires pg_trgm
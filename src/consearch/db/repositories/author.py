@@ -1,8 +1,10 @@
 """Author repository with specialized queries."""
 
 from collections.abc import Sequence
+from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 
 from consearch.db.models.author import AuthorModel
 from consearch.db.repositories.base import BaseRepository
@@ -13,24 +15,58 @@ class AuthorRepository(BaseRepository[AuthorModel]):
 
     model = AuthorModel
 
+    # Author lookups never need the author's works; without this the
+    # selectin-loaded ``works`` collection (and each work's own eager
+    # relationships) would be fetched on every lookup. Touching a
+    # relationship on the result raises instead of issuing hidden queries.
+    _NO_RELATIONS = raiseload("*")
+
+    async def get(self, id: UUID) -> AuthorModel | None:
+        """Get a single author by ID without loading relationships."""
+        return await self._session.get(AuthorModel, id, options=[self._NO_RELATIONS])
+
     async def get_by_name_normalized(self, name_normalized: str) -> AuthorModel | None:
         """Find an author by normalized name."""
-        stmt = select(AuthorModel).where(AuthorModel.name_normalized == name_normalized)
+        stmt = (
+            select(AuthorModel)
+            .where(AuthorModel.name_normalized == name_normalized)
+            .options(self._NO_RELATIONS)
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_by_orcid(self, orcid: str) -> AuthorModel | None:
         """Find an author by ORCID."""
-        stmt = select(AuthorModel).where(AuthorModel.external_ids["orcid"].astext == orcid)
+        stmt = (
+            select(AuthorModel)
+            .where(AuthorModel.external_ids["orcid"].astext == orcid)
+            .options(self._NO_RELATIONS)
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def find_by_name(self, name: str, *, limit: int = 10) -> Sequence[AuthorModel]:
         """Find authors by name (case-insensitive partial match)."""
-        stmt = select(AuthorModel).where(AuthorModel.name.ilike(f"%{name}%")).limit(limit)
+        stmt = (
+            select(AuthorModel)
+            .where(AuthorModel.name.ilike(f"%{name}%"))
+            .options(self._NO_RELATIONS)
+            .limit(limit)
+        )
         result = await self._session.execute(stmt)
         return result.scalars().all()
 
+    async def bulk_create(self, authors: list[AuthorModel]) -> list[AuthorModel]:
+        """
+        Insert several authors in a single multi-row INSERT.
+
+        Unlike ``create_many`` the rows are not refreshed afterwards; the
+        generated timestamps come back through the INSERT's RETURNING clause.
+        """
+        self._session.add_all(authors)
+        await self._session.flush()
+        return authors
+
     async def get_or_create(
         self,
         name: str,
@@ -47,11 +83,13 @@ class AuthorRepository(BaseRepository[AuthorModel]):
         if existing:
             return existing, False
 
-        # Create new author
+        # Create new author; eager defaults make the flush a single
+        # INSERT ... RETURNING, so no refresh is needed
         author = AuthorModel(
             name=name,
             name_normalized=name_normalized,
             external_ids=external_ids or {},
         )
-        await self.create(author)
+        self._session.add(author)
+        await self._session.flush()
         return author, True
@@ -1,15 +1,16 @@
 """Base repository with generic CRUD operations."""
 
 from collections.abc import Sequence
+from datetime import datetime
 from typing import Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import Select, delete, exists, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from consearch.db.base import Base
+from consearch.db.base import EntityMixin
 
-T = TypeVar("T", bound=Base)
+T = TypeVar("T", bound=EntityMixin)
 
 
 class BaseRepository(Generic[T]):
@@ -25,24 +26,56 @@ class BaseRepository(Generic[T]):
         return await self._session.get(self.model, id)
 
     async def get_many(self, ids: list[UUID]) -> Sequence[T]:
-        """Get multiple entities by IDs."""
+        """
+        Get multiple entities by IDs in a single query.
+
+        Entities are returned in the order of ``ids``; IDs without a matching
+        entity are skipped.
+        """
         if not ids:
             return []
-        stmt = select(self.model).where(self.model.id.in_(ids))
+        stmt = select(self.model).where(self.model.id.in_(set(ids)))
         result = await self._session.execute(stmt)
-        return result.scalars().all()
+        by_id = {entity.id: entity for entity in result.scalars()}
+        return [by_id[id] for id in dict.fromkeys(ids) if id in by_id]
 
     async def list_all(
         self,
         *,
         offset: int = 0,
         limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
     ) -> Sequence[T]:
-        """List entities with pagination."""
-        stmt = select(self.model).offset(offset).limit(limit)
+        """
+        List entities with pagination, oldest first.
+
+        Pass the ``keyset_cursor`` of the last entity of a page as ``after``
+        to fetch the next page without the scan-and-discard cost of ``offset``.
+        """
+        stmt = self._paginate(select(self.model), offset=offset, limit=limit, after=after)
         result = await self._session.execute(stmt)
         return result.scalars().all()
 
+    @staticmethod
+    def keyset_cursor(entity: T) -> tuple[datetime, UUID]:
+        """Return the ``after`` value that continues a listing past ``entity``."""
+        return entity.created_at, entity.id
+
+    def _paginate(
+        self,
+        stmt: Select[T],
+        *,
+        offset: int,
+        limit: int,
+        after: tuple[datetime, UUID] | None,
+    ) -> Select[T]:
+        """Order a listing by (created_at, id) and apply keyset or offset pagination."""
+        key = (self.model.created_at, self.model.id)
+        stmt = stmt.order_by(*key).limit(limit)
+        if after is not None:
+            return stmt.where(tuple_(*key) > tuple_(*after))
+        return stmt.offset(offset)
+
     async def create(self, entity: T) -> T:
         """Create a new entity."""
         self._session.add(entity)
@@ -71,7 +104,6 @@ class BaseRepository(Generic[T]):
         return result.rowcount > 0
 
     async def exists(self, id: UUID) -> bool:
-        """Check if an entity exists."""
-        stmt = select(self.model.id).where(self.model.id == id)
-        result = await self._session.execute(stmt)
-        return result.scalar() is not None
+        """Check if an entity exists (a primary key probe; no row is loaded)."""
+        stmt = select(exists().where(self.model.id == id))
+        return bool(await self._session.scalar(stmt))
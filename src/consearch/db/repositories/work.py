@@ -1,8 +1,10 @@
 """Work repository with specialized queries."""
 
 from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, exists, select
 from sqlalchemy.orm import selectinload
 
 from consearch.core.types import ConsumableType
@@ -10,6 +12,16 @@ from consearch.db.models.work import WorkModel
 from consearch.db.repositories.base import BaseRepository
 
 
+def _has_identifier(identifier_type: str) -> ColumnElement[bool]:
+    """
+    Predicate of the partial ``ix_works_<identifier>`` indexes.
+
+    Postgres only considers a partial index when the query repeats its
+    WHERE clause, so identifier lookups include it alongside the match.
+    """
+    return WorkModel.identifiers[identifier_type].isnot(None)
+
+
 class WorkRepository(BaseRepository[WorkModel]):
     """Repository for Work entities with specialized queries."""
 
@@ -17,26 +29,35 @@ class WorkRepository(BaseRepository[WorkModel]):
 
     async def get_by_doi(self, doi: str) -> WorkModel | None:
         """Find a work by DOI."""
-        stmt = select(WorkModel).where(WorkModel.identifiers["doi"].astext == doi.lower())
+        stmt = select(WorkModel).where(
+            _has_identifier("doi"),
+            WorkModel.identifiers["doi"].astext == doi.lower(),
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_by_isbn(self, isbn: str) -> WorkModel | None:
         """Find a work by ISBN (checks both ISBN-10 and ISBN-13)."""
-        # Normalize ISBN
-        isbn = isbn.replace("-", "").replace(" ", "").upper()
-
-        if len(isbn) == 13:
-            stmt = select(WorkModel).where(WorkModel.identifiers["isbn_13"].astext == isbn)
-        else:
-            stmt = select(WorkModel).where(WorkModel.identifiers["isbn_10"].astext == isbn)
-
+        identifier_type, isbn = self.isbn_lookup_key(isbn)
+        stmt = select(WorkModel).where(
+            _has_identifier(identifier_type),
+            WorkModel.identifiers[identifier_type].astext == isbn,
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def isbn_lookup_key(isbn: str) -> tuple[str, str]:
+        """Return the identifier key and normalized value to look up an ISBN by."""
+        isbn = isbn.replace("-", "").replace(" ", "").upper()
+        return ("isbn_13" if len(isbn) == 13 else "isbn_10"), isbn
+
     async def get_by_arxiv_id(self, arxiv_id: str) -> WorkModel | None:
         """Find a work by arXiv ID."""
-        stmt = select(WorkModel).where(WorkModel.identifiers["arxiv_id"].astext == arxiv_id)
+        stmt = select(WorkModel).where(
+            _has_identifier("arxiv_id"),
+            WorkModel.identifiers["arxiv_id"].astext == arxiv_id,
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -45,11 +66,43 @@ class WorkRepository(BaseRepository[WorkModel]):
     ) -> WorkModel | None:
         """Find a work by any identifier type."""
         stmt = select(WorkModel).where(
-            WorkModel.identifiers[identifier_type].astext == identifier_value
+            _has_identifier(identifier_type),
+            WorkModel.identifiers[identifier_type].astext == identifier_value,
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def exists_by_identifier(self, identifier_type: str, identifier_value: str) -> bool:
+        """Check whether a work has an identifier, without loading the work."""
+        stmt = select(
+            exists().where(
+                _has_identifier(identifier_type),
+                WorkModel.identifiers[identifier_type].astext == identifier_value,
+            )
+        )
+        return bool(await self._session.scalar(stmt))
+
+    async def get_many_by_identifier(
+        self,
+        identifier_type: str,
+        values: Sequence[str],
+    ) -> dict[str, WorkModel]:
+        """
+        Find works for many values of one identifier type in a single query.
+
+        Returns a mapping of identifier value to work; values without a
+        matching work are omitted.
+        """
+        if not values:
+            return {}
+        identifier = WorkModel.identifiers[identifier_type].astext
+        stmt = select(WorkModel, identifier).where(
+            _has_identifier(identifier_type),
+            identifier.in_(values),
+        )
+        result = await self._session.execute(stmt)
+        return {value: work for work, value in result.all()}
+
     async def find_by_title(
         self,
         title: str,
@@ -57,8 +110,18 @@ class WorkRepository(BaseRepository[WorkModel]):
         work_type: ConsumableType | None = None,
         limit: int = 10,
     ) -> Sequence[WorkModel]:
-        """Find works by title (case-insensitive)."""
-        stmt = select(WorkModel).where(WorkModel.title.ilike(f"%{title}%")).limit(limit)
+        """
+        Find works by title substring (case-insensitive).
+
+        The ILIKE is served by the pg_trgm GIN index on ``title``. LIKE
+        wildcards in ``title`` are matched literally, and an empty title
+        applies no title filter.
+        """
+        stmt = select(WorkModel).limit(limit)
+
+        if title:
+            pattern = title.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            stmt = stmt.where(WorkModel.title.ilike(f"%{pattern}%", escape="\\"))
 
         if work_type:
             stmt = stmt.where(WorkModel.work_type == work_type)
@@ -86,13 +149,22 @@ class WorkRepository(BaseRepository[WorkModel]):
         return result.scalars().all()
 
     async def get_with_relations(self, id) -> WorkModel | None:
-        """Get a work with all its relationships loaded."""
+        """
+        Get a work with all its relationships loaded.
+
+        Each relationship is fetched with one IN query, so the statement count
+        does not depend on how many authors, records or related works exist.
+        The work relations are lazy by default and cannot be lazy-loaded on an
+        async session, so they are loaded here explicitly.
+        """
         stmt = (
             select(WorkModel)
             .where(WorkModel.id == id)
             .options(
                 selectinload(WorkModel.authors),
                 selectinload(WorkModel.source_records),
+                selectinload(WorkModel.related_to),
+                selectinload(WorkModel.related_from),
             )
         )
         result = await self._session.execute(stmt)
@@ -104,8 +176,18 @@ class WorkRepository(BaseRepository[WorkModel]):
         *,
         offset: int = 0,
         limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
     ) -> Sequence[WorkModel]:
-        """List works by type with pagination."""
-        stmt = select(WorkModel).where(WorkModel.work_type == work_type).offset(offset).limit(limit)
+        """
+        List works by type with pagination, oldest first.
+
+        Keyset pages (``after``) are served by ``ix_works_type_created``.
+        """
+        stmt = self._paginate(
+            select(WorkModel).where(WorkModel.work_type == work_type),
+            offset=offset,
+            limit=limit,
+            after=after,
+        )
         result = await self._session.execute(stmt)
         return result.scalars().all()
@@ -87,6 +87,21 @@ class IdentifierDetector:
         re.IGNORECASE,
     )
 
+    # Helpers used after a pattern above has matched
+    ISBN_PREFIX_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^ISBN(?:-?(?:10|13))?[:\s]*",
+        re.IGNORECASE,
+    )
+    ISBN_NON_DIGIT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"[^\dXx]")
+    ARXIV_URL_PATH_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"/(?:abs|pdf)/(.+?)(?:\.pdf)?$")
+    PMID_URL_PATH_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"/(\d{7,8})(?:/|$)")
+    CITATION_YEAR_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"[,\(]\s*(?:19|20)\d{2}\s*[\),]?"
+    )
+    AUTHOR_YEAR_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^[A-Z][a-z]+(?:\s+et\s+al\.?)?\s*,?\s*(?:19|20)\d{2}"
+    )
+
     # Citation indicators for heuristic detection
     CITATION_INDICATORS: ClassVar[list[str]] = [
         "et al",
@@ -219,9 +234,9 @@ class IdentifierDetector:
         """Attempt to parse as ISBN."""
         if self.ISBN_PATTERN.match(query):
             # Remove ISBN prefix before extracting digits (to avoid "13" from "ISBN-13")
-            isbn_part = re.sub(r"^ISBN(?:-?(?:10|13))?[:\s]*", "", query, flags=re.IGNORECASE)
+            isbn_part = self.ISBN_PREFIX_PATTERN.sub("", query)
             # Extract digits and X
-            normalized = re.sub(r"[^\dXx]", "", isbn_part).upper()
+            normalized = self.ISBN_NON_DIGIT_PATTERN.sub("", isbn_part).upper()
             try:
                 parsed = ISBN.parse(normalized)
                 input_type = InputType.ISBN_10 if parsed.format == "isbn10" else InputType.ISBN_13
@@ -280,7 +295,7 @@ class IdentifierDetector:
 
         # arxiv.org
         if "arxiv.org" in host:
-            arxiv_match = re.search(r"/(?:abs|pdf)/(.+?)(?:\.pdf)?$", path)
+            arxiv_match = self.ARXIV_URL_PATH_PATTERN.search(path)
             if arxiv_match:
                 try:
                     parsed = ArXivID.parse(arxiv_match.group(1))
@@ -295,7 +310,7 @@ class IdentifierDetector:
 
         # pubmed.gov / ncbi.nlm.nih.gov
         if "pubmed" in host or "ncbi.nlm.nih.gov" in host:
-            pmid_match = re.search(r"/(\d{7,8})(?:/|$)", path)
+            pmid_match = self.PMID_URL_PATH_PATTERN.search(path)
             if pmid_match:
                 return DetectionResult(
                     input_type=InputType.PMID,
@@ -320,7 +335,7 @@ class IdentifierDetector:
         )
 
         # Check for year patterns like (2024) or , 2024
-        has_year = bool(re.search(r"[,\(]\s*(?:19|20)\d{2}\s*[\),]?", query))
+        has_year = bool(self.CITATION_YEAR_PATTERN.search(query))
 
         # If multiple indicators or has year pattern and long enough, likely a citation
         if (indicator_count >= 2 or (indicator_count >= 1 and has_year)) and len(query) > 30:
@@ -331,7 +346,7 @@ class IdentifierDetector:
             )
 
         # Check for author-year pattern like "Smith et al. 2024" or "Vaswani 2017"
-        if re.search(r"^[A-Z][a-z]+(?:\s+et\s+al\.?)?\s*,?\s*(?:19|20)\d{2}", query):
+        if self.AUTHOR_YEAR_PATTERN.match(query):
             return DetectionResult(
                 input_type=InputType.CITATION,
                 confidence=0.65,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, ClassVar
 
 from consearch.core.identifiers import ISBN
@@ -13,6 +13,8 @@ from consearch.core.types import InputType, ResolutionStatus, SourceName
 from consearch.resolution.base import RateLimitConfig, ResolutionResult, ResolverConfig
 from consearch.resolution.books.base import AbstractBookResolver
 
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
 
 class GoogleBooksResolver(AbstractBookResolver):
     """
@@ -205,7 +207,7 @@ class GoogleBooksResolver(AbstractBookResolver):
         # Extract publication year
         year = None
         if published_date := volume_info.get("publishedDate"):
-            if match := re.search(r"\b(19|20)\d{2}\b", str(published_date)):
+            if match := _YEAR_PATTERN.search(str(published_date)):
                 year = int(match.group())
 
         # Parse identifiers from industryIdentifiers
@@ -249,7 +251,7 @@ class GoogleBooksResolver(AbstractBookResolver):
             source_metadata=SourceMetadata(
                 source=self.source_name,
                 source_id=data.get("id", ""),
-                retrieved_at=datetime.utcnow(),
+                retrieved_at=datetime.now(UTC),
                 reliability_score=self.reliability_score,
                 raw_data=data,
             ),
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, ClassVar
 
 from consearch.core.identifiers import ISBN
@@ -13,6 +13,8 @@ from consearch.core.types import InputType, ResolutionStatus, SourceName
 from consearch.resolution.base import RateLimitConfig, ResolutionResult, ResolverConfig
 from consearch.resolution.books.base import AbstractBookResolver
 
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
 
 class ISBNDbResolver(AbstractBookResolver):
     """
@@ -197,7 +199,7 @@ class ISBNDbResolver(AbstractBookResolver):
         year = None
         publish_date = data.get("publish_date") or data.get("date_published")
         if publish_date:
-            if match := re.search(r"\b(19|20)\d{2}\b", str(publish_date)):
+            if match := _YEAR_PATTERN.search(str(publish_date)):
                 year = int(match.group())
 
         # Build identifiers
@@ -235,7 +237,7 @@ class ISBNDbResolver(AbstractBookResolver):
             source_metadata=SourceMetadata(
                 source=self.source_name,
                 source_id=isbn13 or isbn10 or "",
-                retrieved_at=datetime.utcnow(),
+                retrieved_at=datetime.now(UTC),
                 reliability_score=self.reliability_score,
                 raw_data=data,
             ),
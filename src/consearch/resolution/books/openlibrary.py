@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import re
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, ClassVar
 
 from consearch.core.identifiers import ISBN
@@ -12,6 +13,8 @@ from consearch.core.types import InputType, ResolutionStatus, SourceName
 from consearch.resolution.base import RateLimitConfig, ResolutionResult, ResolverConfig
 from consearch.resolution.books.base import AbstractBookResolver
 
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
 
 class OpenLibraryResolver(AbstractBookResolver):
     """
@@ -222,9 +225,7 @@ class OpenLibraryResolver(AbstractBookResolver):
         year = None
         if publish_date := data.get("publish_date"):
             # Try to extract 4-digit year
-            import re
-
-            if match := re.search(r"\b(19|20)\d{2}\b", publish_date):
+            if match := _YEAR_PATTERN.search(publish_date):
                 year = int(match.group())
 
         # Build identifiers
@@ -261,7 +262,7 @@ class OpenLibraryResolver(AbstractBookResolver):
             source_metadata=SourceMetadata(
                 source=self.source_name,
                 source_id=data.get("key", ""),
-                retrieved_at=datetime.utcnow(),
+                retrieved_at=datetime.now(UTC),
                 reliability_score=self.reliability_score,
                 raw_data=data,
             ),
@@ -305,7 +306,7 @@ class OpenLibraryResolver(AbstractBookResolver):
             source_metadata=SourceMetadata(
                 source=self.source_name,
                 source_id=doc.get("key", ""),
-                retrieved_at=datetime.utcnow(),
+                retrieved_at=datetime.now(UTC),
                 reliability_score=self.reliability_score,
             ),
         )
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from consearch.core.models import BaseRecord
 from consearch.core.types import InputType, ResolutionStatus
@@ -26,7 +26,8 @@ class FallbackConfig:
     # Minimum reliability score to use a resolver
     min_reliability_score: float = 0.5
 
-    # Whether to run resolvers in parallel (when not stopping on first)
+    # Whether to run resolvers concurrently; with stop_on_first_success,
+    # lower-priority resolvers are cancelled once a higher one succeeds
     parallel_execution: bool = False
 
     # Timeout for the entire fallback chain (seconds)
@@ -37,8 +38,8 @@ class FallbackConfig:
 class AggregatedResult(Generic[RecordT]):
     """Result from fallback resolution with results from multiple sources."""
 
-    primary_result: ResolutionResult | None = None
-    fallback_results: list[ResolutionResult] = field(default_factory=list)
+    primary_result: ResolutionResult[RecordT] | None = None
+    fallback_results: list[ResolutionResult[RecordT]] = field(default_factory=list)
     all_records: list[RecordT] = field(default_factory=list)
     sources_tried: list[str] = field(default_factory=list)
 
@@ -50,7 +51,7 @@ class AggregatedResult(Generic[RecordT]):
         return any(r.success for r in self.fallback_results)
 
     @property
-    def best_result(self) -> ResolutionResult | None:
+    def best_result(self) -> ResolutionResult[RecordT] | None:
         """Return the best result (first successful)."""
         all_results = []
         if self.primary_result:
@@ -67,6 +68,46 @@ class AggregatedResult(Generic[RecordT]):
         # Return first successful (already sorted by priority)
         return successful[0]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible representation, e.g. for caching."""
+        return {
+            "primary_result": (
+                self.primary_result.model_dump(mode="json") if self.primary_result else None
+            ),
+            "fallback_results": [r.model_dump(mode="json") for r in self.fallback_results],
+            "all_records": [r.model_dump(mode="json") for r in self.all_records],
+            "sources_tried": list(self.sources_tried),
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        record_type: type[RecordT],
+    ) -> AggregatedResult[RecordT]:
+        """
+        Rebuild a result produced by to_dict.
+
+        Args:
+            data: Output of to_dict (e.g. loaded from cache)
+            record_type: Record model to validate records into
+
+        Returns:
+            The reconstructed aggregated result
+        """
+
+        def _load_result(raw: dict[str, Any]) -> ResolutionResult[RecordT]:
+            records = [record_type.model_validate(r) for r in raw.get("records", [])]
+            return ResolutionResult.model_validate({**raw, "records": records})
+
+        primary = data.get("primary_result")
+        return cls(
+            primary_result=_load_result(primary) if primary else None,
+            fallback_results=[_load_result(r) for r in data.get("fallback_results", [])],
+            all_records=[record_type.model_validate(r) for r in data.get("all_records", [])],
+            sources_tried=list(data.get("sources_tried", [])),
+        )
+
 
 class ChainResolver(Generic[RecordT]):
     """
@@ -105,8 +146,8 @@ class ChainResolver(Generic[RecordT]):
 
         try:
             async with asyncio.timeout(self.config.total_timeout):
-                if self.config.parallel_execution and not self.config.stop_on_first_success:
-                    # Run all resolvers in parallel
+                if self.config.parallel_execution:
+                    # Run resolvers concurrently
                     results = await self._run_parallel(active_resolvers, query, input_type)
                     if results:
                         result.primary_result = results[0]
@@ -148,7 +189,7 @@ class ChainResolver(Generic[RecordT]):
         resolver: AbstractResolver[RecordT],
         query: str,
         input_type: InputType,
-    ) -> ResolutionResult:
+    ) -> ResolutionResult[RecordT]:
         """Try a single resolver with error handling."""
         try:
             return await resolver.resolve(query, input_type)
@@ -165,7 +206,7 @@ class ChainResolver(Generic[RecordT]):
         resolvers: list[AbstractResolver[RecordT]],
         query: str,
         input_type: InputType,
-    ) -> list[ResolutionResult]:
+    ) -> list[ResolutionResult[RecordT]]:
         """Run resolvers sequentially, stopping on first success if configured."""
         results = []
 
@@ -183,10 +224,31 @@ class ChainResolver(Generic[RecordT]):
         resolvers: list[AbstractResolver[RecordT]],
         query: str,
         input_type: InputType,
-    ) -> list[ResolutionResult]:
-        """Run all resolvers in parallel."""
-        tasks = [self._try_resolver(resolver, query, input_type) for resolver in resolvers]
-        return await asyncio.gather(*tasks)
+    ) -> list[ResolutionResult[RecordT]]:
+        """
+        Run resolvers concurrently, collecting results in priority order.
+
+        With stop_on_first_success, results stop at the first success and any
+        lower-priority resolvers still running are cancelled. Total latency is
+        the slowest resolver needed rather than the sum of all of them.
+        """
+        results: list[ResolutionResult[RecordT]] = []
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._try_resolver(resolver, query, input_type))
+                for resolver in resolvers
+            ]
+            for i, task in enumerate(tasks):
+                result = await task
+                results.append(result)
+
+                if self.config.stop_on_first_success and result.success:
+                    for pending in tasks[i + 1 :]:
+                        pending.cancel()
+                    break
+
+        return results
 
     def _aggregate_records(
         self,
@@ -11,6 +11,8 @@ from consearch.core.models import PaperRecord
 from consearch.core.types import InputType, ResolutionStatus
 from consearch.resolution.base import AbstractResolver, ResolutionResult
 
+_CITATION_DOI_PATTERN = re.compile(r"10\.\d{4,}/[^\s]+")
+
 
 class AbstractPaperResolver(AbstractResolver[PaperRecord]):
     """
@@ -86,7 +88,7 @@ class AbstractPaperResolver(AbstractResolver[PaperRecord]):
         Override for sources with citation parsing APIs.
         """
         # Try to extract DOI from citation
-        doi_match = re.search(r"10\.\d{4,}/[^\s]+", citation)
+        doi_match = _CITATION_DOI_PATTERN.search(citation)
         if doi_match:
             doi = self.parse_doi(doi_match.group())
             if doi:
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import re
 import time
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from typing import Any, ClassVar
 
 from consearch.core.identifiers import DOI
@@ -12,6 +13,8 @@ from consearch.core.types import InputType, ResolutionStatus, SourceName
 from consearch.resolution.base import RateLimitConfig, ResolutionResult, ResolverConfig
 from consearch.resolution.papers.base import AbstractPaperResolver
 
+_JATS_TAG_PATTERN = re.compile(r"<[^>]+>")
+
 
 class CrossrefResolver(AbstractPaperResolver):
     """
@@ -217,9 +220,7 @@ class CrossrefResolver(AbstractPaperResolver):
         # Extract and clean abstract (strip JATS XML tags)
         abstract = data.get("abstract")
         if abstract:
-            import re
-
-            abstract = re.sub(r"<[^>]+>", "", abstract)
+            abstract = _JATS_TAG_PATTERN.sub("", abstract)
 
         # Extract citation count and reference count
         citation_count = data.get("is-referenced-by-count")
@@ -242,7 +243,7 @@ class CrossrefResolver(AbstractPaperResolver):
             source_metadata=SourceMetadata(
                 source=self.source_name,
                 source_id=data.get("DOI", ""),
-                retrieved_at=datetime.utcnow(),
+                retrieved_at=datetime.now(UTC),
                 reliability_score=self.reliability_score,
                 raw_data=data,
             ),
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from typing import Any, ClassVar
 
 from consearch.core.identifiers import DOI, ArXivID
@@ -283,7 +283,7 @@ class SemanticScholarResolver(AbstractPaperResolver):
             source_metadata=SourceMetadata(
                 source=self.source_name,
                 source_id=data.get("paperId", ""),
-                retrieved_at=datetime.utcnow(),
+                retrieved_at=datetime.now(UTC),
                 reliability_score=self.reliability_score,
                 raw_data=data,
             ),
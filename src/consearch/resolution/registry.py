@@ -44,8 +44,16 @@ class ResolverRegistry:
         self,
         config: FallbackConfig | None = None,
     ) -> ChainResolver[PaperRecord]:
-        """Get a chain resolver for papers."""
-        return ChainResolver(self._paper_resolvers, config)
+        """
+        Get a chain resolver for papers.
+
+        Paper sources are queried concurrently by default, keeping the
+        first success in priority order.
+        """
+        return ChainResolver(
+            self._paper_resolvers,
+            config or FallbackConfig(parallel_execution=True),
+        )
 
     def get_chain(
         self,
@@ -6,16 +6,24 @@ import logging
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from consearch.cache.keys import CacheKeys
 from consearch.core.types import ConsumableType
 from consearch.search.client import BOOKS_INDEX, PAPERS_INDEX, AsyncMeilisearchClient
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from consearch.cache.client import AsyncRedisClient
     from consearch.db.models.work import WorkModel
+    from consearch.db.repositories.work import WorkRepository
 
 logger = logging.getLogger(__name__)
 
+# Works loaded (and sent to Meilisearch) per batch when reindexing
+REINDEX_PAGE_SIZE = 1000
+
 
 class SearchIndexer:
     """
@@ -24,14 +32,20 @@ class SearchIndexer:
     Converts database models to search documents and manages index operations.
     """
 
-    def __init__(self, client: AsyncMeilisearchClient) -> None:
+    def __init__(
+        self,
+        client: AsyncMeilisearchClient,
+        cache: AsyncRedisClient | None = None,
+    ) -> None:
         """
         Initialize the indexer.
 
         Args:
             client: Meilisearch client for index operations
+            cache: Optional Redis cache whose search results are invalidated on reindex
         """
         self._client = client
+        self._cache = cache
 
     async def index_work(self, work: WorkModel) -> None:
         """
@@ -111,29 +125,55 @@ class SearchIndexer:
         await self._client.delete_all_documents(BOOKS_INDEX)
         await self._client.delete_all_documents(PAPERS_INDEX)
 
-        # Reindex books
+        # Reindex books, one keyset page at a time
         logger.info("Reindexing books...")
-        books = await repo.list_by_type(ConsumableType.BOOK, limit=10000)
-        if books:
-            await self.index_books_batch(books)
+        books = 0
+        async for page in self._pages(repo, ConsumableType.BOOK):
+            await self.index_books_batch(page)
+            books += len(page)
 
         # Reindex papers
         logger.info("Reindexing papers...")
-        papers = await repo.list_by_type(ConsumableType.PAPER, limit=10000)
-        if papers:
-            await self.index_papers_batch(papers)
-
-        logger.info(f"Reindexing complete: {len(books)} books, {len(papers)} papers")
+        papers = 0
+        async for page in self._pages(repo, ConsumableType.PAPER):
+            await self.index_papers_batch(page)
+            papers += len(page)
+
+        # Cached search pages may reference works that no longer exist
+        if self._cache:
+            for consumable_type in (ConsumableType.BOOK, ConsumableType.PAPER):
+                await self._cache.delete_prefix(CacheKeys.search_prefix(consumable_type))
+
+        logger.info(f"Reindexing complete: {books} books, {papers} papers")
+
+    @staticmethod
+    async def _pages(
+        repo: WorkRepository,
+        work_type: ConsumableType,
+        page_size: int = REINDEX_PAGE_SIZE,
+    ) -> AsyncIterator[Sequence[WorkModel]]:
+        """Yield every work of a type in keyset-paginated pages."""
+        after = None
+        while page := await repo.list_by_type(work_type, limit=page_size, after=after):
+            yield page
+            if len(page) < page_size:
+                return
+            after = repo.keyset_cursor(page[-1])
 
     def _work_to_book_document(self, work: WorkModel) -> dict[str, Any]:
-        """Convert a book work to a Meilisearch document."""
+        """
+        Convert a book work to a Meilisearch document.
+
+        UUID and datetime values are left as-is; the client's orjson handler
+        serializes them directly.
+        """
         # Extract author names from relationships
         authors = [author.name for author in work.authors] if work.authors else []
 
         identifiers = work.identifiers or {}
 
         return {
-            "id": str(work.id),
+            "id": work.id,
             "title": work.title,
             "title_normalized": work.title_normalized,
             "authors": authors,
@@ -145,7 +185,7 @@ class SearchIndexer:
                 "isbn_10": identifiers.get("isbn_10"),
                 "isbn_13": identifiers.get("isbn_13"),
             },
-            "created_at": work.created_at.isoformat() if work.created_at else None,
+            "created_at": work.created_at,
         }
 
     def _work_to_paper_document(self, work: WorkModel) -> dict[str, Any]:
@@ -156,7 +196,7 @@ class SearchIndexer:
         identifiers = work.identifiers or {}
 
         return {
-            "id": str(work.id),
+            "id": work.id,
             "title": work.title,
             "title_normalized": work.title_normalized,
             "authors": authors,
@@ -168,5 +208,5 @@ class SearchIndexer:
                 "doi": identifiers.get("doi"),
                 "arxiv_id": identifiers.get("arxiv_id"),
             },
-            "created_at": work.created_at.isoformat() if work.created_at else None,
+            "created_at": work.created_at,
         }
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -14,10 +17,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on hits returned per page
+MAX_PAGE_SIZE = 100
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SearchFilters:
-    """Filters for search queries."""
+    """Filters for search queries.
+
+    Frozen so that identical filter combinations hash equal and can share
+    a cached filter expression.
+    """
 
     year_min: int | None = None
     year_max: int | None = None
@@ -26,16 +36,16 @@ class SearchFilters:
     journal: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchHit:
     """A single search result hit."""
 
     id: UUID
     score: float
-    data: dict[str, Any]
+    data: Mapping[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResponse:
     """Response from a search query."""
 
@@ -45,11 +55,7 @@ class SearchResponse:
     processing_time_ms: int
     page: int
     page_size: int
-
-    @property
-    def has_more(self) -> bool:
-        """Whether there are more results available."""
-        return self.page * self.page_size < self.total
+    has_more: bool
 
 
 class Searcher:
@@ -96,7 +102,8 @@ class Searcher:
             query,
             filter=filter_expr,
             offset=offset,
-            limit=page_size,
+            # One extra hit tells us whether a next page exists
+            limit=page_size + 1,
             sort=["year:desc"] if not query else None,  # Sort by year if no query
         )
 
@@ -130,7 +137,8 @@ class Searcher:
             query,
             filter=filter_expr,
             offset=offset,
-            limit=page_size,
+            # One extra hit tells us whether a next page exists
+            limit=page_size + 1,
             sort=["citation_count:desc", "year:desc"] if not query else None,
         )
 
@@ -145,25 +153,8 @@ class Searcher:
         if not filters:
             return None
 
-        expressions = []
-
-        # Year range filters
-        if filters.year_min is not None:
-            expressions.append(f"year >= {filters.year_min}")
-        if filters.year_max is not None:
-            expressions.append(f"year <= {filters.year_max}")
-
-        # Language filter (books only)
-        if filters.language and index_type == "book":
-            expressions.append(f'language = "{filters.language}"')
-
-        # Journal filter (papers only)
-        if filters.journal and index_type == "paper":
-            # Escape quotes in journal name
-            escaped_journal = filters.journal.replace('"', '\\"')
-            expressions.append(f'journal = "{escaped_journal}"')
-
-        return expressions if expressions else None
+        expressions = _filter_expressions(filters, index_type)
+        return list(expressions) if expressions else None
 
     def _parse_results(
         self,
@@ -172,9 +163,14 @@ class Searcher:
         page: int,
         page_size: int,
     ) -> SearchResponse:
-        """Parse Meilisearch results into SearchResponse."""
+        """
+        Parse Meilisearch results into SearchResponse.
+
+        Results are fetched with ``limit=page_size + 1``; the extra hit only
+        signals ``has_more`` and is dropped from the page.
+        """
         hits = []
-        for hit in results.hits:
+        for hit in results.hits[:page_size]:
             try:
                 hit_id = UUID(hit["id"])
                 # Meilisearch provides _rankingScore when available
@@ -183,7 +179,8 @@ class Searcher:
                     SearchHit(
                         id=hit_id,
                         score=score,
-                        data=dict(hit),
+                        # Read-only view over the hit; avoids a copy per result
+                        data=MappingProxyType(hit) if isinstance(hit, dict) else dict(hit),
                     )
                 )
             except (KeyError, ValueError) as e:
@@ -197,4 +194,37 @@ class Searcher:
             processing_time_ms=results.processing_time_ms,
             page=page,
             page_size=page_size,
+            has_more=len(results.hits) > page_size,
         )
+
+
+@lru_cache(maxsize=1024)
+def _filter_expressions(filters: SearchFilters, index_type: str) -> tuple[str, ...]:
+    """
+    Build the canonical filter expressions for a filter combination.
+
+    A closed year range is emitted as a single ``year X TO Y`` expression so
+    equivalent queries produce identical filter strings. Results are cached
+    per (filters, index_type).
+    """
+    expressions = []
+
+    # Year range filters
+    if filters.year_min is not None and filters.year_max is not None:
+        expressions.append(f"year {filters.year_min} TO {filters.year_max}")
+    elif filters.year_min is not None:
+        expressions.append(f"year >= {filters.year_min}")
+    elif filters.year_max is not None:
+        expressions.append(f"year <= {filters.year_max}")
+
+    # Language filter (books only)
+    if filters.language and index_type == "book":
+        expressions.append(f'language = "{filters.language}"')
+
+    # Journal filter (papers only)
+    if filters.journal and index_type == "paper":
+        # Escape quotes in journal name
+        escaped_journal = filters.journal.replace('"', '\\"')
+        expressions.append(f'journal = "{escaped_journal}"')
+
+    return tuple(expressions)
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
-from consearch.core.models import BookRecord, PaperRecord
+from consearch.cache.keys import CacheKeys
+from consearch.core.models import BaseRecord, BookRecord, PaperRecord
 from consearch.core.normalization import normalize_title
-from consearch.core.types import ConsumableType, InputType
+from consearch.core.types import ConsumableType, InputType, ResolutionStatus
+from consearch.db.models.work import WorkModel
+from consearch.db.repositories.work import WorkRepository
 from consearch.detection.identifier import IdentifierDetector
 from consearch.resolution.chain import AggregatedResult
 
@@ -17,12 +21,37 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from consearch.cache.client import AsyncRedisClient
-    from consearch.db.models.work import WorkModel
+    from consearch.db.loaders import WorkLookupBatcher
     from consearch.resolution.registry import ResolverRegistry
     from consearch.search.indexer import SearchIndexer
 
 logger = logging.getLogger(__name__)
 
+RecordT = TypeVar("RecordT", bound=BaseRecord)
+
+# Input types that can be answered from the database by an identifier
+# lookup. Title/citation queries would need fuzzy matching and are always
+# resolved externally.
+_BOOK_DB_LOOKUP = frozenset({InputType.ISBN_10, InputType.ISBN_13})
+_PAPER_DB_LOOKUP = frozenset({InputType.DOI, InputType.ARXIV})
+
+# The lookup for each of those input types, run against the shared
+# WorkLookupBatcher or a per-request WorkRepository
+_DB_LOOKUPS: dict[
+    InputType,
+    Callable[[WorkLookupBatcher | WorkRepository, str], Awaitable[WorkModel | None]],
+] = {
+    InputType.ISBN_10: lambda source, query: source.get_by_isbn(query),
+    InputType.ISBN_13: lambda source, query: source.get_by_isbn(query),
+    InputType.DOI: lambda source, query: source.get_by_doi(query),
+    InputType.ARXIV: lambda source, query: source.get_by_arxiv_id(query),
+}
+
+# Resolver outcomes that mean a source was unreachable, not that it had no match
+_UPSTREAM_FAILURES = frozenset(
+    {ResolutionStatus.ERROR, ResolutionStatus.TIMEOUT, ResolutionStatus.RATE_LIMITED}
+)
+
 
 class ResolutionService:
     """
@@ -35,9 +64,13 @@ class ResolutionService:
     4. Persist new records to database
     5. Index to search engine
     6. Cache results
+
+    When every source fails, the last successful result is served from a
+    longer-lived stale copy instead.
     """
 
     CACHE_TTL = 3600 * 24  # 24 hours
+    STALE_TTL = 3600 * 24 * 7  # 7 days
 
     def __init__(
         self,
@@ -45,6 +78,7 @@ class ResolutionService:
         resolver_registry: ResolverRegistry,
         cache: AsyncRedisClient | None = None,
         indexer: SearchIndexer | None = None,
+        work_lookup: WorkLookupBatcher | None = None,
     ) -> None:
         """
         Initialize the resolution service.
@@ -54,11 +88,13 @@ class ResolutionService:
             resolver_registry: Registry of resolvers
             cache: Optional Redis client for caching
             indexer: Optional search indexer for Meilisearch
+            work_lookup: Optional shared batcher for existing-work checks
         """
         self._session = session
         self._registry = resolver_registry
         self._cache = cache
         self._indexer = indexer
+        self._work_lookup = work_lookup
         self._detector = IdentifierDetector()
 
     async def resolve_book(
@@ -83,14 +119,17 @@ class ResolutionService:
             detection = self._detector.detect(query)
             input_type = detection.input_type
 
-        # Try cache first
-        cache_key = f"resolve:book:{input_type.value}:{query}"
+        # Try cache first; InputType is a StrEnum, so it formats as its value
+        cache_id = f"{input_type}:{query}"
+        cache_key = CacheKeys.resolution(ConsumableType.BOOK, cache_id)
         if self._cache:
             cached = await self._cache.get(cache_key)
             if cached:
                 logger.debug(f"Cache hit for book resolution: {query}")
-                # TODO: Deserialize cached result
-                pass
+                try:
+                    return AggregatedResult.from_dict(cached, BookRecord)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable cached book result: {e}")
 
         # Try database for identifier lookups
         existing_work = await self._check_db_for_book(query, input_type)
@@ -109,6 +148,14 @@ class ResolutionService:
         chain = self._registry.get_book_chain()
         result = await chain.resolve(query, input_type)
 
+        # Serve the last good result if every source failed
+        stale_key = CacheKeys.resolution_stale(ConsumableType.BOOK, cache_id)
+        if not result.success and _upstream_failed(result):
+            stale = await self._get_stale(stale_key, BookRecord)
+            if stale is not None:
+                logger.warning(f"Serving stale book resolution after upstream failure: {query}")
+                return stale
+
         # Persist new records
         if result.success and result.all_records:
             for record in result.all_records:
@@ -116,8 +163,9 @@ class ResolutionService:
 
         # Cache result
         if self._cache and result.success:
-            # TODO: Serialize and cache result
-            pass
+            data = result.to_dict()
+            await self._cache.set(cache_key, data, ttl=self.CACHE_TTL)
+            await self._cache.set(stale_key, data, ttl=self.STALE_TTL)
 
         duration = time.monotonic() - start
         logger.info(f"Book resolution completed in {duration:.2f}s: {query}")
@@ -146,14 +194,17 @@ class ResolutionService:
             detection = self._detector.detect(query)
             input_type = detection.input_type
 
-        # Try cache first
-        cache_key = f"resolve:paper:{input_type.value}:{query}"
+        # Try cache first; InputType is a StrEnum, so it formats as its value
+        cache_id = f"{input_type}:{query}"
+        cache_key = CacheKeys.resolution(ConsumableType.PAPER, cache_id)
         if self._cache:
             cached = await self._cache.get(cache_key)
             if cached:
                 logger.debug(f"Cache hit for paper resolution: {query}")
-                # TODO: Deserialize cached result
-                pass
+                try:
+                    return AggregatedResult.from_dict(cached, PaperRecord)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable cached paper result: {e}")
 
         # Try database for identifier lookups
         existing_work = await self._check_db_for_paper(query, input_type)
@@ -171,6 +222,14 @@ class ResolutionService:
         chain = self._registry.get_paper_chain()
         result = await chain.resolve(query, input_type)
 
+        # Serve the last good result if every source failed
+        stale_key = CacheKeys.resolution_stale(ConsumableType.PAPER, cache_id)
+        if not result.success and _upstream_failed(result):
+            stale = await self._get_stale(stale_key, PaperRecord)
+            if stale is not None:
+                logger.warning(f"Serving stale paper resolution after upstream failure: {query}")
+                return stale
+
         # Persist new records
         if result.success and result.all_records:
             for record in result.all_records:
@@ -178,29 +237,41 @@ class ResolutionService:
 
         # Cache result
         if self._cache and result.success:
-            # TODO: Serialize and cache result
-            pass
+            data = result.to_dict()
+            await self._cache.set(cache_key, data, ttl=self.CACHE_TTL)
+            await self._cache.set(stale_key, data, ttl=self.STALE_TTL)
 
         duration = time.monotonic() - start
         logger.info(f"Paper resolution completed in {duration:.2f}s: {query}")
 
         return result
 
+    async def _get_stale(
+        self,
+        stale_key: str,
+        record_type: type[RecordT],
+    ) -> AggregatedResult[RecordT] | None:
+        """Load the stale copy of a resolution, if one is cached."""
+        if not self._cache:
+            return None
+        cached = await self._cache.get(stale_key)
+        if not cached:
+            return None
+        try:
+            return AggregatedResult.from_dict(cached, record_type)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable stale resolution: {e}")
+            return None
+
     async def _check_db_for_book(
         self,
         query: str,
         input_type: InputType,
     ) -> WorkModel | None:
         """Check database for existing book by identifier."""
-        from consearch.db.repositories.work import WorkRepository
-
-        repo = WorkRepository(self._session)
-
-        if input_type in (InputType.ISBN_10, InputType.ISBN_13):
-            return await repo.get_by_isbn(query)
-
-        # For title searches, we don't check DB (would need fuzzy match)
-        return None
+        if input_type not in _BOOK_DB_LOOKUP:
+            return None
+        return await self._check_db(query, input_type)
 
     async def _check_db_for_paper(
         self,
@@ -208,38 +279,30 @@ class ResolutionService:
         input_type: InputType,
     ) -> WorkModel | None:
         """Check database for existing paper by identifier."""
-        from consearch.db.repositories.work import WorkRepository
-
-        repo = WorkRepository(self._session)
-
-        if input_type == InputType.DOI:
-            return await repo.get_by_doi(query)
-        elif input_type == InputType.ARXIV:
-            return await repo.get_by_arxiv_id(query)
-
-        # For title/citation searches, we don't check DB
-        return None
+        if input_type not in _PAPER_DB_LOOKUP:
+            return None
+        return await self._check_db(query, input_type)
+
+    async def _check_db(self, query: str, input_type: InputType) -> WorkModel | None:
+        """Run the identifier lookup for an input type."""
+        # Coalesce with concurrent requests when a shared batcher is available
+        source: WorkLookupBatcher | WorkRepository
+        if self._work_lookup is not None:
+            source = self._work_lookup
+        else:
+            source = WorkRepository(self._session)
+        return await _DB_LOOKUPS[input_type](source, query)
 
     async def _persist_book_record(self, record: BookRecord) -> WorkModel | None:
-        """Persist a book record to the database."""
-        from consearch.db.models.source_record import SourceRecordModel
-        from consearch.db.models.work import WorkModel
-        from consearch.db.repositories.author import AuthorRepository
-        from consearch.db.repositories.work import WorkRepository
+        """Persist a book record to the database; returns None if it already exists."""
 
         work_repo = WorkRepository(self._session)
-        author_repo = AuthorRepository(self._session)
-
-        # Check if work already exists by identifiers
-        existing = None
-        if record.identifiers.isbn_13:
-            existing = await work_repo.get_by_isbn(record.identifiers.isbn_13)
-        elif record.identifiers.isbn_10:
-            existing = await work_repo.get_by_isbn(record.identifiers.isbn_10)
 
-        if existing:
+        # Check if work already exists by identifiers (no need to load it)
+        isbn = record.identifiers.isbn_13 or record.identifiers.isbn_10
+        if isbn and await work_repo.exists_by_identifier(*work_repo.isbn_lookup_key(isbn)):
             logger.debug(f"Book already exists: {record.title}")
-            return existing
+            return None
 
         # Build identifiers dict
         identifiers = {
@@ -263,53 +326,7 @@ class ResolutionService:
             identifiers=identifiers,
         )
 
-        self._session.add(work)
-        await self._session.flush()  # Flush work first to get its ID
-
-        # Create/link authors with positions
-        from sqlalchemy import insert
-
-        from consearch.db.models.associations import work_author_association
-
-        for i, author_record in enumerate(record.authors):
-            author, _ = await author_repo.get_or_create(
-                name=author_record.name,
-                name_normalized=normalize_title(author_record.name),  # Normalize for matching
-                external_ids={"orcid": author_record.orcid} if author_record.orcid else None,
-            )
-            # Insert into association table with explicit position
-            stmt = insert(work_author_association).values(
-                work_id=work.id,
-                author_id=author.id,
-                position=i,
-            )
-            await self._session.execute(stmt)
-
-        # Create source record if we have metadata and it doesn't exist
-        if record.source_metadata:
-            from sqlalchemy import select
-
-            # Check if source record already exists
-            existing_source = await self._session.execute(
-                select(SourceRecordModel).where(
-                    SourceRecordModel.source == record.source_metadata.source,
-                    SourceRecordModel.source_id == record.source_metadata.source_id,
-                )
-            )
-            if not existing_source.scalar_one_or_none():
-                source_record = SourceRecordModel(
-                    work=work,
-                    source=record.source_metadata.source,
-                    source_id=record.source_metadata.source_id,
-                    raw_data=record.source_metadata.raw_data or {},
-                    fetched_at=datetime.now(UTC),
-                )
-                self._session.add(source_record)
-
-        await self._session.flush()
-
-        # Refresh work to load authors relationship for indexer
-        await self._session.refresh(work, ["authors"])
+        await self._add_work(work, record)
 
         # Index to search
         if self._indexer:
@@ -319,29 +336,25 @@ class ResolutionService:
         return work
 
     async def _persist_paper_record(self, record: PaperRecord) -> WorkModel | None:
-        """Persist a paper record to the database."""
-        from consearch.db.models.source_record import SourceRecordModel
-        from consearch.db.models.work import WorkModel
-        from consearch.db.repositories.author import AuthorRepository
-        from consearch.db.repositories.work import WorkRepository
+        """Persist a paper record to the database; returns None if it already exists."""
 
         work_repo = WorkRepository(self._session)
-        author_repo = AuthorRepository(self._session)
 
-        # Check if work already exists by identifiers
-        existing = None
+        # Check if work already exists by identifiers (no need to load it)
+        existing = False
         if record.identifiers.doi:
-            existing = await work_repo.get_by_doi(record.identifiers.doi)
+            existing = await work_repo.exists_by_identifier("doi", record.identifiers.doi.lower())
         elif record.identifiers.arxiv_id:
-            existing = await work_repo.get_by_arxiv_id(record.identifiers.arxiv_id)
+            existing = await work_repo.exists_by_identifier("arxiv_id", record.identifiers.arxiv_id)
 
         if existing:
             logger.debug(f"Paper already exists: {record.title}")
-            return existing
+            return None
 
         # Build identifiers dict
         identifiers = {
-            "doi": record.identifiers.doi,
+            # Stored lowercased so get_by_doi can match exactly on ix_works_doi
+            "doi": record.identifiers.doi.lower() if record.identifiers.doi else None,
             "arxiv_id": record.identifiers.arxiv_id,
             "pmid": record.identifiers.pmid,
             "crossref_id": record.identifiers.crossref_id,
@@ -365,40 +378,46 @@ class ResolutionService:
             identifiers=identifiers,
         )
 
-        self._session.add(work)
-        await self._session.flush()  # Flush work first to get its ID
+        await self._add_work(work, record)
 
-        # Create/link authors with positions
-        from sqlalchemy import insert
+        # Index to search
+        if self._indexer:
+            await self._indexer.index_paper(work)
+
+        logger.info(f"Persisted paper: {record.title}")
+        return work
+
+    async def _add_work(self, work: WorkModel, record: BookRecord | PaperRecord) -> None:
+        """
+        Add a new work with its source record and ordered author links.
+
+        The work and source record go out with the first flush: the one
+        before the links, or an earlier one when ``get_or_create`` inserts a
+        new author (or autoflushes before its lookup, on sessions with
+        autoflush enabled). All author links then go out as one executemany.
+        The work's authors are loaded afterwards for the indexer.
+        """
+        from sqlalchemy import exists, insert, select
 
         from consearch.db.models.associations import work_author_association
+        from consearch.db.models.source_record import SourceRecordModel
+        from consearch.db.repositories.author import AuthorRepository
 
-        for i, author_record in enumerate(record.authors):
-            author, _ = await author_repo.get_or_create(
-                name=author_record.name,
-                name_normalized=normalize_title(author_record.name),
-                external_ids={"orcid": author_record.orcid} if author_record.orcid else None,
-            )
-            # Insert into association table with explicit position
-            stmt = insert(work_author_association).values(
-                work_id=work.id,
-                author_id=author.id,
-                position=i,
-            )
-            await self._session.execute(stmt)
+        author_repo = AuthorRepository(self._session)
+        self._session.add(work)
 
         # Create source record if we have metadata and it doesn't exist
         if record.source_metadata:
-            from sqlalchemy import select
-
-            # Check if source record already exists
-            existing_source = await self._session.execute(
-                select(SourceRecordModel).where(
-                    SourceRecordModel.source == record.source_metadata.source,
-                    SourceRecordModel.source_id == record.source_metadata.source_id,
+            # Probe for the row rather than loading it and its raw payload
+            source_exists = await self._session.scalar(
+                select(
+                    exists().where(
+                        SourceRecordModel.source == record.source_metadata.source,
+                        SourceRecordModel.source_id == record.source_metadata.source_id,
+                    )
                 )
             )
-            if not existing_source.scalar_one_or_none():
+            if not source_exists:
                 source_record = SourceRecordModel(
                     work=work,
                     source=record.source_metadata.source,
@@ -408,18 +427,32 @@ class ResolutionService:
                 )
                 self._session.add(source_record)
 
+        # Get or create authors, preserving their order
+        author_ids = []
+        for author_record in record.authors:
+            author, _ = await author_repo.get_or_create(
+                name=author_record.name,
+                name_normalized=normalize_title(author_record.name),  # Normalize for matching
+                external_ids={"orcid": author_record.orcid} if author_record.orcid else None,
+            )
+            author_ids.append(author.id)
+
+        # Write the work (and source record) so the association rows can reference it
         await self._session.flush()
 
+        # Insert all author links with explicit positions in one round trip
+        if author_ids:
+            await self._session.execute(
+                insert(work_author_association),
+                [
+                    {"work_id": work.id, "author_id": author_id, "position": i}
+                    for i, author_id in enumerate(author_ids)
+                ],
+            )
+
         # Refresh work to load authors relationship for indexer
         await self._session.refresh(work, ["authors"])
 
-        # Index to search
-        if self._indexer:
-            await self._indexer.index_paper(work)
-
-        logger.info(f"Persisted paper: {record.title}")
-        return work
-
     def _work_to_book_record(self, work: WorkModel) -> BookRecord | None:
         """Convert a WorkModel to BookRecord."""
         from consearch.core.models import Author, Identifiers
@@ -483,3 +516,9 @@ class ResolutionService:
             pages_range=idents.get("pages"),
             citation_count=idents.get("citation_count"),
         )
+
+
+def _upstream_failed(result: AggregatedResult[RecordT]) -> bool:
+    """Whether every source tried failed to answer (as opposed to finding nothing)."""
+    results = ([result.primary_result] if result.primary_result else []) + result.fallback_results
+    return bool(results) and all(r.status in _UPSTREAM_FAILURES for r in results)
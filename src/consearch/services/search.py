@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from dataclasses import asdict
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import raiseload, selectinload
 
 from consearch.api.schemas import (
     AuthorResponse,
@@ -15,37 +24,74 @@ from consearch.api.schemas import (
     SearchPaperResult,
     SearchPapersResponse,
 )
-from consearch.search.searcher import Searcher, SearchFilters
+from consearch.cache.keys import CacheKeys
+from consearch.core.types import ConsumableType
+from consearch.db.models.work import WorkModel
+from consearch.search.searcher import MAX_PAGE_SIZE, Searcher, SearchFilters
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
-    from consearch.search.client import AsyncMeilisearchClient
+    from consearch.cache.client import AsyncRedisClient
 
 logger = logging.getLogger(__name__)
 
+# Shared instance for the common unfiltered search
+_EMPTY_FILTERS = SearchFilters()
+
+_author_name = attrgetter("name")
+
+
+@lru_cache(maxsize=4096)
+def _author_response(name: str) -> AuthorResponse:
+    """Return a shared AuthorResponse for a name; popular authors repeat across hits."""
+    return AuthorResponse.model_construct(name=name)
+
+
+@lru_cache(maxsize=4096)
+def _identifiers_response(
+    isbn_10: str | None = None,
+    isbn_13: str | None = None,
+    doi: str | None = None,
+    arxiv_id: str | None = None,
+) -> IdentifiersResponse:
+    """Return a shared IdentifiersResponse for an identifier combination."""
+    return IdentifiersResponse.model_construct(
+        isbn_10=isbn_10, isbn_13=isbn_13, doi=doi, arxiv_id=arxiv_id
+    )
+
 
 class SearchService:
     """
     Service for searching works with database hydration.
 
     Wraps Meilisearch searches and hydrates results with full data from DB.
+    Response objects are built with ``model_construct``: hydrated works and
+    indexed documents were validated on the way in, so re-validating every
+    hit is skipped.
     """
 
+    # Short TTL: identical searches (pagination, typing debounce) are served
+    # from cache, and newly indexed works show up within a minute
+    CACHE_TTL = 60
+
     def __init__(
         self,
         session: AsyncSession,
-        search_client: AsyncMeilisearchClient,
+        searcher: Searcher,
+        cache: AsyncRedisClient | None = None,
     ) -> None:
         """
         Initialize the search service.
 
         Args:
             session: Database session for hydration
-            search_client: Meilisearch client for searches
+            searcher: Shared Meilisearch searcher
+            cache: Optional Redis cache for search responses
         """
         self._session = session
-        self._searcher = Searcher(search_client)
+        self._searcher = searcher
+        self._cache = cache
 
     async def search_books(
         self,
@@ -68,39 +114,65 @@ class SearchService:
             author: Filter by author name
             language: Filter by language code
             page: Page number (1-indexed)
-            page_size: Results per page
+            page_size: Results per page (capped at ``MAX_PAGE_SIZE``)
 
         Returns:
             Paginated search results with book data
         """
-        filters = SearchFilters(
-            year_min=year_min,
-            year_max=year_max,
-            author=author,
-            language=language,
-        )
+        page_size = min(page_size, MAX_PAGE_SIZE)
+        if year_min is None and year_max is None and author is None and language is None:
+            filters = _EMPTY_FILTERS
+        else:
+            filters = SearchFilters(
+                year_min=year_min,
+                year_max=year_max,
+                author=author,
+                language=language,
+            )
 
-        search_result = await self._searcher.search_books(
-            query,
-            filters=filters,
-            page=page,
-            page_size=page_size,
+        cache_key = self._cache_key(ConsumableType.BOOK, query, filters, page, page_size)
+        if self._cache:
+            cached = await self._cache.get(cache_key)
+            if cached:
+                logger.debug(f"Cache hit for book search: {query}")
+                try:
+                    return SearchBooksResponse.model_validate(cached)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable cached book search: {e}")
+
+        # Check out the hydration connection (pool pre-ping included) while
+        # Meilisearch is searching, so hydration starts with a warm connection
+        search_result, _ = await asyncio.gather(
+            self._searcher.search_books(
+                query,
+                filters=filters,
+                page=page,
+                page_size=page_size,
+            ),
+            self._session.connection(),
         )
 
-        # Convert search hits to response objects
+        # Hydrate the whole page in one query, falling back to the indexed
+        # document for hits that are not (or no longer) in the database
+        works_by_id = await self._hydrate_works([hit.id for hit in search_result.hits])
+
         results = []
         for hit in search_result.hits:
-            book_response = self._hit_to_book_response(hit.data)
-            if book_response:
-                results.append(
-                    SearchBookResult(
-                        id=hit.id,
-                        score=hit.score,
-                        book=book_response,
-                    )
-                )
-
-        return SearchBooksResponse(
+            work = works_by_id.get(hit.id)
+            try:
+                if work is not None:
+                    book_response = self._work_to_book_response(work)
+                elif "title" in hit.data:
+                    book_response = self._hit_to_book_response(hit.data)
+                else:
+                    continue
+            except Exception as e:
+                # Skip only the malformed hit; the rest of the page is still served
+                logger.warning("Failed to convert book hit %s: %s", hit.id, e)
+                continue
+            results.append(SearchBookResult(id=hit.id, score=hit.score, book=book_response))
+
+        response = SearchBooksResponse(
             total=search_result.total,
             page=page,
             page_size=page_size,
@@ -108,6 +180,11 @@ class SearchService:
             results=results,
         )
 
+        if self._cache:
+            await self._cache.set(cache_key, response.model_dump(mode="json"), ttl=self.CACHE_TTL)
+
+        return response
+
     async def search_papers(
         self,
         query: str,
@@ -129,39 +206,65 @@ class SearchService:
             author: Filter by author name
             journal: Filter by journal name
             page: Page number (1-indexed)
-            page_size: Results per page
+            page_size: Results per page (capped at ``MAX_PAGE_SIZE``)
 
         Returns:
             Paginated search results with paper data
         """
-        filters = SearchFilters(
-            year_min=year_min,
-            year_max=year_max,
-            author=author,
-            journal=journal,
-        )
+        page_size = min(page_size, MAX_PAGE_SIZE)
+        if year_min is None and year_max is None and author is None and journal is None:
+            filters = _EMPTY_FILTERS
+        else:
+            filters = SearchFilters(
+                year_min=year_min,
+                year_max=year_max,
+                author=author,
+                journal=journal,
+            )
 
-        search_result = await self._searcher.search_papers(
-            query,
-            filters=filters,
-            page=page,
-            page_size=page_size,
+        cache_key = self._cache_key(ConsumableType.PAPER, query, filters, page, page_size)
+        if self._cache:
+            cached = await self._cache.get(cache_key)
+            if cached:
+                logger.debug(f"Cache hit for paper search: {query}")
+                try:
+                    return SearchPapersResponse.model_validate(cached)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable cached paper search: {e}")
+
+        # Check out the hydration connection (pool pre-ping included) while
+        # Meilisearch is searching, so hydration starts with a warm connection
+        search_result, _ = await asyncio.gather(
+            self._searcher.search_papers(
+                query,
+                filters=filters,
+                page=page,
+                page_size=page_size,
+            ),
+            self._session.connection(),
         )
 
-        # Convert search hits to response objects
+        # Hydrate the whole page in one query, falling back to the indexed
+        # document for hits that are not (or no longer) in the database
+        works_by_id = await self._hydrate_works([hit.id for hit in search_result.hits])
+
         results = []
         for hit in search_result.hits:
-            paper_response = self._hit_to_paper_response(hit.data)
-            if paper_response:
-                results.append(
-                    SearchPaperResult(
-                        id=hit.id,
-                        score=hit.score,
-                        paper=paper_response,
-                    )
-                )
-
-        return SearchPapersResponse(
+            work = works_by_id.get(hit.id)
+            try:
+                if work is not None:
+                    paper_response = self._work_to_paper_response(work)
+                elif "title" in hit.data:
+                    paper_response = self._hit_to_paper_response(hit.data)
+                else:
+                    continue
+            except Exception as e:
+                # Skip only the malformed hit; the rest of the page is still served
+                logger.warning("Failed to convert paper hit %s: %s", hit.id, e)
+                continue
+            results.append(SearchPaperResult(id=hit.id, score=hit.score, paper=paper_response))
+
+        response = SearchPapersResponse(
             total=search_result.total,
             page=page,
             page_size=page_size,
@@ -169,50 +272,118 @@ class SearchService:
             results=results,
         )
 
-    def _hit_to_book_response(self, data: dict) -> BookResponse | None:
-        """Convert a search hit to BookResponse."""
-        try:
-            authors = [AuthorResponse(name=name) for name in data.get("authors", [])]
+        if self._cache:
+            await self._cache.set(cache_key, response.model_dump(mode="json"), ttl=self.CACHE_TTL)
+
+        return response
 
-            idents = data.get("identifiers", {})
-            identifiers = IdentifiersResponse(
+    @staticmethod
+    def _cache_key(
+        consumable_type: ConsumableType,
+        query: str,
+        filters: SearchFilters,
+        page: int,
+        page_size: int,
+    ) -> str:
+        """Build the cache key for one page of search results."""
+        params = {k: v for k, v in asdict(filters).items() if v is not None}
+        params["page"] = page
+        params["page_size"] = page_size
+        return CacheKeys.search(query, consumable_type, params)
+
+    async def _hydrate_works(self, ids: list[UUID]) -> dict[UUID, WorkModel]:
+        """
+        Load the works for a page of hits in a single query.
+
+        Args:
+            ids: Work IDs from the search hits
+
+        Returns:
+            Mapping of work ID to work, with authors eagerly loaded
+        """
+        if not ids:
+            return {}
+
+        # source_records is lazy="selectin" on the model, but responses never
+        # read it; skip that extra round trip and fail loudly if one starts to
+        stmt = (
+            select(WorkModel)
+            .where(WorkModel.id.in_(ids))
+            .options(selectinload(WorkModel.authors), raiseload(WorkModel.source_records))
+        )
+        result = await self._session.execute(stmt)
+        return {work.id: work for work in result.scalars()}
+
+    def _work_to_book_response(self, work: WorkModel) -> BookResponse:
+        """Convert a hydrated work to BookResponse."""
+        idents = work.identifiers or {}
+
+        return BookResponse.model_construct(
+            title=work.title,
+            authors=list(map(_author_response, map(_author_name, work.authors))),
+            year=work.year,
+            identifiers=_identifiers_response(
                 isbn_10=idents.get("isbn_10"),
                 isbn_13=idents.get("isbn_13"),
-            )
-
-            return BookResponse(
-                title=data.get("title", "Unknown"),
-                authors=authors,
-                year=data.get("year"),
-                identifiers=identifiers,
-                publisher=data.get("publisher"),
-                subjects=data.get("subjects", []),
-                language=data.get("language"),
-            )
-        except Exception as e:
-            logger.warning(f"Failed to convert book hit: {e}")
-            return None
+            ),
+            publisher=idents.get("publisher"),
+            subjects=idents.get("subjects", []),
+            language=work.language or idents.get("language"),
+        )
 
-    def _hit_to_paper_response(self, data: dict) -> PaperResponse | None:
-        """Convert a search hit to PaperResponse."""
-        try:
-            authors = [AuthorResponse(name=name) for name in data.get("authors", [])]
+    def _work_to_paper_response(self, work: WorkModel) -> PaperResponse:
+        """Convert a hydrated work to PaperResponse."""
+        idents = work.identifiers or {}
 
-            idents = data.get("identifiers", {})
-            identifiers = IdentifiersResponse(
+        return PaperResponse.model_construct(
+            title=work.title,
+            authors=list(map(_author_response, map(_author_name, work.authors))),
+            year=work.year,
+            identifiers=_identifiers_response(
                 doi=idents.get("doi"),
                 arxiv_id=idents.get("arxiv_id"),
-            )
+            ),
+            abstract=idents.get("abstract"),
+            journal=idents.get("journal"),
+            citation_count=idents.get("citation_count"),
+        )
 
-            return PaperResponse(
-                title=data.get("title", "Unknown"),
-                authors=authors,
-                year=data.get("year"),
-                identifiers=identifiers,
-                abstract=data.get("abstract"),
-                journal=data.get("journal"),
-                citation_count=data.get("citation_count"),
-            )
-        except Exception as e:
-            logger.warning(f"Failed to convert paper hit: {e}")
-            return None
+    def _hit_to_book_response(self, data: Mapping[str, Any]) -> BookResponse:
+        """Convert a search hit to BookResponse."""
+        authors = list(map(_author_response, data.get("authors") or ()))
+
+        idents = data.get("identifiers", {})
+        identifiers = _identifiers_response(
+            isbn_10=idents.get("isbn_10"),
+            isbn_13=idents.get("isbn_13"),
+        )
+
+        return BookResponse.model_construct(
+            title=data["title"],
+            authors=authors,
+            year=data.get("year"),
+            identifiers=identifiers,
+            publisher=data.get("publisher"),
+            subjects=data.get("subjects", []),
+            language=data.get("language"),
+        )
+
+    def _hit_to_paper_response(self, data: Mapping[str, Any]) -> PaperResponse:
+        """Convert a search hit to PaperResponse."""
+        authors = list(map(_author_response, data.get("authors") or ()))
+
+        idents = data.get("identifiers", {})
+        identifiers = _identifiers_response(
+            doi=idents.get("doi"),
+            arxiv_id=idents.get("arxiv_id"),
+        )
+
+        return PaperResponse.model_construct(
+            title=data["title"],
+            authors=authors,
+            year=data.get("year"),
+            identifiers=identifiers,
+            abstract=data.get("abstract"),
+            journal=data.get("journal"),
+            citation_count=data.get("citation_count"),
+        )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import uuid4
@@ -19,7 +20,24 @@ from consearch.core.models import (
 from consearch.core.types import SourceName
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Callable
+
+
+# ============================================================================
+# Event Loop
+# ============================================================================
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config,
+    item: pytest.Item,
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop when available (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
 
 
 # ============================================================================
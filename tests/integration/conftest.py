@@ -3,19 +3,37 @@
 from __future__ import annotations
 
 import os
-from collections.abc import AsyncIterator
+import re
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
+from pathlib import Path
 from uuid import uuid4
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient, Timeout
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from consearch.api.dependencies import (
+    get_cache_client,
+    get_db_session,
+    get_resolver_registry,
+    get_search_indexer,
+)
+from consearch.api.routes import health_router, resolve_router, search_router
 from consearch.core.normalization import normalize_title
 from consearch.core.types import ConsumableType
 from consearch.db.base import Base
 from consearch.db.models.author import AuthorModel
 from consearch.db.models.work import WorkModel
+from consearch.resolution.registry import ResolverRegistry
 
 # ============================================================================
 # Database Fixtures
@@ -31,30 +49,37 @@ def database_url() -> str:
     )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 async def db_engine(database_url: str):
     """
-    Create a fresh database engine for each test.
+    Create the database engine once for the whole test session.
 
-    Each test gets its own engine to avoid event loop mismatch issues
-    with asyncpg connection pools.
+    Tests and fixtures share the session event loop (see
+    ``asyncio_default_test_loop_scope``), so one asyncpg pool can serve every
+    test; the extension and schema are set up a single time.
     """
+    # Each test holds one connection (two while the shared client warms up),
+    # so a small pool suffices and keeps -n auto within max_connections.
+    # Connections never sit idle long enough to go stale, so skip the
+    # pre-ping round trip on every checkout.
     engine = create_async_engine(
         database_url,
         echo=False,
         pool_size=2,
         max_overflow=5,
-        pool_pre_ping=True,
+        pool_pre_ping=False,
     )
 
-    # Ensure tables exist
+    # Ensure tables exist; the advisory lock serializes schema setup when
+    # several xdist workers start against the same database
     async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('consearch_test_schema'))"))
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
 
-    # Clean up all data and dispose engine
+    # Clean up anything committed outside a test transaction and dispose engine
     async with engine.begin() as conn:
         # Delete in correct order to respect foreign key constraints
         await conn.execute(text("DELETE FROM work_authors"))
@@ -65,32 +90,111 @@ async def db_engine(database_url: str):
     await engine.dispose()
 
 
-@pytest.fixture(scope="function")
-async def db_session_factory(db_engine) -> async_sessionmaker[AsyncSession]:
-    """Create session factory from engine."""
+@pytest.fixture
+async def db_connection(db_engine) -> AsyncIterator[AsyncConnection]:
+    """
+    Open a connection with an outer transaction that is rolled back after the test.
+
+    Everything a test writes, including commits, stays inside this transaction.
+    """
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await transaction.rollback()
+
+
+@pytest.fixture
+async def db_session_factory(db_connection) -> async_sessionmaker[AsyncSession]:
+    """
+    Create a session factory bound to the test connection.
+
+    Sessions join the outer transaction through a SAVEPOINT, so
+    ``session.commit()`` only releases the savepoint and the test's data is
+    discarded when ``db_connection`` rolls back.
+    """
     return async_sessionmaker(
-        db_engine,
+        bind=db_connection,
         expire_on_commit=False,
         autoflush=False,
+        join_transaction_mode="create_savepoint",
     )
 
 
+@pytest.fixture
+def pooled_session_factory(db_engine) -> async_sessionmaker[AsyncSession]:
+    """
+    Create a session factory bound to the shared engine rather than the test connection.
+
+    Each session checks out its own connection from the session-wide pool, so
+    tests can observe real isolation between concurrent transactions. Sessions
+    from ``db_session_factory`` all share the test connection and would see
+    each other's uncommitted writes. Anything committed through this factory
+    is *not* rolled back.
+    """
+    return async_sessionmaker(bind=db_engine, expire_on_commit=False, autoflush=False)
+
+
 @pytest.fixture
 async def db_session(db_session_factory) -> AsyncIterator[AsyncSession]:
     """
-    Get database session with automatic cleanup.
+    Get database session for a test.
 
-    Each test gets a fresh session. Data is committed to allow proper
-    testing of persistence, but cleaned up after the test.
+    Data is committed to allow proper testing of persistence; the commit
+    lands in a SAVEPOINT that is rolled back after the test.
+
+    Sample data fixtures only flush: every session in a test shares the test
+    connection, so flushed rows are already visible to the repositories and
+    the app, and a commit would just add a RELEASE/SAVEPOINT round trip.
     """
     async with db_session_factory() as session:
         yield session
 
 
+_SAVEPOINT_STATEMENT = re.compile(r"(RELEASE |ROLLBACK TO )?SAVEPOINT\b")
+
+
+@pytest.fixture
+def count_queries(db_engine) -> Callable[[], AbstractContextManager[list[str]]]:
+    """
+    Count SQL statements sent to the database.
+
+    SAVEPOINT bookkeeping from the test transaction is not counted.
+
+    Usage::
+
+        with count_queries() as queries:
+            ...
+        assert len(queries) == 2
+    """
+
+    @contextmanager
+    def _count() -> Iterator[list[str]]:
+        queries: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if not _SAVEPOINT_STATEMENT.match(statement):
+                queries.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            yield queries
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", _record)
+
+    return _count
+
+
 # ============================================================================
 # Sample Data Fixtures
 # ============================================================================
 
+_SAMPLE_BOOK_TITLE = "Clean Code: A Handbook of Agile Software Craftsmanship"
+_SAMPLE_BOOK_TITLE_NORMALIZED = normalize_title(_SAMPLE_BOOK_TITLE)
+_SAMPLE_PAPER_TITLE = "DNA sequencing with nanopores"
+_SAMPLE_PAPER_TITLE_NORMALIZED = normalize_title(_SAMPLE_PAPER_TITLE)
+
 
 def _create_sample_author() -> AuthorModel:
     """Create a sample author model (not persisted)."""
@@ -104,11 +208,11 @@ def _create_sample_author() -> AuthorModel:
 
 def _create_sample_book_work(author: AuthorModel | None = None) -> WorkModel:
     """Create a sample book work model (not persisted)."""
-    work = WorkModel(
+    return WorkModel(
         id=uuid4(),
         work_type=ConsumableType.BOOK,
-        title="Clean Code: A Handbook of Agile Software Craftsmanship",
-        title_normalized=normalize_title("Clean Code: A Handbook of Agile Software Craftsmanship"),
+        title=_SAMPLE_BOOK_TITLE,
+        title_normalized=_SAMPLE_BOOK_TITLE_NORMALIZED,
         year=2008,
         language="en",
         identifiers={
@@ -117,10 +221,8 @@ def _create_sample_book_work(author: AuthorModel | None = None) -> WorkModel:
             "openlibrary_id": "OL12345W",
         },
         confidence=1.0,
+        authors=[author] if author else [],
     )
-    if author:
-        work.authors.append(author)
-    return work
 
 
 @pytest.fixture
@@ -128,7 +230,7 @@ async def sample_author(db_session: AsyncSession) -> AuthorModel:
     """Create a sample author in the database."""
     author = _create_sample_author()
     db_session.add(author)
-    await db_session.commit()
+    await db_session.flush()
     return author
 
 
@@ -140,7 +242,7 @@ async def sample_book_work(db_session: AsyncSession) -> WorkModel:
 
     work = _create_sample_book_work(author)
     db_session.add(work)
-    await db_session.commit()
+    await db_session.flush()
     return work
 
 
@@ -158,8 +260,8 @@ async def sample_paper_work(db_session: AsyncSession) -> WorkModel:
     work = WorkModel(
         id=uuid4(),
         work_type=ConsumableType.PAPER,
-        title="DNA sequencing with nanopores",
-        title_normalized=normalize_title("DNA sequencing with nanopores"),
+        title=_SAMPLE_PAPER_TITLE,
+        title_normalized=_SAMPLE_PAPER_TITLE_NORMALIZED,
         year=2013,
         language="en",
         identifiers={
@@ -167,19 +269,21 @@ async def sample_paper_work(db_session: AsyncSession) -> WorkModel:
             "semantic_scholar_id": "abc123def456",
         },
         confidence=1.0,
+        authors=[author],
     )
-    work.authors.append(author)
     db_session.add(work)
-    await db_session.commit()
+    await db_session.flush()
     return work
 
 
 @pytest.fixture
 async def multiple_works(db_session: AsyncSession) -> list[WorkModel]:
     """Create multiple works for pagination/search tests."""
-    works = []
-    for i in range(5):
-        work = WorkModel(
+    # One flush sends these as a single multi-row INSERT. Spreading them over
+    # separate pooled sessions would not overlap anything useful and would
+    # commit outside the test's rolled-back transaction.
+    works = [
+        WorkModel(
             id=uuid4(),
             work_type=ConsumableType.BOOK,
             title=f"Test Book {i + 1}",
@@ -189,9 +293,10 @@ async def multiple_works(db_session: AsyncSession) -> list[WorkModel]:
             identifiers={"isbn_13": f"978000000000{i}"},
             confidence=1.0,
         )
-        db_session.add(work)
-        works.append(work)
-    await db_session.commit()
+        for i in range(5)
+    ]
+    db_session.add_all(works)
+    await db_session.flush()
     return works
 
 
@@ -200,20 +305,65 @@ async def multiple_works(db_session: AsyncSession) -> list[WorkModel]:
 # ============================================================================
 
 
-@pytest.fixture
-async def test_app(db_session_factory):
-    """Create test FastAPI application with mocked dependencies."""
-    from fastapi import FastAPI
-
-    from consearch.api.dependencies import (
-        get_cache_client,
-        get_db_session,
-        get_resolver_registry,
-        get_search_indexer,
-    )
-    from consearch.api.routes import health_router, resolve_router, search_router
-    from consearch.resolution.registry import ResolverRegistry
+def _build_overrides(
+    *,
+    registry: ResolverRegistry | None = None,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+    extra: dict | None = None,
+) -> dict:
+    """
+    Build a dependency override map for the test app.
+
+    Each override is an ``async def`` so FastAPI calls it inline instead of
+    dispatching to its threadpool.
+    """
+    overrides: dict = {}
+
+    if registry is not None:
+
+        async def override_resolver_registry():
+            return registry
+
+        async def override_cache_client():
+            return None
+
+        async def override_search_indexer():
+            return None
+
+        overrides[get_resolver_registry] = override_resolver_registry
+        overrides[get_cache_client] = override_cache_client
+        overrides[get_search_indexer] = override_search_indexer
+
+    if session_factory is not None:
+
+        async def override_db_session():
+            # Sessions join the test's outer transaction through a SAVEPOINT,
+            # so commit only releases it; skip even that when the request
+            # never touched the database.
+            async with session_factory() as session:
+                try:
+                    yield session
+                    if session.in_transaction():
+                        await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
 
+        overrides[get_db_session] = override_db_session
+
+    if extra:
+        overrides.update(extra)
+    return overrides
+
+
+@pytest.fixture(scope="module")
+async def test_app():
+    """
+    Create test FastAPI application with mocked dependencies.
+
+    Built once per module; per-test state (database binding and any extra
+    dependency overrides) is applied and reverted by ``app_overrides``.
+    """
     # Create a minimal app for testing
     app = FastAPI()
     app.include_router(health_router, prefix="/api/v1")
@@ -221,37 +371,17 @@ async def test_app(db_session_factory):
     app.include_router(search_router, prefix="/api/v1")
 
     # Store in app state (for routes that access state directly)
-    app.state.db_session_factory = db_session_factory
+    app.state.db_session_factory = None
     app.state.cache_client = None
     app.state.search_client = None
     app.state.search_indexer = None
+    app.state.searcher = None
 
     registry = ResolverRegistry()
     app.state.resolver_registry = registry
 
     # Override dependency injection functions
-    async def override_db_session():
-        async with db_session_factory() as session:
-            try:
-                yield session
-                await session.commit()
-            except Exception:
-                await session.rollback()
-                raise
-
-    async def override_resolver_registry():
-        return registry
-
-    async def override_cache_client():
-        return None
-
-    async def override_search_indexer():
-        return None
-
-    app.dependency_overrides[get_db_session] = override_db_session
-    app.dependency_overrides[get_resolver_registry] = override_resolver_registry
-    app.dependency_overrides[get_cache_client] = override_cache_client
-    app.dependency_overrides[get_search_indexer] = override_search_indexer
+    app.dependency_overrides.update(_build_overrides(registry=registry))
 
     yield app
 
@@ -260,85 +390,242 @@ async def test_app(db_session_factory):
     await registry.close_all()
 
 
+@asynccontextmanager
+async def _bound_to_database(
+    app: FastAPI,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[dict]:
+    """Point the app at a session factory, restoring its overrides on exit."""
+    saved_overrides = dict(app.dependency_overrides)
+
+    app.state.db_session_factory = session_factory
+    app.dependency_overrides.update(_build_overrides(session_factory=session_factory))
+    try:
+        yield app.dependency_overrides
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(saved_overrides)
+        app.state.db_session_factory = None
+
+
 @pytest.fixture
-async def test_client(test_app) -> AsyncIterator[AsyncClient]:
-    """Create async HTTP test client."""
+async def app_overrides(test_app, db_session_factory) -> AsyncIterator[dict]:
+    """
+    Bind the shared app to this test's database and isolate its overrides.
+
+    Yields ``test_app.dependency_overrides``; anything a test adds is
+    reverted on teardown.
+    """
+    async with _bound_to_database(test_app, db_session_factory) as overrides:
+        yield overrides
+
+
+@pytest.fixture(scope="module")
+async def shared_client(test_app, db_engine) -> AsyncIterator[AsyncClient]:
+    """
+    Create one async HTTP client per module over the shared app.
+
+    One throwaway request per route family is sent up front so the first
+    real test does not absorb first-request setup, which keeps
+    ``--durations`` output and per-test timeouts meaningful.
+    """
     transport = ASGITransport(app=test_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        timeout=Timeout(5.0),
+    ) as client:
+        async with db_engine.connect() as conn:
+            transaction = await conn.begin()
+            warmup_factory = async_sessionmaker(
+                bind=conn,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            async with _bound_to_database(test_app, warmup_factory):
+                await client.get("/api/v1/health")
+                await client.post("/api/v1/resolve/book", json={"query": "warmup"})
+                await client.post("/api/v1/resolve/paper", json={"query": "warmup"})
+            await transaction.rollback()
+
         yield client
 
 
+@pytest.fixture(scope="module")
+def sync_client(test_app) -> Iterator[TestClient]:
+    """
+    Create a synchronous client for checks that never reach the database.
+
+    The app runs in TestClient's own event loop, so tests using this client
+    must not hit routes that touch the session-loop database connection.
+    """
+    with TestClient(test_app) as client:
+        yield client
+
+
+@pytest.fixture
+def test_client(shared_client, app_overrides) -> AsyncClient:
+    """Get the shared async HTTP client with this test's app state applied."""
+    return shared_client
+
+
 # ============================================================================
 # Redis Fixtures (Optional - skipped if not available)
 # ============================================================================
 
 
-@pytest.fixture
+def _xdist_worker_index() -> int:
+    """Index of the current pytest-xdist worker (0 when not running under xdist)."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    return int(worker.removeprefix("gw") or 0)
+
+
+@pytest.fixture(scope="session")
 def redis_url() -> str:
-    """Get test Redis URL from environment or use default."""
-    return os.getenv("TEST_REDIS_URL", "redis://localhost:6379/15")
+    """
+    Get test Redis URL from environment or use a per-worker default database.
 
+    Workers cycle through databases 1-15, so any worker count stays within
+    Redis's default 16 databases and never lands on database 0.
+    """
+    return os.getenv("TEST_REDIS_URL", f"redis://localhost:6379/{_xdist_worker_index() % 15 + 1}")
 
-@pytest.fixture
-async def redis_client(redis_url: str):
-    """Create Redis client for testing (optional)."""
+
+@pytest.fixture(scope="session")
+def redis_prefix() -> str:
+    """Key prefix for this test session; tests must namespace their keys with it."""
+    return f"test:{uuid4().hex[:8]}:"
+
+
+@pytest.fixture(scope="session")
+async def redis_session_client(redis_url: str, redis_prefix: str):
+    """Connect to Redis once per session (optional)."""
     try:
         from consearch.cache.client import AsyncRedisClient
 
         client = AsyncRedisClient(redis_url)
+        await client.connect()
         # Verify connection
         await client.ping()
-        # Clear test database
-        await client._redis.flushdb()
-        yield client
-        # Cleanup
-        await client._redis.flushdb()
-        await client.close()
     except Exception:
         pytest.skip("Redis not available for integration tests")
 
+    yield client
+
+    # Cleanup only this session's keys; UNLINK frees memory in the background
+    await client.delete_prefix(redis_prefix)
+    await client.close()
+
+
+@pytest.fixture
+async def redis_client(redis_session_client, redis_prefix: str):
+    """Get the shared Redis client, removing keys under ``redis_prefix`` after the test."""
+    yield redis_session_client
+    await redis_session_client.delete_prefix(redis_prefix)
+
 
 # ============================================================================
 # Meilisearch Fixtures (Optional - skipped if not available)
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def meilisearch_url() -> str:
     """Get test Meilisearch URL from environment or use default."""
     return os.getenv("TEST_MEILISEARCH_URL", "http://localhost:7700")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def meilisearch_key() -> str | None:
     """Get test Meilisearch key from environment."""
     return os.getenv("TEST_MEILISEARCH_KEY")
 
 
-@pytest.fixture
-async def search_client(meilisearch_url: str, meilisearch_key: str | None):
-    """Create Meilisearch client for testing (optional)."""
+@pytest.fixture(scope="session")
+async def meilisearch_session_client(meilisearch_url: str, meilisearch_key: str | None):
+    """Create the Meilisearch client and test indexes once per session (optional)."""
     try:
         from consearch.search.client import AsyncMeilisearchClient
 
         client = AsyncMeilisearchClient(meilisearch_url, meilisearch_key)
         # Verify connection
-        await client.health()
-        # Setup test indexes with unique names
-        test_suffix = uuid4().hex[:8]
-        client._books_index = f"books_test_{test_suffix}"
-        client._papers_index = f"papers_test_{test_suffix}"
-        await client.setup_indexes()
-        yield client
-        # Cleanup - delete test indexes
+        healthy = await client.health()
+    except Exception:
+        healthy = False
+    if not healthy:
+        pytest.skip("Meilisearch not available for integration tests")
+
+    # Setup test indexes with names unique to this session and xdist worker
+    test_suffix = f"{os.getenv('PYTEST_XDIST_WORKER', 'main')}_{uuid4().hex[:8]}"
+    client._books_index = f"books_test_{test_suffix}"
+    client._papers_index = f"papers_test_{test_suffix}"
+    await client.setup_indexes()
+
+    yield client
+
+    # Cleanup - delete test indexes
+    try:
+        await client._client.delete_index(client._books_index)
+        await client._client.delete_index(client._papers_index)
+    except Exception:
+        pass
+    await client.close()
+
+
+@pytest.fixture
+async def search_client(meilisearch_session_client):
+    """Get the shared Meilisearch client, emptying the test indexes after the test."""
+    yield meilisearch_session_client
+
+    # Document deletion is queued ahead of the next test's additions, so no wait
+    for index_name in (
+        meilisearch_session_client._books_index,
+        meilisearch_session_client._papers_index,
+    ):
         try:
-            await client._client.delete_index(client._books_index)
-            await client._client.delete_index(client._papers_index)
+            await meilisearch_session_client.delete_all_documents(index_name)
         except Exception:
             pass
-        await client.close()
+
+
+_BOOKS_CORPUS = [
+    {
+        "id": "test-book-1",
+        "title": "Clean Code",
+        "authors": ["Robert C. Martin"],
+        "year": 2008,
+        "language": "en",
+    },
+    {
+        "id": "test-book-2",
+        "title": "The Pragmatic Programmer",
+        "authors": ["David Thomas", "Andrew Hunt"],
+        "year": 2019,
+        "language": "en",
+    },
+]
+
+
+@pytest.fixture(scope="session")
+async def indexed_books_corpus(meilisearch_session_client) -> AsyncIterator[list[dict]]:
+    """
+    Index a small read-only book corpus once per session.
+
+    Lives in its own index so the per-test cleanup in ``search_client`` never
+    wipes it; tests must not modify it.
+    """
+    client = meilisearch_session_client
+    index_name = f"{client._books_index}_corpus"
+
+    task = await client._client.index(index_name).add_documents(_BOOKS_CORPUS)
+    await client.wait_for_task(task)
+
+    yield _BOOKS_CORPUS
+
+    try:
+        await client._client.delete_index(index_name)
     except Exception:
-        pytest.skip("Meilisearch not available for integration tests")
+        pass
 
 
 # ============================================================================
@@ -346,6 +633,14 @@ async def search_client(meilisearch_url: str, meilisearch_key: str | None):
 # ============================================================================
 
 
+def pytest_collection_modifyitems(items):
+    """Mark every test in this directory as ``integration``."""
+    integration_dir = Path(__file__).parent
+    for item in items:
+        if integration_dir in item.path.parents:
+            item.add_marker(pytest.mark.integration)
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line(
@@ -2,10 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+import warnings
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock
+
+import orjson
 import pytest
-from httpx import AsyncClient
+from pydantic import HttpUrl
+
+from consearch.api.dependencies import get_resolution_service, get_searcher
+from consearch.api.routes.health import HEALTH_CACHE_TTL
+from consearch.api.schemas import ResolveBookResponse, ResolvePaperResponse
+from consearch.core.models import Author, BookRecord, Identifiers, PaperRecord, SourceMetadata
+from consearch.core.types import ResolutionStatus, SourceName
+from consearch.resolution.base import ResolutionResult
+from consearch.resolution.chain import AggregatedResult
+from consearch.search.searcher import Searcher
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+    from httpx import AsyncClient, Response
 
-pytestmark = [pytest.mark.integration]
+
+def _json(response: Response) -> Any:
+    """Decode a test client response body with orjson."""
+    return orjson.loads(response.content)
 
 
 # ============================================================================
@@ -16,33 +39,60 @@ pytestmark = [pytest.mark.integration]
 class TestHealthEndpoint:
     """Tests for the /api/v1/health endpoint."""
 
-    async def test_health_returns_200(self, test_client: AsyncClient):
-        """Health endpoint should return 200."""
+    async def test_health_contract(self, test_client: AsyncClient):
+        """Health response should include status, version and service statuses."""
         response = await test_client.get("/api/v1/health")
 
         assert response.status_code == 200
-        data = response.json()
-        assert "status" in data
+        data = _json(response)
         assert data["status"] in ["healthy", "degraded", "unhealthy"]
+        assert isinstance(data["version"], str)
+        # Should have at least these services
+        assert isinstance(data["services"], dict)
 
-    async def test_health_includes_version(self, test_client: AsyncClient):
-        """Health response should include version."""
-        response = await test_client.get("/api/v1/health")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "version" in data
-        assert isinstance(data["version"], str)
+class TestHealthCache:
+    """Tests for the health result cached on app.state.health_cache."""
+
+    @pytest.fixture
+    def redis_ping(self, test_app, test_client):
+        """Stand in a Redis client whose ping is counted, starting uncached."""
+        ping = AsyncMock(return_value=True)
+        test_app.state.cache_client = AsyncMock(ping=ping)
+        test_app.state.health_cache = None
+        yield ping
+        test_app.state.cache_client = None
+        test_app.state.health_cache = None
+
+    async def test_reuses_result_within_ttl(self, test_client: AsyncClient, redis_ping):
+        """A second probe inside HEALTH_CACHE_TTL should not re-run the checks."""
+        first = await test_client.get("/api/v1/health")
+        second = await test_client.get("/api/v1/health")
+
+        assert redis_ping.await_count == 1
+        assert _json(second) == _json(first)
+
+    async def test_reprobes_after_expiry(self, test_app, test_client: AsyncClient, redis_ping):
+        """Once the cached result expires the checks should run again."""
+        await test_client.get("/api/v1/health")
+        expires_at, response = test_app.state.health_cache
+        assert expires_at - time.monotonic() <= HEALTH_CACHE_TTL
+
+        test_app.state.health_cache = (time.monotonic() - 1, response)
+        await test_client.get("/api/v1/health")
+
+        assert redis_ping.await_count == 2
+
+    async def test_failing_probe_reports_down(self, test_client: AsyncClient, redis_ping):
+        """A check that raises should mark its service down."""
+        redis_ping.side_effect = ConnectionError("redis unavailable")
 
-    async def test_health_includes_services(self, test_client: AsyncClient):
-        """Health response should include service statuses."""
         response = await test_client.get("/api/v1/health")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "services" in data
-        # Should have at least these services
-        assert isinstance(data["services"], dict)
+        data = _json(response)
+        assert data["services"]["redis"] == "down"
+        assert data["services"]["database"] == "up"
+        assert data["status"] == "degraded"
 
 
 class TestReadinessEndpoint:
@@ -53,7 +103,7 @@ class TestReadinessEndpoint:
         response = await test_client.get("/api/v1/ready")
 
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "ready" in data
         assert isinstance(data["ready"], bool)
 
@@ -63,66 +113,55 @@ class TestReadinessEndpoint:
 # ============================================================================
 
 
-class TestDetectEndpoint:
-    """Tests for the /api/v1/resolve/detect endpoint."""
-
-    async def test_detect_isbn13(self, test_client: AsyncClient):
-        """Should detect ISBN-13."""
-        response = await test_client.post(
-            "/api/v1/resolve/detect",
-            params={"query": "9780134093413"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["detectedType"] == "isbn_13"
-        assert data["confidence"] >= 0.9
-
-    async def test_detect_isbn10(self, test_client: AsyncClient):
-        """Should detect ISBN-10."""
-        response = await test_client.post(
-            "/api/v1/resolve/detect",
-            params={"query": "0134093410"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["detectedType"] == "isbn_10"
-
-    async def test_detect_doi(self, test_client: AsyncClient):
-        """Should detect DOI."""
-        response = await test_client.post(
-            "/api/v1/resolve/detect",
-            params={"query": "10.1038/nature12373"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["detectedType"] == "doi"
-        # DOIs can be for both books and papers, so consumableType is None
-        assert data["consumableType"] is None
+_DETECT_CASES = [
+    ("9780134093413", "isbn_13", 0.9),
+    ("0134093410", "isbn_10", 0.0),
+    ("10.1038/nature12373", "doi", 0.0),
+    ("arXiv:2301.12345", "arxiv", 0.0),
+    # Title is the fallback
+    ("Clean Code by Robert Martin", "title", 0.0),
+]
+
+
+@pytest.fixture(scope="class")
+async def detect_responses(shared_client: AsyncClient) -> dict[str, Response]:
+    """
+    Send every detect case concurrently, keyed by query.
+
+    Detection never touches the database, so the requests go through the
+    shared client without a per-test database binding.
+    """
+    async with asyncio.TaskGroup() as tg:
+        tasks = {
+            query: tg.create_task(
+                shared_client.post("/api/v1/resolve/detect", params={"query": query})
+            )
+            for query, _, _ in _DETECT_CASES
+        }
+    return {query: task.result() for query, task in tasks.items()}
 
-    async def test_detect_arxiv(self, test_client: AsyncClient):
-        """Should detect arXiv ID."""
-        response = await test_client.post(
-            "/api/v1/resolve/detect",
-            params={"query": "arXiv:2301.12345"},
-        )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["detectedType"] == "arxiv"
+class TestDetectEndpoint:
+    """Tests for the /api/v1/resolve/detect endpoint."""
 
-    async def test_detect_title(self, test_client: AsyncClient):
-        """Should detect title as fallback."""
-        response = await test_client.post(
-            "/api/v1/resolve/detect",
-            params={"query": "Clean Code by Robert Martin"},
-        )
+    @pytest.mark.parametrize("query,expected_type,min_confidence", _DETECT_CASES)
+    async def test_detect(
+        self,
+        detect_responses: dict[str, Response],
+        query: str,
+        expected_type: str,
+        min_confidence: float,
+    ):
+        """Should detect the input type."""
+        response = detect_responses[query]
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["detectedType"] == "title"
+        data = _json(response)
+        assert data["detectedType"] == expected_type
+        assert data["confidence"] >= min_confidence
+        if expected_type == "doi":
+            # DOIs can be for both books and papers, so consumableType is None
+            assert data["consumableType"] is None
 
 
 class TestResolveBookEndpoint:
@@ -137,21 +176,6 @@ class TestResolveBookEndpoint:
 
         assert response.status_code == 422  # Validation error
 
-    async def test_resolve_book_accepts_valid_request(self, test_client: AsyncClient):
-        """Should accept valid request."""
-        response = await test_client.post(
-            "/api/v1/resolve/book",
-            json={"query": "9780134093413"},
-        )
-
-        # May return 200 with NOT_FOUND status if no resolvers are mocked
-        assert response.status_code == 200
-        data = response.json()
-        assert "detectedInputType" in data
-        assert "status" in data
-        assert "records" in data
-        assert "totalDurationMs" in data
-
     async def test_resolve_book_with_input_type(self, test_client: AsyncClient):
         """Should accept explicit input type."""
         response = await test_client.post(
@@ -163,7 +187,7 @@ class TestResolveBookEndpoint:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["detectedInputType"] == "isbn_13"
 
     async def test_resolve_book_with_camel_case(self, test_client: AsyncClient):
@@ -205,21 +229,6 @@ class TestResolvePaperEndpoint:
 
         assert response.status_code == 422  # Validation error
 
-    async def test_resolve_paper_accepts_valid_request(self, test_client: AsyncClient):
-        """Should accept valid request."""
-        response = await test_client.post(
-            "/api/v1/resolve/paper",
-            json={"query": "10.1038/nature12373"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "detectedInputType" in data
-        assert "status" in data
-        assert "records" in data
-        assert "sourcesTried" in data
-        assert "totalDurationMs" in data
-
     async def test_resolve_paper_with_doi(self, test_client: AsyncClient):
         """Should handle DOI input."""
         response = await test_client.post(
@@ -231,7 +240,7 @@ class TestResolvePaperEndpoint:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["detectedInputType"] == "doi"
 
     async def test_resolve_paper_with_arxiv(self, test_client: AsyncClient):
@@ -245,7 +254,7 @@ class TestResolvePaperEndpoint:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["detectedInputType"] == "arxiv"
 
     async def test_resolve_paper_invalid_input_type_for_paper(self, test_client: AsyncClient):
@@ -267,81 +276,64 @@ class TestResolvePaperEndpoint:
 # ============================================================================
 
 
-class TestSearchBooksEndpoint:
-    """Tests for the /api/v1/search/books endpoint."""
-
-    async def test_search_books_requires_query(self, test_client: AsyncClient):
-        """Should require query parameter."""
-        response = await test_client.get("/api/v1/search/books")
-
-        assert response.status_code == 422  # Missing required parameter
-
-    async def test_search_books_returns_503_without_meilisearch(self, test_client: AsyncClient):
-        """Should return 503 when Meilisearch is not available."""
-        response = await test_client.get(
-            "/api/v1/search/books",
-            params={"query": "python"},
-        )
-
-        # Without Meilisearch configured, should return 503
-        assert response.status_code == 503
-        data = response.json()
-        assert "not available" in data["detail"].lower()
-
-    async def test_search_books_validates_pagination(self, test_client: AsyncClient):
-        """Should validate pagination parameters."""
-        response = await test_client.get(
-            "/api/v1/search/books",
-            params={
-                "query": "python",
-                "page": 0,  # Invalid - must be >= 1
-            },
-        )
-
-        assert response.status_code == 422
+class TestSearchValidation:
+    """Request validation tests for the /api/v1/search endpoints."""
 
-    async def test_search_books_validates_page_size(self, test_client: AsyncClient):
-        """Should validate page size parameter."""
-        response = await test_client.get(
-            "/api/v1/search/books",
-            params={
-                "query": "python",
-                "pageSize": 1000,  # Invalid - max is 100
-            },
-        )
+    @pytest.mark.parametrize(
+        "path,params",
+        [
+            pytest.param("/api/v1/search/books", {}, id="books-requires-query"),
+            pytest.param(
+                "/api/v1/search/books",
+                {"query": "python", "page": 0},  # must be >= 1
+                id="books-page",
+            ),
+            pytest.param(
+                "/api/v1/search/books",
+                {"query": "python", "pageSize": 1000},  # max is 100
+                id="books-page-size",
+            ),
+            pytest.param("/api/v1/search/papers", {}, id="papers-requires-query"),
+            pytest.param(
+                "/api/v1/search/papers",
+                {"query": "AI", "yearMin": 500},  # must be >= 1000
+                id="papers-year-range",
+            ),
+        ],
+    )
+    async def test_rejects_invalid_params(
+        self,
+        test_client: AsyncClient,
+        path: str,
+        params: dict[str, str | int],
+    ):
+        """Should reject invalid query parameters with 422."""
+        response = await test_client.get(path, params=params)
 
         assert response.status_code == 422
 
 
-class TestSearchPapersEndpoint:
-    """Tests for the /api/v1/search/papers endpoint."""
-
-    async def test_search_papers_requires_query(self, test_client: AsyncClient):
-        """Should require query parameter."""
-        response = await test_client.get("/api/v1/search/papers")
-
-        assert response.status_code == 422
-
-    async def test_search_papers_returns_503_without_meilisearch(self, test_client: AsyncClient):
-        """Should return 503 when Meilisearch is not available."""
-        response = await test_client.get(
-            "/api/v1/search/papers",
-            params={"query": "machine learning"},
-        )
+class TestSearchUnavailable:
+    """Tests for search endpoints when Meilisearch is not configured."""
+
+    @pytest.mark.parametrize(
+        "path,query",
+        [
+            ("/api/v1/search/books", "python"),
+            ("/api/v1/search/papers", "machine learning"),
+        ],
+    )
+    async def test_returns_503_without_meilisearch(
+        self,
+        test_client: AsyncClient,
+        path: str,
+        query: str,
+    ):
+        """Should return 503 when the app has no searcher."""
+        response = await test_client.get(path, params={"query": query})
 
         assert response.status_code == 503
-
-    async def test_search_papers_validates_year_range(self, test_client: AsyncClient):
-        """Should validate year range parameters."""
-        response = await test_client.get(
-            "/api/v1/search/papers",
-            params={
-                "query": "AI",
-                "yearMin": 500,  # Invalid - must be >= 1000
-            },
-        )
-
-        assert response.status_code == 422
+        assert "not available" in _json(response)["detail"].lower()
 
 
 # ============================================================================
@@ -352,21 +344,21 @@ class TestSearchPapersEndpoint:
 class TestErrorHandling:
     """Tests for error handling across endpoints."""
 
-    async def test_404_for_unknown_endpoint(self, test_client: AsyncClient):
+    def test_404_for_unknown_endpoint(self, sync_client: TestClient):
         """Should return 404 for unknown endpoints."""
-        response = await test_client.get("/api/v1/unknown")
+        response = sync_client.get("/api/v1/unknown")
 
         assert response.status_code == 404
 
-    async def test_405_for_wrong_method(self, test_client: AsyncClient):
+    def test_405_for_wrong_method(self, sync_client: TestClient):
         """Should return 405 for wrong HTTP method."""
-        response = await test_client.get("/api/v1/resolve/book")
+        response = sync_client.get("/api/v1/resolve/book")
 
         assert response.status_code == 405
 
-    async def test_json_content_type(self, test_client: AsyncClient):
+    def test_json_content_type(self, sync_client: TestClient):
         """Responses should have JSON content type."""
-        response = await test_client.get("/api/v1/health")
+        response = sync_client.get("/api/v1/ready")
 
         assert response.headers["content-type"].startswith("application/json")
 
@@ -387,7 +379,7 @@ class TestResponseSchemas:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
 
         # Required fields
         assert "detectedInputType" in data
@@ -407,7 +399,7 @@ class TestResponseSchemas:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
 
         # Required fields
         assert "detectedInputType" in data
@@ -415,20 +407,9 @@ class TestResponseSchemas:
         assert "records" in data
         assert isinstance(data["records"], list)
         assert "sourcesTried" in data
+        assert isinstance(data["sourcesTried"], list)
         assert "totalDurationMs" in data
-
-    async def test_health_response_schema(self, test_client: AsyncClient):
-        """Health response should match expected schema."""
-        response = await test_client.get("/api/v1/health")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert "status" in data
-        assert data["status"] in ["healthy", "degraded", "unhealthy"]
-        assert "version" in data
-        assert "services" in data
-        assert isinstance(data["services"], dict)
+        assert isinstance(data["totalDurationMs"], (int, float))
 
 
 # ============================================================================
@@ -436,231 +417,192 @@ class TestResponseSchemas:
 # ============================================================================
 
 
+_CLEAN_CODE_RECORD = BookRecord(
+    title="Clean Code",
+    authors=[Author(name="Robert C. Martin")],
+    year=2008,
+    identifiers=Identifiers(
+        isbn_13="9780132350884",
+        isbn_10="0132350882",
+    ),
+    publisher="Prentice Hall",
+    cover_image_url=HttpUrl("https://covers.openlibrary.org/b/id/12345-L.jpg"),
+    url=HttpUrl("https://openlibrary.org/works/OL12345W"),
+    source_metadata=SourceMetadata(
+        source=SourceName.OPEN_LIBRARY,
+        source_id="OL12345W",
+    ),
+)
+
+_CLEAN_CODE_RESULT = AggregatedResult(
+    primary_result=ResolutionResult(
+        status=ResolutionStatus.SUCCESS,
+        source=SourceName.OPEN_LIBRARY,
+        records=[_CLEAN_CODE_RECORD],
+        duration_ms=50.0,
+    ),
+    fallback_results=[],
+    all_records=[_CLEAN_CODE_RECORD],
+)
+
+
+_NATURE_PAPER_RECORD = PaperRecord(
+    title="Nanometre-scale thermometry in a living cell",
+    authors=[Author(name="G. Kucsko", orcid="0000-0002-1825-0097")],
+    year=2013,
+    abstract="Sensitive probing of temperature variations on nanometre scales.",
+    url=HttpUrl("https://www.nature.com/articles/nature12373"),
+    identifiers=Identifiers(doi="10.1038/nature12373"),
+    journal="Nature",
+    volume="500",
+    citation_count=1500,
+    pdf_url=HttpUrl("https://arxiv.org/pdf/1304.1068"),
+    source_metadata=SourceMetadata(
+        source=SourceName.CROSSREF,
+        source_id="10.1038/nature12373",
+        raw_data={"publisher": "Springer Nature"},
+    ),
+)
+
+_NATURE_PAPER_RESULT = AggregatedResult(
+    primary_result=ResolutionResult(
+        status=ResolutionStatus.TIMEOUT,
+        source=SourceName.SEMANTIC_SCHOLAR,
+        error_message="timed out",
+        duration_ms=5000.0,
+    ),
+    fallback_results=[
+        ResolutionResult(
+            status=ResolutionStatus.SUCCESS,
+            source=SourceName.CROSSREF,
+            records=[_NATURE_PAPER_RECORD],
+            duration_ms=80.0,
+        ),
+    ],
+    all_records=[_NATURE_PAPER_RECORD],
+)
+
+
+class _FakeResolutionService:
+    """Resolution service double that returns a fixed result."""
+
+    def __init__(self, result: AggregatedResult) -> None:
+        self._result = result
+
+    async def resolve_book(self, *args, **kwargs) -> AggregatedResult:
+        return self._result
+
+    async def resolve_paper(self, *args, **kwargs) -> AggregatedResult:
+        return self._result
+
+
+@pytest.fixture
+def mocked_resolution_service() -> _FakeResolutionService:
+    """Resolution service that resolves a single Open Library book."""
+    return _FakeResolutionService(_CLEAN_CODE_RESULT)
+
+
 class TestWithMockedServices:
     """Tests that require mocked external services."""
 
-    async def test_resolve_book_with_mocked_resolver(self, db_session_factory):
+    async def test_resolve_book_with_mocked_resolver(
+        self,
+        test_client: AsyncClient,
+        app_overrides: dict,
+        mocked_resolution_service,
+    ):
         """Should return book records when resolver is mocked."""
-        from unittest.mock import AsyncMock
-
-        from fastapi import FastAPI
-        from httpx import ASGITransport, AsyncClient
-
-        from consearch.api.dependencies import (
-            get_cache_client,
-            get_db_session,
-            get_resolution_service,
-            get_resolver_registry,
-            get_search_indexer,
-        )
-        from consearch.api.routes import health_router, resolve_router, search_router
-        from consearch.core.models import Author, BookRecord, Identifiers, SourceMetadata
-        from consearch.core.types import ResolutionStatus, SourceName
-        from consearch.resolution.base import ResolutionResult
-        from consearch.resolution.chain import AggregatedResult
-        from consearch.resolution.registry import ResolverRegistry
-
-        # Create a mock resolution service that returns test data
-        mock_service = AsyncMock()
-        mock_service.resolve_book.return_value = AggregatedResult(
-            primary_result=ResolutionResult(
-                status=ResolutionStatus.SUCCESS,
-                source=SourceName.OPEN_LIBRARY,
-                records=[
-                    BookRecord(
-                        title="Clean Code",
-                        authors=[Author(name="Robert C. Martin")],
-                        year=2008,
-                        identifiers=Identifiers(
-                            isbn_13="9780132350884",
-                            isbn_10="0132350882",
-                        ),
-                        publisher="Prentice Hall",
-                        source_metadata=SourceMetadata(
-                            source=SourceName.OPEN_LIBRARY,
-                            source_id="OL12345W",
-                        ),
-                    )
-                ],
-                duration_ms=50.0,
-            ),
-            fallback_results=[],
-            all_records=[
-                BookRecord(
-                    title="Clean Code",
-                    authors=[Author(name="Robert C. Martin")],
-                    year=2008,
-                    identifiers=Identifiers(
-                        isbn_13="9780132350884",
-                        isbn_10="0132350882",
-                    ),
-                    publisher="Prentice Hall",
-                    source_metadata=SourceMetadata(
-                        source=SourceName.OPEN_LIBRARY,
-                        source_id="OL12345W",
-                    ),
-                )
-            ],
-        )
-
-        # Create app with mocked service
-        app = FastAPI()
-        app.include_router(health_router, prefix="/api/v1")
-        app.include_router(resolve_router, prefix="/api/v1")
-        app.include_router(search_router, prefix="/api/v1")
 
-        app.state.db_session_factory = db_session_factory
-        app.state.cache_client = None
-        app.state.search_client = None
-        app.state.search_indexer = None
-
-        registry = ResolverRegistry()
-        app.state.resolver_registry = registry
+        async def override_resolution_service():
+            return mocked_resolution_service
 
-        async def override_db_session():
-            async with db_session_factory() as session:
-                try:
-                    yield session
-                    await session.commit()
-                except Exception:
-                    await session.rollback()
-                    raise
+        app_overrides[get_resolution_service] = override_resolution_service
 
-        async def override_resolver_registry():
-            return registry
+        # HttpUrl fields must reach the str response fields without tripping
+        # pydantic's serializer type check
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error", message="Pydantic serializer warnings")
+            response = await test_client.post(
+                "/api/v1/resolve/book",
+                json={"query": "9780132350884"},  # ISBN-13
+            )
 
-        async def override_cache_client():
-            return None
+        assert response.status_code == 200
+        data = _json(response)
+        assert data["status"] == "success"
+        assert len(data["records"]) == 1
+        assert data["records"][0]["title"] == "Clean Code"
+        assert data["records"][0]["authors"][0]["name"] == "Robert C. Martin"
+        assert data["records"][0]["identifiers"]["isbn13"] == "9780132350884"
+        assert data["records"][0]["url"] == "https://openlibrary.org/works/OL12345W"
+        assert data["records"][0]["coverImageUrl"] == (
+            "https://covers.openlibrary.org/b/id/12345-L.jpg"
+        )
 
-        async def override_search_indexer():
-            return None
+    @pytest.mark.parametrize(
+        ("path", "query", "result", "response_model"),
+        [
+            ("book", "9780132350884", _CLEAN_CODE_RESULT, ResolveBookResponse),
+            ("paper", "10.1038/nature12373", _NATURE_PAPER_RESULT, ResolvePaperResponse),
+        ],
+    )
+    async def test_resolve_response_matches_schema(
+        self,
+        test_client: AsyncClient,
+        app_overrides: dict,
+        path: str,
+        query: str,
+        result: AggregatedResult,
+        response_model: type[ResolveBookResponse] | type[ResolvePaperResponse],
+    ):
+        """
+        The resolve body should validate against its response model.
+
+        Handlers build responses with ``model_construct`` and return them as
+        ``SchemaResponse``, which skips FastAPI's response_model check, so this
+        is the only place the wire format is validated.
+        """
 
         async def override_resolution_service():
-            return mock_service
-
-        app.dependency_overrides[get_db_session] = override_db_session
-        app.dependency_overrides[get_resolver_registry] = override_resolver_registry
-        app.dependency_overrides[get_cache_client] = override_cache_client
-        app.dependency_overrides[get_search_indexer] = override_search_indexer
-        app.dependency_overrides[get_resolution_service] = override_resolution_service
-
-        # Test the endpoint
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post(
-                "/api/v1/resolve/book",
-                json={"query": "9780132350884"},  # ISBN-13
-            )
+            return _FakeResolutionService(result)
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "success"
-            assert len(data["records"]) == 1
-            assert data["records"][0]["title"] == "Clean Code"
-            assert data["records"][0]["authors"][0]["name"] == "Robert C. Martin"
-            assert data["records"][0]["identifiers"]["isbn13"] == "9780132350884"
+        app_overrides[get_resolution_service] = override_resolution_service
 
-        # Cleanup
-        app.dependency_overrides.clear()
-        await registry.close_all()
+        response = await test_client.post(
+            f"/api/v1/resolve/{path}",
+            json={"query": query, "includeRawData": True},
+        )
 
-    async def test_search_books_with_meilisearch(self, db_session_factory, search_client):
+        assert response.status_code == 200
+        validated = response_model.model_validate_json(response.content)
+        # Re-serializing the validated model must reproduce the body exactly,
+        # so a constructed field of the wrong type cannot slip through coerced
+        assert orjson.loads(validated.model_dump_json(by_alias=True)) == _json(response)
+        assert len(validated.records) == len(result.all_records)
+
+    async def test_search_books_with_meilisearch(
+        self,
+        test_client: AsyncClient,
+        app_overrides: dict,
+        meilisearch_session_client,
+        indexed_books_corpus: list[dict],
+    ):
         """Should search books when Meilisearch is available."""
-        from fastapi import FastAPI
-        from httpx import ASGITransport, AsyncClient
-
-        from consearch.api.dependencies import (
-            get_cache_client,
-            get_db_session,
-            get_resolver_registry,
-            get_search_client,
-            get_search_indexer,
-        )
-        from consearch.api.routes import health_router, resolve_router, search_router
-        from consearch.resolution.registry import ResolverRegistry
-
-        # Index some test data
-        test_books = [
-            {
-                "id": "test-book-1",
-                "title": "Clean Code",
-                "authors": ["Robert C. Martin"],
-                "year": 2008,
-                "language": "en",
-            },
-            {
-                "id": "test-book-2",
-                "title": "The Pragmatic Programmer",
-                "authors": ["David Thomas", "Andrew Hunt"],
-                "year": 2019,
-                "language": "en",
-            },
-        ]
-
-        # Add documents to the test index
-        await search_client._client.index(search_client._books_index).add_documents(test_books)
-        # Wait for indexing to complete
-        await search_client._client.index(search_client._books_index).wait_for_task(
-            (await search_client._client.index(search_client._books_index).get_tasks())
-            .results[0]
-            .uid
-        )
+        searcher = Searcher(meilisearch_session_client)
 
-        # Create app with search client
-        app = FastAPI()
-        app.include_router(health_router, prefix="/api/v1")
-        app.include_router(resolve_router, prefix="/api/v1")
-        app.include_router(search_router, prefix="/api/v1")
-
-        app.state.db_session_factory = db_session_factory
-        app.state.cache_client = None
-        app.state.search_client = search_client
-
-        registry = ResolverRegistry()
-        app.state.resolver_registry = registry
-
-        async def override_db_session():
-            async with db_session_factory() as session:
-                try:
-                    yield session
-                    await session.commit()
-                except Exception:
-                    await session.rollback()
-                    raise
-
-        async def override_resolver_registry():
-            return registry
-
-        async def override_cache_client():
-            return None
-
-        async def override_search_client():
-            return search_client
-
-        async def override_search_indexer():
-            return None
-
-        app.dependency_overrides[get_db_session] = override_db_session
-        app.dependency_overrides[get_resolver_registry] = override_resolver_registry
-        app.dependency_overrides[get_cache_client] = override_cache_client
-        app.dependency_overrides[get_search_client] = override_search_client
-        app.dependency_overrides[get_search_indexer] = override_search_indexer
-
-        # Test the endpoint
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                "/api/v1/search/books",
-                params={"query": "Clean Code"},
-            )
+        async def override_searcher():
+            return searcher
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["total"] >= 1
-            # The search should find "Clean Code"
-            titles = [r["title"] for r in data["results"]]
-            assert "Clean Code" in titles
+        app_overrides[get_searcher] = override_searcher
 
-        # Cleanup
-        app.dependency_overrides.clear()
-        await registry.close_all()
+        response = await test_client.get(
+            "/api/v1/search/books",
+            params={"query": "Clean Code"},
+        )
+
+        assert response.status_code == 200
+        data = _json(response)
+        assert data["total"] >= 1
+        # The search should find "Clean Code"
+        titles = [r["title"] for r in data["results"]]
+        assert "Clean Code" in titles
@@ -0,0 +1,133 @@
+"""Integration tests for the resolution service."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from consearch.cache.keys import CacheKeys
+from consearch.core.models import Author, BookRecord
+from consearch.core.types import ConsumableType, InputType, ResolutionStatus, SourceName
+from consearch.resolution.base import ResolutionResult
+from consearch.resolution.chain import AggregatedResult
+from consearch.services.resolution import ResolutionService
+
+pytestmark = [pytest.mark.requires_db]
+
+
+class _FixedChain:
+    """Resolver chain double that returns a fixed result."""
+
+    def __init__(self, result: AggregatedResult) -> None:
+        self._result = result
+
+    async def resolve(self, *args, **kwargs) -> AggregatedResult:
+        return self._result
+
+
+class _FixedRegistry:
+    """Resolver registry double whose book chain returns a fixed result."""
+
+    def __init__(self, result: AggregatedResult) -> None:
+        self._chain = _FixedChain(result)
+
+    def get_book_chain(self) -> _FixedChain:
+        return self._chain
+
+
+def _failed(status: ResolutionStatus) -> AggregatedResult:
+    return AggregatedResult(
+        primary_result=ResolutionResult(
+            status=status,
+            source=SourceName.OPEN_LIBRARY,
+            error_message="upstream unavailable" if status != ResolutionStatus.NOT_FOUND else None,
+        ),
+    )
+
+
+@pytest.fixture
+async def stale_book(redis_client):
+    """Seed a stale book resolution for a unique title query, removing it afterwards."""
+    query = f"Stale Title {uuid4().hex[:8]}"
+    key = CacheKeys.resolution_stale(ConsumableType.BOOK, f"{InputType.TITLE.value}:{query}")
+    record = BookRecord(title=query)
+    stale = AggregatedResult(
+        primary_result=ResolutionResult(
+            status=ResolutionStatus.SUCCESS,
+            source=SourceName.OPEN_LIBRARY,
+            records=[record],
+        ),
+        all_records=[record],
+    )
+    await redis_client.set(key, stale.to_dict(), ttl=60)
+    yield query
+    await redis_client.delete(key)
+
+
+@pytest.mark.requires_redis
+class TestStaleFallback:
+    """Tests for serving stale resolutions when upstream sources fail."""
+
+    async def test_serves_stale_copy_when_sources_fail(
+        self,
+        db_session: AsyncSession,
+        redis_client,
+        stale_book: str,
+    ):
+        """Should return the stale result instead of an error."""
+        service = ResolutionService(
+            session=db_session,
+            resolver_registry=_FixedRegistry(_failed(ResolutionStatus.TIMEOUT)),
+            cache=redis_client,
+        )
+
+        result = await service.resolve_book(stale_book, InputType.TITLE)
+
+        assert result.success
+        assert result.all_records[0].title == stale_book
+
+    async def test_not_found_is_not_masked(
+        self,
+        db_session: AsyncSession,
+        redis_client,
+        stale_book: str,
+    ):
+        """A definitive miss from a source should not fall back to the stale copy."""
+        service = ResolutionService(
+            session=db_session,
+            resolver_registry=_FixedRegistry(_failed(ResolutionStatus.NOT_FOUND)),
+            cache=redis_client,
+        )
+
+        result = await service.resolve_book(stale_book, InputType.TITLE)
+
+        assert not result.success
+
+
+class TestPersistence:
+    """Tests for persisting newly resolved records."""
+
+    async def test_author_links_inserted_in_one_statement(
+        self,
+        db_session: AsyncSession,
+        count_queries,
+    ):
+        """All author links of a new work should go out as a single INSERT."""
+        names = [f"Link Author {i} {uuid4().hex[:8]}" for i in range(5)]
+        record = BookRecord(
+            title=f"Linked Book {uuid4().hex[:8]}",
+            authors=[Author(name=name) for name in names],
+        )
+        service = ResolutionService(
+            session=db_session,
+            resolver_registry=_FixedRegistry(_failed(ResolutionStatus.NOT_FOUND)),
+        )
+
+        with count_queries() as queries:
+            work = await service._persist_book_record(record)
+
+        link_inserts = [q for q in queries if q.startswith("INSERT INTO work_authors")]
+        assert len(link_inserts) == 1
+        assert [author.name for author in work.authors] == names
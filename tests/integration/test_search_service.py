@@ -0,0 +1,261 @@
+"""Integration tests for the search service."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from consearch.cache.keys import CacheKeys
+from consearch.core.normalization import normalize_title
+from consearch.core.types import ConsumableType
+from consearch.db.models.author import AuthorModel
+from consearch.db.models.work import WorkModel
+from consearch.search.indexer import SearchIndexer
+from consearch.search.searcher import Searcher, SearchFilters, SearchHit, SearchResponse
+from consearch.services.search import SearchService
+
+pytestmark = [pytest.mark.requires_db]
+
+
+@pytest.fixture
+def search_service(db_session: AsyncSession) -> SearchService:
+    """Search service bound to the test session; hydration needs no Meilisearch."""
+    return SearchService(session=db_session, searcher=Searcher(client=None))
+
+
+class _StaticSearcher(Searcher):
+    """Searcher that returns fixed hits instead of querying Meilisearch."""
+
+    def __init__(self, hits: list[SearchHit]) -> None:
+        super().__init__(client=None)
+        self.hits = hits
+        self.calls = 0
+
+    async def search_books(
+        self,
+        query: str,
+        *,
+        filters: SearchFilters | None = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> SearchResponse:
+        self.calls += 1
+        return SearchResponse(
+            hits=self.hits,
+            total=len(self.hits),
+            query=query,
+            processing_time_ms=0,
+            page=page,
+            page_size=page_size,
+            has_more=False,
+        )
+
+
+class _NullMeilisearchClient:
+    """Meilisearch client double that accepts index writes and discards them."""
+
+    async def add_documents(self, index: str, documents: list[dict[str, Any]]) -> SimpleNamespace:
+        return SimpleNamespace(task_uid=0)
+
+    async def delete_all_documents(self, index: str) -> None:
+        return None
+
+
+def _book_hit(**data: Any) -> SearchHit:
+    """Build a hit for a book that is only in the index, not the database."""
+    return SearchHit(id=uuid4(), score=1.0, data={"title": "Indexed Book", **data})
+
+
+# ============================================================================
+# Hydration Tests
+# ============================================================================
+
+
+class TestHydrateWorks:
+    """Tests for batch hydration of search hits."""
+
+    async def test_hydrates_page_in_one_call(
+        self,
+        search_service: SearchService,
+        multiple_works: list[WorkModel],
+    ):
+        """Should return every requested work keyed by ID."""
+        ids = [work.id for work in multiple_works]
+
+        works_by_id = await search_service._hydrate_works(ids)
+
+        assert set(works_by_id) == set(ids)
+        assert works_by_id[ids[0]].title == multiple_works[0].title
+
+    async def test_missing_ids_are_omitted(
+        self,
+        search_service: SearchService,
+        sample_book_work: WorkModel,
+    ):
+        """Should skip IDs that are not in the database."""
+        works_by_id = await search_service._hydrate_works([sample_book_work.id, uuid4()])
+
+        assert list(works_by_id) == [sample_book_work.id]
+
+    async def test_authors_loaded_without_n_plus_one(
+        self,
+        db_session: AsyncSession,
+        search_service: SearchService,
+        count_queries,
+    ):
+        """Should load a page of works and all their authors in two statements."""
+        works = [
+            WorkModel(
+                id=uuid4(),
+                work_type=ConsumableType.BOOK,
+                title=f"Authored Book {i}",
+                title_normalized=normalize_title(f"Authored Book {i}"),
+                identifiers={},
+                authors=[
+                    AuthorModel(id=uuid4(), name=f"Author {i}", name_normalized=f"author {i}")
+                ],
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(works)
+        await db_session.commit()
+        db_session.expunge_all()
+
+        with count_queries() as queries:
+            works_by_id = await search_service._hydrate_works([work.id for work in works])
+            names = [author.name for work in works_by_id.values() for author in work.authors]
+
+        assert len(queries) == 2
+        assert sorted(names) == [f"Author {i}" for i in range(5)]
+
+    async def test_empty_ids(self, search_service: SearchService):
+        """Should return an empty mapping without querying."""
+        assert await search_service._hydrate_works([]) == {}
+
+    async def test_work_to_book_response(
+        self,
+        search_service: SearchService,
+        sample_book_work: WorkModel,
+    ):
+        """Should build a book response from the hydrated work and its authors."""
+        works_by_id = await search_service._hydrate_works([sample_book_work.id])
+
+        response = search_service._work_to_book_response(works_by_id[sample_book_work.id])
+
+        assert response is not None
+        assert response.title == sample_book_work.title
+        assert [a.name for a in response.authors] == ["Robert C. Martin"]
+        assert response.identifiers.isbn_13 == "9780134093413"
+        assert response.language == "en"
+
+    async def test_work_to_paper_response(
+        self,
+        search_service: SearchService,
+        sample_paper_work: WorkModel,
+    ):
+        """Should build a paper response from the hydrated work and its authors."""
+        works_by_id = await search_service._hydrate_works([sample_paper_work.id])
+
+        response = search_service._work_to_paper_response(works_by_id[sample_paper_work.id])
+
+        assert response is not None
+        assert response.identifiers.doi == "10.1038/nature12373"
+        assert [a.name for a in response.authors] == ["Elizabeth Pennisi"]
+
+
+# ============================================================================
+# Hit Conversion Tests
+# ============================================================================
+
+
+class TestHitConversion:
+    """Tests for converting a page of search hits to responses."""
+
+    async def test_malformed_hit_skips_only_that_hit(self, db_session: AsyncSession):
+        """A hit that fails to convert should not drop the hits after it."""
+        hits = [
+            _book_hit(title="First"),
+            _book_hit(identifiers=None),
+            _book_hit(title="Last"),
+        ]
+        service = SearchService(session=db_session, searcher=_StaticSearcher(hits))
+
+        response = await service.search_books("book")
+
+        assert [r.id for r in response.results] == [hits[0].id, hits[2].id]
+        assert [r.book.title for r in response.results] == ["First", "Last"]
+
+
+# ============================================================================
+# Caching Tests
+# ============================================================================
+
+
+@pytest.fixture
+async def search_cache(redis_client):
+    """Redis client for search pages, removing every cached page afterwards."""
+    yield redis_client
+    for consumable_type in (ConsumableType.BOOK, ConsumableType.PAPER):
+        await redis_client.delete_prefix(CacheKeys.search_prefix(consumable_type))
+
+
+def _book_page_key(query: str) -> str:
+    """Cache key of the first default-sized page of an unfiltered book search."""
+    return SearchService._cache_key(ConsumableType.BOOK, query, SearchFilters(), 1, 20)
+
+
+@pytest.mark.requires_redis
+class TestSearchCaching:
+    """Tests for caching pages of search results in Redis."""
+
+    async def test_cache_miss_stores_page(self, db_session: AsyncSession, search_cache):
+        """A page built from Meilisearch hits should be written to the cache."""
+        query = f"cached {uuid4().hex[:8]}"
+        searcher = _StaticSearcher([_book_hit(title="Cached Book")])
+        service = SearchService(session=db_session, searcher=searcher, cache=search_cache)
+
+        await service.search_books(query)
+
+        cached = await search_cache.get(_book_page_key(query))
+        assert cached is not None
+        assert [r["book"]["title"] for r in cached["results"]] == ["Cached Book"]
+
+    async def test_cache_hit_skips_search_and_database(
+        self,
+        db_session: AsyncSession,
+        search_cache,
+        count_queries,
+    ):
+        """A cached page should be served without Meilisearch or database work."""
+        query = f"cached {uuid4().hex[:8]}"
+        searcher = _StaticSearcher([_book_hit(title="Cached Book")])
+        service = SearchService(session=db_session, searcher=searcher, cache=search_cache)
+        first = await service.search_books(query)
+
+        with count_queries() as queries:
+            second = await service.search_books(query)
+
+        assert searcher.calls == 1
+        assert queries == []
+        assert second == first
+
+    async def test_reindex_all_invalidates_search_pages(
+        self,
+        db_session: AsyncSession,
+        search_cache,
+    ):
+        """Reindexing should drop every cached search page."""
+        query = f"cached {uuid4().hex[:8]}"
+        searcher = _StaticSearcher([_book_hit(title="Cached Book")])
+        service = SearchService(session=db_session, searcher=searcher, cache=search_cache)
+        await service.search_books(query)
+        assert await search_cache.get(_book_page_key(query)) is not None
+
+        indexer = SearchIndexer(client=_NullMeilisearchClient(), cache=search_cache)
+        await indexer.reindex_all(db_session)
+
+        assert await search_cache.get(_book_page_key(query)) is None
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+from uuid import uuid4
+
 import pytest
 from pydantic import ValidationError
 
+from consearch.api.responses import SchemaResponse
 from consearch.api.schemas import (
+    APIBaseSchema,
     AuthorResponse,
     BookResponse,
     IdentifiersResponse,
@@ -15,12 +20,16 @@ from consearch.api.schemas import (
     ResolveBookResponse,
     ResolvePaperRequest,
     ResolvePaperResponse,
+    SearchBookResult,
     SearchBooksResponse,
+    SearchPaperResult,
     SearchPapersResponse,
     SourceMetadataResponse,
 )
 from consearch.core.types import InputType, ResolutionStatus, SourceName
 
+_FIXED_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
 # ============================================================================
 # Request Schema Tests
 # ============================================================================
@@ -93,25 +102,87 @@ class TestResolvePaperRequest:
 # ============================================================================
 
 
-class TestAuthorResponse:
-    """Tests for AuthorResponse schema."""
+_FULL_RESPONSES = [
+    pytest.param(
+        AuthorResponse,
+        {
+            "name": "John Smith",
+            "given_name": "John",
+            "family_name": "Smith",
+            "orcid": "0000-0001-2345-6789",
+            "affiliations": ["University"],
+        },
+        id="author",
+    ),
+    pytest.param(
+        BookResponse,
+        {
+            "title": "Clean Code",
+            "authors": [AuthorResponse(name="Robert C. Martin")],
+            "year": 2008,
+            "identifiers": IdentifiersResponse(isbn_13="9780134093413"),
+            "publisher": "Prentice Hall",
+            "pages": 464,
+            "subjects": ["Programming"],
+            "language": "en",
+        },
+        id="book",
+    ),
+    pytest.param(
+        PaperResponse,
+        {
+            "title": "DNA sequencing with nanopores",
+            "authors": [AuthorResponse(name="Elizabeth Pennisi")],
+            "year": 2013,
+            "identifiers": IdentifiersResponse(doi="10.1038/nature12373"),
+            "journal": "Nature",
+            "volume": "500",
+            "issue": "7463",
+            "pages_range": "476-480",
+            "citation_count": 1500,
+        },
+        id="paper",
+    ),
+]
+
+_MINIMAL_RESPONSES = [
+    pytest.param(AuthorResponse, {"name": "John Doe"}, id="author"),
+    pytest.param(
+        BookResponse,
+        {"title": "Minimal Book", "authors": [], "identifiers": IdentifiersResponse()},
+        id="book",
+    ),
+    pytest.param(
+        PaperResponse,
+        {"title": "Minimal Paper", "authors": [], "identifiers": IdentifiersResponse()},
+        id="paper",
+    ),
+]
+
+
+class TestResponseShapes:
+    """Shared construction tests for author, book and paper responses."""
+
+    @pytest.mark.parametrize("cls,kwargs", _FULL_RESPONSES)
+    def test_full_response(self, cls: type[APIBaseSchema], kwargs: dict):
+        """Fully populated responses should be valid and keep every field."""
+        response = cls(**kwargs)
+        for name, value in kwargs.items():
+            assert getattr(response, name) == value
+
+    @pytest.mark.parametrize("cls,kwargs", _MINIMAL_RESPONSES)
+    def test_minimal_response(self, cls: type[APIBaseSchema], kwargs: dict):
+        """Responses with only required fields should default everything else."""
+        response = cls(**kwargs)
+        for name, field in cls.model_fields.items():
+            expected = (
+                kwargs[name] if name in kwargs else field.get_default(call_default_factory=True)
+            )
+            assert getattr(response, name) == expected
 
-    def test_full_author(self):
-        """Full author should be valid."""
-        author = AuthorResponse(
-            name="John Smith",
-            given_name="John",
-            family_name="Smith",
-            orcid="0000-0001-2345-6789",
-            affiliations=["University"],
-        )
-        assert author.name == "John Smith"
 
-    def test_minimal_author(self):
-        """Minimal author with only name should be valid."""
-        author = AuthorResponse(name="John Doe")
-        assert author.name == "John Doe"
-        assert author.given_name is None
+class TestAuthorResponse:
+    """Tests for AuthorResponse schema."""
 
     def test_camel_case_serialization(self):
         """Should serialize to camelCase."""
@@ -120,9 +191,9 @@ class TestAuthorResponse:
             given_name="John",
             family_name="Smith",
         )
-        data = author.model_dump(by_alias=True)
-        assert "givenName" in data
-        assert "familyName" in data
+        data = author.model_dump_json(by_alias=True)
+        assert '"givenName":"John"' in data
+        assert '"familyName":"Smith"' in data
 
 
 class TestIdentifiersResponse:
@@ -149,66 +220,10 @@ class TestIdentifiersResponse:
     def test_camel_case_serialization(self):
         """Should serialize to camelCase."""
         ids = IdentifiersResponse(isbn_13="9780134093413", arxiv_id="1234.56789")
-        data = ids.model_dump(by_alias=True)
+        data = ids.model_dump_json(by_alias=True)
         # Check snake_case fields have camelCase aliases
-        assert "arxivId" in data or "arxiv_id" in data  # Depends on alias config
-
-
-class TestBookResponse:
-    """Tests for BookResponse schema."""
-
-    def test_full_book(self):
-        """Full book response should be valid."""
-        book = BookResponse(
-            title="Clean Code",
-            authors=[AuthorResponse(name="Robert C. Martin")],
-            year=2008,
-            identifiers=IdentifiersResponse(isbn_13="9780134093413"),
-            publisher="Prentice Hall",
-            pages=464,
-            subjects=["Programming"],
-            language="en",
-        )
-        assert book.title == "Clean Code"
-        assert len(book.authors) == 1
-
-    def test_minimal_book(self):
-        """Minimal book with only title should be valid."""
-        book = BookResponse(
-            title="Minimal Book",
-            authors=[],
-            identifiers=IdentifiersResponse(),
-        )
-        assert book.title == "Minimal Book"
-
-
-class TestPaperResponse:
-    """Tests for PaperResponse schema."""
-
-    def test_full_paper(self):
-        """Full paper response should be valid."""
-        paper = PaperResponse(
-            title="DNA sequencing with nanopores",
-            authors=[AuthorResponse(name="Elizabeth Pennisi")],
-            year=2013,
-            identifiers=IdentifiersResponse(doi="10.1038/nature12373"),
-            journal="Nature",
-            volume="500",
-            issue="7463",
-            pages_range="476-480",
-            citation_count=1500,
-        )
-        assert paper.title == "DNA sequencing with nanopores"
-        assert paper.citation_count == 1500
-
-    def test_minimal_paper(self):
-        """Minimal paper with only title should be valid."""
-        paper = PaperResponse(
-            title="Minimal Paper",
-            authors=[],
-            identifiers=IdentifiersResponse(),
-        )
-        assert paper.title == "Minimal Paper"
+        assert '"arxivId":"1234.56789"' in data
+        assert '"isbn13":"9780134093413"' in data
 
 
 class TestResolutionSourceResult:
@@ -274,6 +289,22 @@ class TestResolveBookResponse:
         assert response.status == ResolutionStatus.NOT_FOUND
         assert len(response.records) == 0
 
+    def test_schema_response_body(self):
+        """SchemaResponse should render the same camelCase JSON as model_dump_json."""
+        response = ResolveBookResponse.model_construct(
+            detected_input_type=InputType.ISBN_13,
+            status=ResolutionStatus.NOT_FOUND,
+            records=[],
+            sources_tried=[],
+            total_duration_ms=100.0,
+        )
+
+        rendered = SchemaResponse(response)
+
+        assert rendered.media_type == "application/json"
+        assert rendered.body == response.model_dump_json(by_alias=True).encode()
+        assert b'"detectedInputType":"isbn_13"' in rendered.body
+
 
 class TestResolvePaperResponse:
     """Tests for ResolvePaperResponse schema."""
@@ -301,10 +332,6 @@ class TestSearchBooksResponse:
 
     def test_search_response(self):
         """Search response should be valid."""
-        from uuid import uuid4
-
-        from consearch.api.schemas import SearchBookResult
-
         response = SearchBooksResponse(
             query="python",
             total=10,
@@ -332,10 +359,6 @@ class TestSearchPapersResponse:
 
     def test_search_response(self):
         """Search response should be valid."""
-        from uuid import uuid4
-
-        from consearch.api.schemas import SearchPaperResult
-
         response = SearchPapersResponse(
             query="machine learning",
             total=100,
@@ -367,12 +390,10 @@ class TestSourceMetadataResponse:
 
     def test_full_metadata(self):
         """Full metadata should be valid."""
-        from datetime import datetime
-
         metadata = SourceMetadataResponse(
             source=SourceName.CROSSREF,
             source_id="10.1038/nature12373",
-            retrieved_at=datetime.utcnow(),
+            retrieved_at=_FIXED_TIME,
             reliability_score=0.95,
             raw_data={"key": "value"},
         )
@@ -381,12 +402,10 @@ class TestSourceMetadataResponse:
 
     def test_minimal_metadata(self):
         """Minimal metadata should be valid."""
-        from datetime import datetime
-
         metadata = SourceMetadataResponse(
             source=SourceName.CROSSREF,
             source_id="test",
-            retrieved_at=datetime.utcnow(),
+            retrieved_at=_FIXED_TIME,
             reliability_score=0.9,
         )
         assert metadata.raw_data is None
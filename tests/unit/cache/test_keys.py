@@ -26,6 +26,7 @@ class TestResolutionKeys:
             ),
             ("book", "test-id", "consearch:resolve:book:test-id"),
             ("paper", "test-id", "consearch:resolve:paper:test-id"),
+            ("custom", "test-id", "consearch:resolve:custom:test-id"),
         ],
     )
     def test_resolution_key_format(
@@ -50,6 +51,13 @@ class TestResolutionKeys:
         key2 = CacheKeys.resolution(ConsumableType.PAPER, "test")
         assert key1 != key2
 
+    def test_stale_key_distinct_from_fresh_key(self):
+        """Stale copies should not share a key with fresh cache entries."""
+        fresh = CacheKeys.resolution(ConsumableType.BOOK, "isbn_13:9780134093413")
+        stale = CacheKeys.resolution_stale(ConsumableType.BOOK, "isbn_13:9780134093413")
+        assert stale == "consearch:resolve-stale:book:isbn_13:9780134093413"
+        assert stale != fresh
+
 
 # ============================================================================
 # Search Key Tests
@@ -64,6 +72,12 @@ class TestSearchKeys:
         key = CacheKeys.search("machine learning", ConsumableType.PAPER)
         assert key.startswith("consearch:search:paper:")
 
+    def test_search_key_under_type_prefix(self):
+        """Search keys should share their type's prefix for bulk invalidation."""
+        key = CacheKeys.search("test", ConsumableType.BOOK, {"page": 2})
+        assert key.startswith(CacheKeys.search_prefix(ConsumableType.BOOK))
+        assert not key.startswith(CacheKeys.search_prefix(ConsumableType.PAPER))
+
     def test_search_key_with_filters(self):
         """Search key with filters should be deterministic."""
         filters = {"year_min": 2020, "language": "en"}
@@ -95,10 +109,12 @@ class TestSearchKeys:
         """Search key hash should be truncated."""
         key = CacheKeys.search("test", ConsumableType.BOOK)
         # Format is consearch:search:book:{hash}
-        parts = key.split(":")
-        assert len(parts) == 4
-        # Hash should be 12 characters
-        assert len(parts[3]) == 12
+        prefix = CacheKeys.search_prefix(ConsumableType.BOOK)
+        assert key.startswith(prefix)
+        # Hash should be 12 hex characters
+        hash_value = key[len(prefix) :]
+        assert len(hash_value) == 12
+        int(hash_value, 16)
 
 
 # ============================================================================
@@ -116,6 +132,7 @@ class TestSourceRecordKeys:
             (SourceName.CROSSREF, "10.1038/nature", "consearch:source:crossref:10.1038/nature"),
             (SourceName.ISBNDB, "book123", "consearch:source:isbndb:book123"),
             ("google_books", "abc123", "consearch:source:google_books:abc123"),
+            ("custom", "abc123", "consearch:source:custom:abc123"),
         ],
     )
     def test_source_record_key_format(
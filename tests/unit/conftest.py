@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pytest
 import respx
 from httpx import Response
@@ -21,23 +22,45 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 # ============================================================================
 
 
+@pytest.fixture(scope="module")
+def respx_router():
+    """Start one respx mock router for the whole test module.
+
+    Patching httpx's transports once per module instead of once per test
+    keeps fixture setup cheap in the resolver test modules.
+    """
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
 @pytest.fixture
-def respx_mock():
+def respx_mock(respx_router):
     """Provide a respx mock router for HTTP mocking.
 
     Use this when you need fine-grained control over mocked responses.
-    The mock is automatically started and stopped by respx.
+    As with ``@respx.mock``, every route a test registers must be called.
+    Routes are then rolled back and call stats reset, so tests stay
+    isolated while sharing the module's router.
     """
-    with respx.mock(assert_all_called=False) as router:
-        yield router
+    respx_router.snapshot()
+    try:
+        yield respx_router
+        respx_router.assert_all_called()
+    finally:
+        respx_router.rollback()
+        respx_router.reset()
 
 
 # ============================================================================
 # Resolver Configuration Fixtures
+#
+# These and the API response fixtures below are static, so they are built
+# once per session and shared. Tests must not mutate them; copy first
+# (``config.model_copy(update=...)``, ``copy.deepcopy(response)``).
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def resolver_config() -> ResolverConfig:
     """Create a resolver config for testing."""
     return ResolverConfig(
@@ -53,7 +76,7 @@ def resolver_config() -> ResolverConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def resolver_config_no_key() -> ResolverConfig:
     """Create a resolver config without API key."""
     return ResolverConfig(
@@ -63,7 +86,7 @@ def resolver_config_no_key() -> ResolverConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def resolver_config_disabled() -> ResolverConfig:
     """Create a disabled resolver config."""
     return ResolverConfig(enabled=False)
@@ -84,13 +107,21 @@ def load_fixture(category: str, name: str) -> dict[str, Any]:
     Returns:
         Parsed JSON data
     """
-    fixture_path = FIXTURES_DIR / category / f"{name}.json"
-    if not fixture_path.exists():
-        raise FileNotFoundError(f"Fixture not found: {fixture_path}")
-    return json.loads(fixture_path.read_text())
+    # Parse on every call so tests can mutate their copy; only the file read
+    # is shared, and orjson re-parses these small files faster than deepcopy
+    return orjson.loads(_read_fixture(FIXTURES_DIR / category / f"{name}.json"))
 
 
-@pytest.fixture
+@cache
+def _read_fixture(fixture_path: Path) -> bytes:
+    """Read a fixture file once per test session."""
+    try:
+        return fixture_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Fixture not found: {fixture_path}") from None
+
+
+@pytest.fixture(scope="session")
 def load_book_fixture():
     """Factory fixture to load book API response fixtures."""
 
@@ -100,7 +131,7 @@ def load_book_fixture():
     return _load
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def load_paper_fixture():
     """Factory fixture to load paper API response fixtures."""
 
@@ -112,14 +143,19 @@ def load_paper_fixture():
 
 # ============================================================================
 # Mock Response Helpers
+#
+# Bodies are encoded with orjson and passed as content rather than json=,
+# which would run them through the stdlib encoder.
 # ============================================================================
 
+_RATE_LIMIT_BODY = orjson.dumps({"error": "Rate limit exceeded"})
+
 
 def mock_json_response(data: dict[str, Any], status_code: int = 200) -> Response:
     """Create a mock JSON response."""
     return Response(
         status_code=status_code,
-        json=data,
+        content=orjson.dumps(data),
         headers={"Content-Type": "application/json"},
     )
 
@@ -128,7 +164,7 @@ def mock_error_response(status_code: int, message: str = "Error") -> Response:
     """Create a mock error response."""
     return Response(
         status_code=status_code,
-        json={"error": message},
+        content=orjson.dumps({"error": message}),
         headers={"Content-Type": "application/json"},
     )
 
@@ -137,7 +173,7 @@ def mock_rate_limit_response(retry_after: int = 60) -> Response:
     """Create a mock 429 rate limit response."""
     return Response(
         status_code=429,
-        json={"error": "Rate limit exceeded"},
+        content=_RATE_LIMIT_BODY,
         headers={
             "Content-Type": "application/json",
             "Retry-After": str(retry_after),
@@ -145,7 +181,7 @@ def mock_rate_limit_response(retry_after: int = 60) -> Response:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_responses():
     """Provide helper functions for creating mock responses."""
     return {
@@ -160,7 +196,7 @@ def mock_responses():
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def openlibrary_isbn_response() -> dict[str, Any]:
     """Sample OpenLibrary API response for ISBN lookup."""
     return {
@@ -192,7 +228,7 @@ def openlibrary_isbn_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def isbndb_isbn_response() -> dict[str, Any]:
     """Sample ISBNDb API response for ISBN lookup."""
     return {
@@ -213,7 +249,7 @@ def isbndb_isbn_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def google_books_isbn_response() -> dict[str, Any]:
     """Sample Google Books API response for ISBN lookup."""
     return {
@@ -251,7 +287,7 @@ def google_books_isbn_response() -> dict[str, Any]:
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def crossref_doi_response() -> dict[str, Any]:
     """Sample Crossref API response for DOI lookup."""
     return {
@@ -281,7 +317,7 @@ def crossref_doi_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def semantic_scholar_doi_response() -> dict[str, Any]:
     """Sample Semantic Scholar API response for DOI lookup."""
     return {
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import ValidationError
 
 from consearch.core.identifiers import DOI, ISBN, ArXivID
 
@@ -123,6 +124,12 @@ class TestISBN:
         isbn13 = ISBN.parse("9780134093413")
         assert hash(isbn10) == hash(isbn13)
 
+    def test_isbn_is_immutable(self):
+        """ISBN is hashable, so its fields must not change after creation."""
+        isbn = ISBN.parse("9780134093413")
+        with pytest.raises(ValidationError):
+            isbn.value = "9780306406157"
+
     def test_isbn_string_representation(self):
         """ISBN __str__ should return normalized value."""
         isbn = ISBN.parse("978-0-13-409341-3")
@@ -198,6 +205,12 @@ class TestDOI:
         doi2 = DOI(value="10.1038/nature12373")
         assert hash(doi1) == hash(doi2)
 
+    def test_doi_is_immutable(self):
+        """DOI is hashable, so its value must not change after creation."""
+        doi = DOI(value="10.1038/nature12373")
+        with pytest.raises(ValidationError):
+            doi.value = "10.1000/xyz123"
+
 
 # ============================================================================
 # ArXiv ID Tests
@@ -288,3 +301,9 @@ class TestArXivID:
         arxiv1 = ArXivID.parse("HEP-TH/9901001")
         arxiv2 = ArXivID.parse("hep-th/9901001")
         assert hash(arxiv1) == hash(arxiv2)
+
+    def test_arxiv_is_immutable(self):
+        """ArXiv ID is hashable, so its value must not change after creation."""
+        arxiv = ArXivID.parse("1234.56789")
+        with pytest.raises(ValidationError):
+            arxiv.value = "2345.67890"
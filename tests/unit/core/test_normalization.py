@@ -42,6 +42,9 @@ class TestNormalizeText:
             ("Ångström", "angstrom"),
             ("São Paulo", "sao paulo"),
             ("Müller", "muller"),
+            ("Ĳssel", "ijssel"),
+            ("Nguyễn", "nguyen"),
+            ("Straße", "straße"),
         ],
     )
     def test_remove_accents(self, input_text: str, expected: str):
@@ -62,6 +65,8 @@ class TestNormalizeText:
             ("C++", "c"),
             ("node.js", "nodejs"),
             ("semi;colon", "semicolon"),
+            ("snake_case", "snake_case"),
+            ("Café — “Quoted”", "cafe quoted"),
         ],
     )
     def test_remove_punctuation(self, input_text: str, expected: str):
@@ -80,6 +85,7 @@ class TestNormalizeText:
             ("hello   world", "hello world"),
             ("  multiple   spaces   ", "multiple spaces"),
             ("\nhello\t\nworld\n", "hello world"),
+            ("hello\u00a0\u2003world", "hello world"),
         ],
     )
     def test_collapse_whitespace(self, input_text: str, expected: str):
@@ -121,6 +127,9 @@ class TestNormalizeTitle:
             ("An Introduction to Algorithms", "introduction to algorithms"),
             ("THE CATCHER IN THE RYE", "catcher in the rye"),
             ("  The   Hobbit  ", "hobbit"),
+            ("Theory of Games", "theory of games"),
+            ("Another Country", "another country"),
+            ("The", "the"),
         ],
     )
     def test_remove_leading_articles(self, title: str, expected: str):
@@ -225,6 +234,11 @@ class TestISBNConversion:
         with pytest.raises(ValueError):
             isbn_10_to_13("12345")
 
+    def test_isbn_10_to_13_non_numeric(self):
+        """ISBN-10 with non-digit characters should raise ValueError."""
+        with pytest.raises(ValueError):
+            isbn_10_to_13("ABCDEFGHIJ")
+
     @pytest.mark.parametrize(
         "isbn13,expected_isbn10",
         [
@@ -249,6 +263,11 @@ class TestISBNConversion:
         """Invalid ISBN-13 length should return None."""
         assert isbn_13_to_10("12345") is None
 
+    def test_isbn_13_to_10_non_numeric(self):
+        """ISBN-13 with non-digit characters should raise ValueError."""
+        with pytest.raises(ValueError):
+            isbn_13_to_10("978ABCDEFGHIJ")
+
     def test_roundtrip_conversion(self):
         """Converting ISBN-10 -> 13 -> 10 should return original."""
         original = "0134093410"
@@ -0,0 +1,34 @@
+"""Tests for database base utilities."""
+
+from __future__ import annotations
+
+import time
+
+from consearch.db.base import uuid7
+
+# ============================================================================
+# UUIDv7 Tests
+# ============================================================================
+
+
+class TestUUID7:
+    """Tests for time-ordered primary keys."""
+
+    def test_version_and_variant(self):
+        """Generated IDs should be RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_ordered_across_milliseconds(self):
+        """IDs from later milliseconds should sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+
+    def test_unique(self):
+        """IDs generated in the same millisecond should still be unique."""
+        assert len({uuid7() for _ in range(1000)}) == 1000
@@ -113,14 +113,14 @@ class TestGoogleBooksResolverConfig:
 class TestGoogleBooksISBNSearch:
     """Tests for ISBN search functionality."""
 
-    @respx.mock
     async def test_isbn13_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
         isbn_response_data: dict,
     ):
         """Successful ISBN-13 lookup should return book record."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -136,10 +136,11 @@ class TestGoogleBooksISBNSearch:
         assert record.identifiers.isbn_13 == "9780134093413"
         assert record.identifiers.google_books_id == "hjEFCAAAQBAJ"
 
-    @respx.mock
-    async def test_isbn_query_format(self, resolver: GoogleBooksResolver):
+    async def test_isbn_query_format(
+        self, respx_mock: respx.MockRouter, resolver: GoogleBooksResolver
+    ):
         """ISBN search should use isbn: query prefix."""
-        route = respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        route = respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json={"totalItems": 0})
         )
 
@@ -150,14 +151,14 @@ class TestGoogleBooksISBNSearch:
         url = str(route.calls[0].request.url)
         assert "isbn:" in url or "isbn%3A" in url
 
-    @respx.mock
     async def test_isbn_not_found(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
         empty_response_data: dict,
     ):
         """ISBN not found should return NOT_FOUND status."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=empty_response_data)
         )
 
@@ -167,13 +168,13 @@ class TestGoogleBooksISBNSearch:
         assert result.status == ResolutionStatus.NOT_FOUND
         assert len(result.records) == 0
 
-    @respx.mock
     async def test_api_key_included(
         self,
+        respx_mock: respx.MockRouter,
         resolver_with_key: GoogleBooksResolver,
     ):
         """Request should include API key when provided."""
-        route = respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        route = respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json={"totalItems": 0})
         )
 
@@ -193,14 +194,14 @@ class TestGoogleBooksISBNSearch:
 class TestGoogleBooksTitleSearch:
     """Tests for title search functionality."""
 
-    @respx.mock
     async def test_title_search_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
         isbn_response_data: dict,
     ):
         """Successful title search should return book records."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -209,14 +210,14 @@ class TestGoogleBooksTitleSearch:
         assert result.status == ResolutionStatus.SUCCESS
         assert len(result.records) >= 1
 
-    @respx.mock
     async def test_title_search_with_author(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
         isbn_response_data: dict,
     ):
         """Title search with author should use intitle: and inauthor: queries."""
-        route = respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        route = respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -227,14 +228,14 @@ class TestGoogleBooksTitleSearch:
         url = str(route.calls[0].request.url)
         assert "inauthor" in url.lower() or "inauthor%3A" in url
 
-    @respx.mock
     async def test_title_search_no_results(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
         empty_response_data: dict,
     ):
         """Title search with no results should return NOT_FOUND."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=empty_response_data)
         )
 
@@ -251,14 +252,14 @@ class TestGoogleBooksTitleSearch:
 class TestGoogleBooksRecordParsing:
     """Tests for parsing Google Books response data."""
 
-    @respx.mock
     async def test_parses_all_fields(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
         isbn_response_data: dict,
     ):
         """All available fields should be parsed correctly."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -278,8 +279,9 @@ class TestGoogleBooksRecordParsing:
         assert record.identifiers.isbn_13 == "9780134093413"
         assert record.identifiers.google_books_id == "hjEFCAAAQBAJ"
 
-    @respx.mock
-    async def test_handles_missing_fields(self, resolver: GoogleBooksResolver):
+    async def test_handles_missing_fields(
+        self, respx_mock: respx.MockRouter, resolver: GoogleBooksResolver
+    ):
         """Missing fields should be handled gracefully."""
         minimal_data = {
             "kind": "books#volumes",
@@ -293,7 +295,7 @@ class TestGoogleBooksRecordParsing:
                 }
             ],
         }
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=minimal_data)
         )
 
@@ -306,14 +308,14 @@ class TestGoogleBooksRecordParsing:
         assert record.year is None
         assert record.publisher is None
 
-    @respx.mock
     async def test_image_url_extraction(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
         isbn_response_data: dict,
     ):
         """Cover image URL should be extracted from imageLinks."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -324,14 +326,14 @@ class TestGoogleBooksRecordParsing:
         assert record.cover_image_url is not None
         assert "books.google.com" in record.cover_image_url
 
-    @respx.mock
     async def test_source_metadata_included(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
         isbn_response_data: dict,
     ):
         """Source metadata should be included in record."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -351,9 +353,9 @@ class TestGoogleBooksRecordParsing:
 class TestGoogleBooksFetchById:
     """Tests for fetch_by_id method."""
 
-    @respx.mock
     async def test_fetch_by_id_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: GoogleBooksResolver,
     ):
         """fetch_by_id should return book record."""
@@ -363,7 +365,7 @@ class TestGoogleBooksFetchById:
                 "title": "Clean Code",
             },
         }
-        respx.get("https://www.googleapis.com/books/v1/volumes/hjEFCAAAQBAJ").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes/hjEFCAAAQBAJ").mock(
             return_value=Response(200, json=volume_data)
         )
 
@@ -372,10 +374,11 @@ class TestGoogleBooksFetchById:
         assert record is not None
         assert record.title == "Clean Code"
 
-    @respx.mock
-    async def test_fetch_by_id_not_found(self, resolver: GoogleBooksResolver):
+    async def test_fetch_by_id_not_found(
+        self, respx_mock: respx.MockRouter, resolver: GoogleBooksResolver
+    ):
         """fetch_by_id with invalid ID should return None."""
-        respx.get("https://www.googleapis.com/books/v1/volumes/invalid").mock(
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes/invalid").mock(
             return_value=Response(404)
         )
 
@@ -392,10 +395,11 @@ class TestGoogleBooksFetchById:
 class TestGoogleBooksErrorHandling:
     """Tests for error handling."""
 
-    @respx.mock
-    async def test_server_error(self, resolver: GoogleBooksResolver):
+    async def test_server_error(self, respx_mock: respx.MockRouter, resolver: GoogleBooksResolver):
         """Server error should return ERROR status."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(return_value=Response(500))
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
+            return_value=Response(500)
+        )
 
         isbn = ISBN.parse("9780134093413")
         result = await resolver.search_by_isbn(isbn)
@@ -403,10 +407,13 @@ class TestGoogleBooksErrorHandling:
         assert result.status == ResolutionStatus.ERROR
         assert result.error_message is not None
 
-    @respx.mock
-    async def test_rate_limit_error(self, resolver_no_retry: GoogleBooksResolver):
+    async def test_rate_limit_error(
+        self, respx_mock: respx.MockRouter, resolver_no_retry: GoogleBooksResolver
+    ):
         """Rate limit error should be handled."""
-        respx.get("https://www.googleapis.com/books/v1/volumes").mock(return_value=Response(429))
+        respx_mock.get("https://www.googleapis.com/books/v1/volumes").mock(
+            return_value=Response(429)
+        )
 
         isbn = ISBN.parse("9780134093413")
         result = await resolver_no_retry.search_by_isbn(isbn)
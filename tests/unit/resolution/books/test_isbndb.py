@@ -111,14 +111,14 @@ class TestISBNDbResolverConfig:
 class TestISBNDbISBNSearch:
     """Tests for ISBN search functionality."""
 
-    @respx.mock
     async def test_isbn13_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: ISBNDbResolver,
         isbn_response_data: dict,
     ):
         """Successful ISBN-13 lookup should return book record."""
-        respx.get("https://api2.isbndb.com/book/9780134093413").mock(
+        respx_mock.get("https://api2.isbndb.com/book/9780134093413").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -135,10 +135,9 @@ class TestISBNDbISBNSearch:
         assert record.publisher == "Prentice Hall"
         assert record.pages == 464
 
-    @respx.mock
-    async def test_isbn_not_found(self, resolver: ISBNDbResolver):
+    async def test_isbn_not_found(self, respx_mock: respx.MockRouter, resolver: ISBNDbResolver):
         """ISBN not found should return NOT_FOUND status."""
-        respx.get("https://api2.isbndb.com/book/9780000000002").mock(
+        respx_mock.get("https://api2.isbndb.com/book/9780000000002").mock(
             return_value=Response(404, json={"message": "Not found"})
         )
 
@@ -148,10 +147,11 @@ class TestISBNDbISBNSearch:
         assert result.status == ResolutionStatus.NOT_FOUND
         assert len(result.records) == 0
 
-    @respx.mock
-    async def test_authorization_header(self, resolver: ISBNDbResolver):
+    async def test_authorization_header(
+        self, respx_mock: respx.MockRouter, resolver: ISBNDbResolver
+    ):
         """Request should include Authorization header with API key."""
-        route = respx.get("https://api2.isbndb.com/book/9780134093413").mock(
+        route = respx_mock.get("https://api2.isbndb.com/book/9780134093413").mock(
             return_value=Response(200, json={"book": {"title": "Test"}})
         )
 
@@ -162,10 +162,11 @@ class TestISBNDbISBNSearch:
         assert "Authorization" in route.calls[0].request.headers
         assert route.calls[0].request.headers["Authorization"] == "test-api-key"
 
-    @respx.mock
-    async def test_rate_limit_error(self, resolver_no_retry: ISBNDbResolver):
+    async def test_rate_limit_error(
+        self, respx_mock: respx.MockRouter, resolver_no_retry: ISBNDbResolver
+    ):
         """Rate limit error should be handled."""
-        respx.get("https://api2.isbndb.com/book/9780134093413").mock(
+        respx_mock.get("https://api2.isbndb.com/book/9780134093413").mock(
             return_value=Response(429, headers={"Retry-After": "60"})
         )
 
@@ -183,14 +184,14 @@ class TestISBNDbISBNSearch:
 class TestISBNDbTitleSearch:
     """Tests for title search functionality."""
 
-    @respx.mock
     async def test_title_search_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: ISBNDbResolver,
         search_response_data: dict,
     ):
         """Successful title search should return book records."""
-        respx.get("https://api2.isbndb.com/books/Clean%20Code").mock(
+        respx_mock.get("https://api2.isbndb.com/books/Clean%20Code").mock(
             return_value=Response(200, json=search_response_data)
         )
 
@@ -199,10 +200,11 @@ class TestISBNDbTitleSearch:
         assert result.status == ResolutionStatus.SUCCESS
         assert len(result.records) >= 1
 
-    @respx.mock
-    async def test_title_search_no_results(self, resolver: ISBNDbResolver):
+    async def test_title_search_no_results(
+        self, respx_mock: respx.MockRouter, resolver: ISBNDbResolver
+    ):
         """Title search with no results should return NOT_FOUND."""
-        respx.get("https://api2.isbndb.com/books/Nonexistent").mock(
+        respx_mock.get("https://api2.isbndb.com/books/Nonexistent").mock(
             return_value=Response(200, json={"total": 0, "books": []})
         )
 
@@ -220,14 +222,14 @@ class TestISBNDbTitleSearch:
 class TestISBNDbRecordParsing:
     """Tests for parsing ISBNdb response data."""
 
-    @respx.mock
     async def test_parses_all_fields(
         self,
+        respx_mock: respx.MockRouter,
         resolver: ISBNDbResolver,
         isbn_response_data: dict,
     ):
         """All available fields should be parsed correctly."""
-        respx.get("https://api2.isbndb.com/book/9780134093413").mock(
+        respx_mock.get("https://api2.isbndb.com/book/9780134093413").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -246,8 +248,9 @@ class TestISBNDbRecordParsing:
         assert record.abstract == "A handbook of agile software craftsmanship."
         assert "images.isbndb.com" in record.cover_image_url
 
-    @respx.mock
-    async def test_handles_missing_fields(self, resolver: ISBNDbResolver):
+    async def test_handles_missing_fields(
+        self, respx_mock: respx.MockRouter, resolver: ISBNDbResolver
+    ):
         """Missing fields should be handled gracefully."""
         minimal_data = {
             "book": {
@@ -255,7 +258,7 @@ class TestISBNDbRecordParsing:
                 "isbn13": "9780134093413",
             }
         }
-        respx.get("https://api2.isbndb.com/book/9780134093413").mock(
+        respx_mock.get("https://api2.isbndb.com/book/9780134093413").mock(
             return_value=Response(200, json=minimal_data)
         )
 
@@ -268,14 +271,14 @@ class TestISBNDbRecordParsing:
         assert record.year is None
         assert record.publisher is None
 
-    @respx.mock
     async def test_source_metadata_included(
         self,
+        respx_mock: respx.MockRouter,
         resolver: ISBNDbResolver,
         isbn_response_data: dict,
     ):
         """Source metadata should be included in record."""
-        respx.get("https://api2.isbndb.com/book/9780134093413").mock(
+        respx_mock.get("https://api2.isbndb.com/book/9780134093413").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -295,10 +298,11 @@ class TestISBNDbRecordParsing:
 class TestISBNDbErrorHandling:
     """Tests for error handling."""
 
-    @respx.mock
-    async def test_server_error(self, resolver: ISBNDbResolver):
+    async def test_server_error(self, respx_mock: respx.MockRouter, resolver: ISBNDbResolver):
         """Server error should return ERROR status."""
-        respx.get("https://api2.isbndb.com/book/9780134093413").mock(return_value=Response(500))
+        respx_mock.get("https://api2.isbndb.com/book/9780134093413").mock(
+            return_value=Response(500)
+        )
 
         isbn = ISBN.parse("9780134093413")
         result = await resolver.search_by_isbn(isbn)
@@ -306,10 +310,9 @@ class TestISBNDbErrorHandling:
         assert result.status == ResolutionStatus.ERROR
         assert result.error_message is not None
 
-    @respx.mock
-    async def test_unauthorized_error(self, resolver: ISBNDbResolver):
+    async def test_unauthorized_error(self, respx_mock: respx.MockRouter, resolver: ISBNDbResolver):
         """Unauthorized error should return ERROR status."""
-        respx.get("https://api2.isbndb.com/book/9780134093413").mock(
+        respx_mock.get("https://api2.isbndb.com/book/9780134093413").mock(
             return_value=Response(401, json={"message": "Unauthorized"})
         )
 
@@ -102,14 +102,14 @@ class TestOpenLibraryResolverConfig:
 class TestOpenLibraryISBNSearch:
     """Tests for ISBN search functionality."""
 
-    @respx.mock
     async def test_isbn13_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         isbn_response_data: dict,
     ):
         """Successful ISBN-13 lookup should return book record."""
-        respx.get("https://openlibrary.org/isbn/9780134093413.json").mock(
+        respx_mock.get("https://openlibrary.org/isbn/9780134093413.json").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -124,14 +124,14 @@ class TestOpenLibraryISBNSearch:
         assert "Clean Code" in record.title
         assert record.identifiers.isbn_13 == "9780134093413"
 
-    @respx.mock
     async def test_isbn10_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         isbn_response_data: dict,
     ):
         """Successful ISBN-10 lookup should return book record."""
-        respx.get("https://openlibrary.org/isbn/9780134093413.json").mock(
+        respx_mock.get("https://openlibrary.org/isbn/9780134093413.json").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -141,10 +141,11 @@ class TestOpenLibraryISBNSearch:
         assert result.status == ResolutionStatus.SUCCESS
         assert len(result.records) == 1
 
-    @respx.mock
-    async def test_isbn_not_found(self, resolver: OpenLibraryResolver):
+    async def test_isbn_not_found(
+        self, respx_mock: respx.MockRouter, resolver: OpenLibraryResolver
+    ):
         """ISBN not found should return NOT_FOUND status."""
-        respx.get("https://openlibrary.org/isbn/9780000000002.json").mock(
+        respx_mock.get("https://openlibrary.org/isbn/9780000000002.json").mock(
             return_value=Response(404)
         )
 
@@ -154,10 +155,11 @@ class TestOpenLibraryISBNSearch:
         assert result.status == ResolutionStatus.NOT_FOUND
         assert len(result.records) == 0
 
-    @respx.mock
-    async def test_isbn_server_error(self, resolver: OpenLibraryResolver):
+    async def test_isbn_server_error(
+        self, respx_mock: respx.MockRouter, resolver: OpenLibraryResolver
+    ):
         """Server error should return ERROR status."""
-        respx.get("https://openlibrary.org/isbn/9780134093413.json").mock(
+        respx_mock.get("https://openlibrary.org/isbn/9780134093413.json").mock(
             return_value=Response(500)
         )
 
@@ -176,14 +178,14 @@ class TestOpenLibraryISBNSearch:
 class TestOpenLibraryTitleSearch:
     """Tests for title search functionality."""
 
-    @respx.mock
     async def test_title_search_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         search_response_data: dict,
     ):
         """Successful title search should return book records."""
-        respx.get("https://openlibrary.org/search.json").mock(
+        respx_mock.get("https://openlibrary.org/search.json").mock(
             return_value=Response(200, json=search_response_data)
         )
 
@@ -193,14 +195,14 @@ class TestOpenLibraryTitleSearch:
         assert len(result.records) >= 1
         assert result.source == SourceName.OPEN_LIBRARY
 
-    @respx.mock
     async def test_title_search_with_author(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         search_response_data: dict,
     ):
         """Title search with author should include author in request."""
-        route = respx.get("https://openlibrary.org/search.json").mock(
+        route = respx_mock.get("https://openlibrary.org/search.json").mock(
             return_value=Response(200, json=search_response_data)
         )
 
@@ -210,10 +212,11 @@ class TestOpenLibraryTitleSearch:
         # Verify author was passed in params
         assert "author" in str(route.calls[0].request.url)
 
-    @respx.mock
-    async def test_title_search_no_results(self, resolver: OpenLibraryResolver):
+    async def test_title_search_no_results(
+        self, respx_mock: respx.MockRouter, resolver: OpenLibraryResolver
+    ):
         """Title search with no results should return NOT_FOUND."""
-        respx.get("https://openlibrary.org/search.json").mock(
+        respx_mock.get("https://openlibrary.org/search.json").mock(
             return_value=Response(200, json={"numFound": 0, "docs": []})
         )
 
@@ -231,14 +234,14 @@ class TestOpenLibraryTitleSearch:
 class TestOpenLibraryResolve:
     """Tests for the resolve method."""
 
-    @respx.mock
     async def test_resolve_isbn13(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         isbn_response_data: dict,
     ):
         """resolve() with ISBN-13 should call search_by_isbn."""
-        respx.get("https://openlibrary.org/isbn/9780134093413.json").mock(
+        respx_mock.get("https://openlibrary.org/isbn/9780134093413.json").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -247,14 +250,14 @@ class TestOpenLibraryResolve:
         assert result.status == ResolutionStatus.SUCCESS
         assert result.records[0].identifiers.isbn_13 == "9780134093413"
 
-    @respx.mock
     async def test_resolve_title(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         search_response_data: dict,
     ):
         """resolve() with TITLE should call search_by_title."""
-        respx.get("https://openlibrary.org/search.json").mock(
+        respx_mock.get("https://openlibrary.org/search.json").mock(
             return_value=Response(200, json=search_response_data)
         )
 
@@ -271,14 +274,14 @@ class TestOpenLibraryResolve:
 class TestOpenLibraryRecordParsing:
     """Tests for parsing OpenLibrary response data."""
 
-    @respx.mock
     async def test_parses_all_fields(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         isbn_response_data: dict,
     ):
         """All available fields should be parsed correctly."""
-        respx.get("https://openlibrary.org/isbn/9780134093413.json").mock(
+        respx_mock.get("https://openlibrary.org/isbn/9780134093413.json").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -296,14 +299,15 @@ class TestOpenLibraryRecordParsing:
         assert record.cover_image_url is not None
         assert "8090614" in record.cover_image_url
 
-    @respx.mock
-    async def test_handles_missing_fields(self, resolver: OpenLibraryResolver):
+    async def test_handles_missing_fields(
+        self, respx_mock: respx.MockRouter, resolver: OpenLibraryResolver
+    ):
         """Missing fields should be handled gracefully."""
         minimal_data = {
             "key": "/books/OL12345M",
             "title": "Minimal Book",
         }
-        respx.get("https://openlibrary.org/isbn/9780134093413.json").mock(
+        respx_mock.get("https://openlibrary.org/isbn/9780134093413.json").mock(
             return_value=Response(200, json=minimal_data)
         )
 
@@ -317,14 +321,14 @@ class TestOpenLibraryRecordParsing:
         assert record.publisher is None
         assert record.pages is None
 
-    @respx.mock
     async def test_source_metadata_included(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         isbn_response_data: dict,
     ):
         """Source metadata should be included in record."""
-        respx.get("https://openlibrary.org/isbn/9780134093413.json").mock(
+        respx_mock.get("https://openlibrary.org/isbn/9780134093413.json").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -345,14 +349,14 @@ class TestOpenLibraryRecordParsing:
 class TestOpenLibraryFetchById:
     """Tests for fetch_by_id method."""
 
-    @respx.mock
     async def test_fetch_by_id_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: OpenLibraryResolver,
         isbn_response_data: dict,
     ):
         """fetch_by_id should return book record."""
-        respx.get("https://openlibrary.org/books/OL12345M.json").mock(
+        respx_mock.get("https://openlibrary.org/books/OL12345M.json").mock(
             return_value=Response(200, json=isbn_response_data)
         )
 
@@ -361,10 +365,13 @@ class TestOpenLibraryFetchById:
         assert record is not None
         assert "Clean Code" in record.title
 
-    @respx.mock
-    async def test_fetch_by_id_not_found(self, resolver: OpenLibraryResolver):
+    async def test_fetch_by_id_not_found(
+        self, respx_mock: respx.MockRouter, resolver: OpenLibraryResolver
+    ):
         """fetch_by_id with invalid ID should return None."""
-        respx.get("https://openlibrary.org/books/OL99999M.json").mock(return_value=Response(404))
+        respx_mock.get("https://openlibrary.org/books/OL99999M.json").mock(
+            return_value=Response(404)
+        )
 
         record = await resolver.fetch_by_id("/books/OL99999M")
 
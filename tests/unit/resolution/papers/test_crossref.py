@@ -121,14 +121,14 @@ class TestCrossrefResolverConfig:
 class TestCrossrefDOILookup:
     """Tests for DOI lookup functionality."""
 
-    @respx.mock
     async def test_doi_lookup_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: CrossrefResolver,
         doi_response_data: dict,
     ):
         """Successful DOI lookup should return paper record."""
-        respx.get("https://api.crossref.org/works/10.1038/nature12373").mock(
+        respx_mock.get("https://api.crossref.org/works/10.1038/nature12373").mock(
             return_value=Response(200, json=doi_response_data)
         )
 
@@ -145,10 +145,9 @@ class TestCrossrefDOILookup:
         assert record.journal == "Nature"
         assert record.citation_count == 1500
 
-    @respx.mock
-    async def test_doi_not_found(self, resolver: CrossrefResolver):
+    async def test_doi_not_found(self, respx_mock: respx.MockRouter, resolver: CrossrefResolver):
         """DOI not found should return NOT_FOUND status."""
-        respx.get("https://api.crossref.org/works/10.0000/notfound").mock(
+        respx_mock.get("https://api.crossref.org/works/10.0000/notfound").mock(
             return_value=Response(404)
         )
 
@@ -158,13 +157,13 @@ class TestCrossrefDOILookup:
         assert result.status == ResolutionStatus.NOT_FOUND
         assert len(result.records) == 0
 
-    @respx.mock
     async def test_mailto_header_included(
         self,
+        respx_mock: respx.MockRouter,
         resolver_with_email: CrossrefResolver,
     ):
         """Request should include mailto for polite pool."""
-        route = respx.get("https://api.crossref.org/works/10.1038/nature12373").mock(
+        route = respx_mock.get("https://api.crossref.org/works/10.1038/nature12373").mock(
             return_value=Response(200, json={"status": "ok", "message": {"title": ["Test"]}})
         )
 
@@ -186,14 +185,14 @@ class TestCrossrefDOILookup:
 class TestCrossrefTitleSearch:
     """Tests for title search functionality."""
 
-    @respx.mock
     async def test_title_search_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: CrossrefResolver,
         search_response_data: dict,
     ):
         """Successful title search should return paper records."""
-        respx.get("https://api.crossref.org/works").mock(
+        respx_mock.get("https://api.crossref.org/works").mock(
             return_value=Response(200, json=search_response_data)
         )
 
@@ -202,10 +201,11 @@ class TestCrossrefTitleSearch:
         assert result.status == ResolutionStatus.SUCCESS
         assert len(result.records) >= 1
 
-    @respx.mock
-    async def test_title_search_no_results(self, resolver: CrossrefResolver):
+    async def test_title_search_no_results(
+        self, respx_mock: respx.MockRouter, resolver: CrossrefResolver
+    ):
         """Title search with no results should return NOT_FOUND."""
-        respx.get("https://api.crossref.org/works").mock(
+        respx_mock.get("https://api.crossref.org/works").mock(
             return_value=Response(
                 200,
                 json={
@@ -228,14 +228,14 @@ class TestCrossrefTitleSearch:
 class TestCrossrefRecordParsing:
     """Tests for parsing Crossref response data."""
 
-    @respx.mock
     async def test_parses_all_fields(
         self,
+        respx_mock: respx.MockRouter,
         resolver: CrossrefResolver,
         doi_response_data: dict,
     ):
         """All available fields should be parsed correctly."""
-        respx.get("https://api.crossref.org/works/10.1038/nature12373").mock(
+        respx_mock.get("https://api.crossref.org/works/10.1038/nature12373").mock(
             return_value=Response(200, json=doi_response_data)
         )
 
@@ -259,8 +259,9 @@ class TestCrossrefRecordParsing:
         assert record.authors[0].given_name == "Elizabeth"
         assert record.authors[0].family_name == "Pennisi"
 
-    @respx.mock
-    async def test_handles_missing_fields(self, resolver: CrossrefResolver):
+    async def test_handles_missing_fields(
+        self, respx_mock: respx.MockRouter, resolver: CrossrefResolver
+    ):
         """Missing fields should be handled gracefully."""
         minimal_data = {
             "status": "ok",
@@ -269,7 +270,7 @@ class TestCrossrefRecordParsing:
                 "title": ["Minimal Paper"],
             },
         }
-        respx.get("https://api.crossref.org/works/10.1038/test").mock(
+        respx_mock.get("https://api.crossref.org/works/10.1038/test").mock(
             return_value=Response(200, json=minimal_data)
         )
 
@@ -282,9 +283,9 @@ class TestCrossrefRecordParsing:
         assert record.year is None
         assert record.journal is None
 
-    @respx.mock
     async def test_strips_jats_tags_from_abstract(
         self,
+        respx_mock: respx.MockRouter,
         resolver: CrossrefResolver,
     ):
         """JATS XML tags should be stripped from abstract."""
@@ -296,7 +297,7 @@ class TestCrossrefRecordParsing:
                 "abstract": "<jats:p>Clean abstract text.</jats:p>",
             },
         }
-        respx.get("https://api.crossref.org/works/10.1038/test").mock(
+        respx_mock.get("https://api.crossref.org/works/10.1038/test").mock(
             return_value=Response(200, json=data)
         )
 
@@ -307,14 +308,14 @@ class TestCrossrefRecordParsing:
         assert "<jats" not in record.abstract
         assert "Clean abstract text" in record.abstract
 
-    @respx.mock
     async def test_source_metadata_included(
         self,
+        respx_mock: respx.MockRouter,
         resolver: CrossrefResolver,
         doi_response_data: dict,
     ):
         """Source metadata should be included in record."""
-        respx.get("https://api.crossref.org/works/10.1038/nature12373").mock(
+        respx_mock.get("https://api.crossref.org/works/10.1038/nature12373").mock(
             return_value=Response(200, json=doi_response_data)
         )
 
@@ -334,10 +335,11 @@ class TestCrossrefRecordParsing:
 class TestCrossrefErrorHandling:
     """Tests for error handling."""
 
-    @respx.mock
-    async def test_server_error(self, resolver: CrossrefResolver):
+    async def test_server_error(self, respx_mock: respx.MockRouter, resolver: CrossrefResolver):
         """Server error should return ERROR status."""
-        respx.get("https://api.crossref.org/works/10.1038/test").mock(return_value=Response(500))
+        respx_mock.get("https://api.crossref.org/works/10.1038/test").mock(
+            return_value=Response(500)
+        )
 
         doi = DOI(value="10.1038/test")
         result = await resolver.search_by_doi(doi)
@@ -345,10 +347,11 @@ class TestCrossrefErrorHandling:
         assert result.status == ResolutionStatus.ERROR
         assert result.error_message is not None
 
-    @respx.mock
-    async def test_rate_limit_error(self, resolver_no_retry: CrossrefResolver):
+    async def test_rate_limit_error(
+        self, respx_mock: respx.MockRouter, resolver_no_retry: CrossrefResolver
+    ):
         """Rate limit error should be handled."""
-        respx.get("https://api.crossref.org/works/10.1038/test").mock(
+        respx_mock.get("https://api.crossref.org/works/10.1038/test").mock(
             return_value=Response(429, headers={"Retry-After": "60"})
         )
 
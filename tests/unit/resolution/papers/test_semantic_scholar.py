@@ -119,17 +119,17 @@ class TestSemanticScholarResolverConfig:
 class TestSemanticScholarDOILookup:
     """Tests for DOI lookup functionality."""
 
-    @respx.mock
     async def test_doi_lookup_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: SemanticScholarResolver,
         paper_response_data: dict,
     ):
         """Successful DOI lookup should return paper record."""
         # Note: Semantic Scholar uses DOI: prefix
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/nature12373").mock(
-            return_value=Response(200, json=paper_response_data)
-        )
+        respx_mock.get(
+            "https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/nature12373"
+        ).mock(return_value=Response(200, json=paper_response_data))
 
         doi = DOI(value="10.1038/nature12373")
         result = await resolver.search_by_doi(doi)
@@ -144,10 +144,11 @@ class TestSemanticScholarDOILookup:
         assert record.identifiers.semantic_scholar_id == "abc123def456"
         assert record.citation_count == 1500
 
-    @respx.mock
-    async def test_doi_not_found(self, resolver: SemanticScholarResolver):
+    async def test_doi_not_found(
+        self, respx_mock: respx.MockRouter, resolver: SemanticScholarResolver
+    ):
         """DOI not found should return NOT_FOUND status."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.0000/notfound").mock(
+        respx_mock.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.0000/notfound").mock(
             return_value=Response(404)
         )
 
@@ -156,15 +157,15 @@ class TestSemanticScholarDOILookup:
 
         assert result.status == ResolutionStatus.NOT_FOUND
 
-    @respx.mock
     async def test_api_key_header_included(
         self,
+        respx_mock: respx.MockRouter,
         resolver_with_key: SemanticScholarResolver,
     ):
         """Request should include x-api-key header when provided."""
-        route = respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test").mock(
-            return_value=Response(200, json={"paperId": "test", "title": "Test"})
-        )
+        route = respx_mock.get(
+            "https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test"
+        ).mock(return_value=Response(200, json={"paperId": "test", "title": "Test"}))
 
         doi = DOI(value="10.1038/test")
         await resolver_with_key.search_by_doi(doi)
@@ -183,14 +184,14 @@ class TestSemanticScholarDOILookup:
 class TestSemanticScholarArXivLookup:
     """Tests for arXiv ID lookup functionality."""
 
-    @respx.mock
     async def test_arxiv_lookup_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: SemanticScholarResolver,
         paper_response_data: dict,
     ):
         """Successful arXiv lookup should return paper record."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/arXiv:1234.56789").mock(
+        respx_mock.get("https://api.semanticscholar.org/graph/v1/paper/arXiv:1234.56789").mock(
             return_value=Response(200, json=paper_response_data)
         )
 
@@ -200,14 +201,14 @@ class TestSemanticScholarArXivLookup:
         assert result.status == ResolutionStatus.SUCCESS
         assert len(result.records) == 1
 
-    @respx.mock
     async def test_arxiv_old_format(
         self,
+        respx_mock: respx.MockRouter,
         resolver: SemanticScholarResolver,
         paper_response_data: dict,
     ):
         """Old arXiv format should work."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/arXiv:hep-th/9901001").mock(
+        respx_mock.get("https://api.semanticscholar.org/graph/v1/paper/arXiv:hep-th/9901001").mock(
             return_value=Response(200, json=paper_response_data)
         )
 
@@ -225,14 +226,14 @@ class TestSemanticScholarArXivLookup:
 class TestSemanticScholarTitleSearch:
     """Tests for title search functionality."""
 
-    @respx.mock
     async def test_title_search_success(
         self,
+        respx_mock: respx.MockRouter,
         resolver: SemanticScholarResolver,
         search_response_data: dict,
     ):
         """Successful title search should return paper records."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/search").mock(
+        respx_mock.get("https://api.semanticscholar.org/graph/v1/paper/search").mock(
             return_value=Response(200, json=search_response_data)
         )
 
@@ -241,10 +242,11 @@ class TestSemanticScholarTitleSearch:
         assert result.status == ResolutionStatus.SUCCESS
         assert len(result.records) >= 1
 
-    @respx.mock
-    async def test_title_search_no_results(self, resolver: SemanticScholarResolver):
+    async def test_title_search_no_results(
+        self, respx_mock: respx.MockRouter, resolver: SemanticScholarResolver
+    ):
         """Title search with no results should return NOT_FOUND."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/search").mock(
+        respx_mock.get("https://api.semanticscholar.org/graph/v1/paper/search").mock(
             return_value=Response(200, json={"total": 0, "data": []})
         )
 
@@ -261,16 +263,16 @@ class TestSemanticScholarTitleSearch:
 class TestSemanticScholarRecordParsing:
     """Tests for parsing Semantic Scholar response data."""
 
-    @respx.mock
     async def test_parses_all_fields(
         self,
+        respx_mock: respx.MockRouter,
         resolver: SemanticScholarResolver,
         paper_response_data: dict,
     ):
         """All available fields should be parsed correctly."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/nature12373").mock(
-            return_value=Response(200, json=paper_response_data)
-        )
+        respx_mock.get(
+            "https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/nature12373"
+        ).mock(return_value=Response(200, json=paper_response_data))
 
         doi = DOI(value="10.1038/nature12373")
         result = await resolver.search_by_doi(doi)
@@ -292,14 +294,15 @@ class TestSemanticScholarRecordParsing:
         assert len(record.authors) == 1
         assert record.authors[0].name == "Elizabeth Pennisi"
 
-    @respx.mock
-    async def test_handles_missing_fields(self, resolver: SemanticScholarResolver):
+    async def test_handles_missing_fields(
+        self, respx_mock: respx.MockRouter, resolver: SemanticScholarResolver
+    ):
         """Missing fields should be handled gracefully."""
         minimal_data = {
             "paperId": "test123",
             "title": "Minimal Paper",
         }
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test").mock(
+        respx_mock.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test").mock(
             return_value=Response(200, json=minimal_data)
         )
 
@@ -313,16 +316,16 @@ class TestSemanticScholarRecordParsing:
         assert record.journal is None
         assert record.pdf_url is None
 
-    @respx.mock
     async def test_source_metadata_included(
         self,
+        respx_mock: respx.MockRouter,
         resolver: SemanticScholarResolver,
         paper_response_data: dict,
     ):
         """Source metadata should be included in record."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/nature12373").mock(
-            return_value=Response(200, json=paper_response_data)
-        )
+        respx_mock.get(
+            "https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/nature12373"
+        ).mock(return_value=Response(200, json=paper_response_data))
 
         doi = DOI(value="10.1038/nature12373")
         result = await resolver.search_by_doi(doi)
@@ -340,12 +343,13 @@ class TestSemanticScholarRecordParsing:
 class TestSemanticScholarFieldsParameter:
     """Tests for fields parameter in API requests."""
 
-    @respx.mock
-    async def test_fields_parameter_included(self, resolver: SemanticScholarResolver):
+    async def test_fields_parameter_included(
+        self, respx_mock: respx.MockRouter, resolver: SemanticScholarResolver
+    ):
         """Request should include fields parameter."""
-        route = respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test").mock(
-            return_value=Response(200, json={"paperId": "test", "title": "Test"})
-        )
+        route = respx_mock.get(
+            "https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test"
+        ).mock(return_value=Response(200, json={"paperId": "test", "title": "Test"}))
 
         doi = DOI(value="10.1038/test")
         await resolver.search_by_doi(doi)
@@ -363,10 +367,11 @@ class TestSemanticScholarFieldsParameter:
 class TestSemanticScholarErrorHandling:
     """Tests for error handling."""
 
-    @respx.mock
-    async def test_server_error(self, resolver: SemanticScholarResolver):
+    async def test_server_error(
+        self, respx_mock: respx.MockRouter, resolver: SemanticScholarResolver
+    ):
         """Server error should return ERROR status."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test").mock(
+        respx_mock.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test").mock(
             return_value=Response(500)
         )
 
@@ -376,10 +381,11 @@ class TestSemanticScholarErrorHandling:
         assert result.status == ResolutionStatus.ERROR
         assert result.error_message is not None
 
-    @respx.mock
-    async def test_rate_limit_error(self, resolver_no_retry: SemanticScholarResolver):
+    async def test_rate_limit_error(
+        self, respx_mock: respx.MockRouter, resolver_no_retry: SemanticScholarResolver
+    ):
         """Rate limit error should be handled."""
-        respx.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test").mock(
+        respx_mock.get("https://api.semanticscholar.org/graph/v1/paper/DOI:10.1038/test").mock(
             return_value=Response(429)
         )
 
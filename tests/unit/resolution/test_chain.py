@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import ClassVar
 from unittest.mock import AsyncMock
 
@@ -166,6 +167,44 @@ class TestAggregatedResult:
         )
         assert result.best_result == fallback_result
 
+    def test_dict_round_trip(self):
+        """to_dict/from_dict should preserve results and records."""
+        record = BookRecord(
+            title="Clean Code",
+            identifiers=Identifiers(isbn_13="9780134093413"),
+        )
+        result = AggregatedResult(
+            primary_result=ResolutionResult(
+                status=ResolutionStatus.NOT_FOUND,
+                source=SourceName.OPEN_LIBRARY,
+            ),
+            fallback_results=[
+                ResolutionResult(
+                    status=ResolutionStatus.SUCCESS,
+                    records=[record],
+                    source=SourceName.GOOGLE_BOOKS,
+                    duration_ms=12.5,
+                )
+            ],
+            all_records=[record],
+            sources_tried=["open_library", "google_books"],
+        )
+
+        restored = AggregatedResult.from_dict(result.to_dict(), BookRecord)
+
+        assert restored.success is True
+        assert restored.primary_result.status == ResolutionStatus.NOT_FOUND
+        assert restored.fallback_results[0].source == SourceName.GOOGLE_BOOKS
+        assert restored.fallback_results[0].duration_ms == 12.5
+        assert isinstance(restored.fallback_results[0].records[0], BookRecord)
+        assert restored.all_records == [record]
+        assert restored.sources_tried == ["open_library", "google_books"]
+
+    def test_to_dict_is_json_compatible(self):
+        """to_dict output should be serializable as JSON."""
+        result = AggregatedResult(all_records=[BookRecord(title="Test")])
+        assert json.loads(json.dumps(result.to_dict())) == result.to_dict()
+
 
 # ============================================================================
 # ChainResolver Tests
@@ -247,6 +286,20 @@ class TestChainResolver:
         # Both sources should be tried
         assert len(result.sources_tried) == 2
 
+    async def test_parallel_keeps_priority_order(self):
+        """Parallel execution should report results in priority order up to the first success."""
+        resolver1 = MockBookResolver(SourceName.ISBNDB, priority=10, should_succeed=False)
+        resolver2 = MockBookResolver(SourceName.GOOGLE_BOOKS, priority=50, should_succeed=True)
+        resolver3 = MockBookResolver(SourceName.OPEN_LIBRARY, priority=100, should_succeed=True)
+
+        config = FallbackConfig(parallel_execution=True)
+        chain = ChainResolver([resolver3, resolver2, resolver1], config)
+        result = await chain.resolve("test", InputType.TITLE)
+
+        assert result.success is True
+        assert result.sources_tried == ["isbndb", "google_books"]
+        assert result.fallback_results[0].source == SourceName.GOOGLE_BOOKS
+
     async def test_fallback_on_failure(self):
         """Failing primary should fall back to next resolver."""
         resolver1 = MockBookResolver(SourceName.ISBNDB, priority=10, should_succeed=False)
@@ -0,0 +1,127 @@
+"""Tests for the Meilisearch searcher."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from consearch.search.searcher import Searcher, SearchFilters
+
+
+@pytest.fixture
+def searcher() -> Searcher:
+    """Create a searcher without a live client."""
+    return Searcher(client=None)  # type: ignore[arg-type]
+
+
+# ============================================================================
+# Filter Expression Tests
+# ============================================================================
+
+
+class TestBuildFilterExpression:
+    """Tests for Meilisearch filter expression building."""
+
+    def test_no_filters(self, searcher: Searcher):
+        """Missing filters should produce no expression."""
+        assert searcher._build_filter_expression(None, index_type="book") is None
+
+    def test_empty_filters(self, searcher: Searcher):
+        """Filters with no values should produce no expression."""
+        assert searcher._build_filter_expression(SearchFilters(), index_type="book") is None
+
+    def test_closed_year_range_uses_to_syntax(self, searcher: Searcher):
+        """A closed year range should be a single range expression."""
+        filters = SearchFilters(year_min=2000, year_max=2020)
+        assert searcher._build_filter_expression(filters, index_type="book") == [
+            "year 2000 TO 2020"
+        ]
+
+    @pytest.mark.parametrize(
+        "filters,expected",
+        [
+            (SearchFilters(year_min=2000), ["year >= 2000"]),
+            (SearchFilters(year_max=2020), ["year <= 2020"]),
+        ],
+    )
+    def test_open_year_range(self, searcher: Searcher, filters: SearchFilters, expected: list):
+        """Open year ranges should use comparison operators."""
+        assert searcher._build_filter_expression(filters, index_type="paper") == expected
+
+    def test_language_only_for_books(self, searcher: Searcher):
+        """Language filter should only apply to the books index."""
+        filters = SearchFilters(language="en")
+        assert searcher._build_filter_expression(filters, index_type="book") == ['language = "en"']
+        assert searcher._build_filter_expression(filters, index_type="paper") is None
+
+    def test_journal_is_escaped(self, searcher: Searcher):
+        """Quotes in journal names should be escaped."""
+        filters = SearchFilters(journal='The "Best" Journal')
+        assert searcher._build_filter_expression(filters, index_type="paper") == [
+            'journal = "The \\"Best\\" Journal"'
+        ]
+
+    def test_returned_list_is_not_shared(self, searcher: Searcher):
+        """Mutating a returned expression list should not leak into the cache."""
+        filters = SearchFilters(year_min=2000, year_max=2020)
+        first = searcher._build_filter_expression(filters, index_type="book")
+        first.append("injected")
+        second = searcher._build_filter_expression(filters, index_type="book")
+        assert second == ["year 2000 TO 2020"]
+
+
+# ============================================================================
+# Result Parsing Tests
+# ============================================================================
+
+
+def _results(n_hits: int, total: int = 100) -> SimpleNamespace:
+    """Build a stand-in for Meilisearch SearchResults with ``n_hits`` hits."""
+    return SimpleNamespace(
+        hits=[{"id": str(uuid4()), "title": f"Book {i}"} for i in range(n_hits)],
+        estimated_total_hits=total,
+        processing_time_ms=1,
+    )
+
+
+class TestParseResults:
+    """Tests for parsing Meilisearch results fetched with one extra hit."""
+
+    def test_extra_hit_sets_has_more(self, searcher: Searcher):
+        """A page_size + 1 result should report more results and drop the extra hit."""
+        response = searcher._parse_results(_results(21), "query", page=1, page_size=20)
+
+        assert response.has_more is True
+        assert len(response.hits) == 20
+
+    def test_short_page_has_no_more(self, searcher: Searcher):
+        """A result with at most page_size hits is the last page."""
+        response = searcher._parse_results(_results(20), "query", page=3, page_size=20)
+
+        assert response.has_more is False
+        assert len(response.hits) == 20
+
+
+# ============================================================================
+# Result Container Tests
+# ============================================================================
+
+
+class TestSearchContainers:
+    """Tests for the search result dataclasses."""
+
+    def test_filters_are_immutable(self):
+        """SearchFilters should reject mutation."""
+        filters = SearchFilters(year_min=2000)
+        with pytest.raises(AttributeError):
+            filters.year_min = 2001  # type: ignore[misc]
+
+    def test_filters_are_hashable(self):
+        """Equal filters should hash equal."""
+        assert hash(SearchFilters(language="en")) == hash(SearchFilters(language="en"))
+
+    def test_containers_use_slots(self):
+        """Containers should not carry a per-instance __dict__."""
+        assert not hasattr(SearchFilters(), "__dict__")